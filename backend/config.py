@@ -11,11 +11,22 @@ class Settings(BaseSettings):
         "mongodb://localhost:27017"
     )
     DATABASE_NAME: str = os.getenv("DATABASE_NAME", "edulingua")
+    MONGO_MAX_POOL_SIZE: int = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+    MONGO_MIN_POOL_SIZE: int = int(os.getenv("MONGO_MIN_POOL_SIZE", "10"))
+    # Wire compression, in order of preference. zstd needs MongoDB 4.2+ and the
+    # zstandard package, snappy needs python-snappy; unavailable ones are skipped.
+    MONGO_COMPRESSORS: str = os.getenv("MONGO_COMPRESSORS", "zstd,snappy,zlib")
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "3000"))
+    # Server-side time limit (maxTimeMS) for the per-request read queries, so a
+    # slow query fails fast instead of holding a pooled connection
+    MONGO_QUERY_TIMEOUT_MS: int = int(os.getenv("MONGO_QUERY_TIMEOUT_MS", "2000"))
     
     # JWT
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Comma-separated usernames allowed to use operator endpoints (cache stats/export)
+    ADMIN_USERNAMES: str = os.getenv("ADMIN_USERNAMES", "")
     
     # API
     API_V1_PREFIX: str = ""
@@ -23,6 +34,10 @@ class Settings(BaseSettings):
         "CORS_ORIGINS",
         "http://localhost:5173,http://localhost:3000,http://127.0.0.1:5173"
     )
+    # Upper bound on submitted text, so oversized payloads never reach the models
+    MAX_TEXT_LENGTH: int = int(os.getenv("MAX_TEXT_LENGTH", "50000"))
+    # Tighter bound for /analyze, which runs every NLP stage on the full text
+    MAX_ANALYZE_LENGTH: int = int(os.getenv("MAX_ANALYZE_LENGTH", "5000"))
     
     # OpenAI API
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
@@ -31,6 +46,28 @@ class Settings(BaseSettings):
     
     # NLP Models
     SPACY_MODEL: str = "en_core_web_sm"
+    SBERT_MODEL: str = os.getenv("SBERT_MODEL", "all-MiniLM-L6-v2")
+    # Concurrent embedding forward passes; 1 keeps parallel endpoints from
+    # contending for the GPU (or oversubscribing torch's CPU threads)
+    MODEL_INFERENCE_CONCURRENCY: int = int(os.getenv("MODEL_INFERENCE_CONCURRENCY", "1"))
+    # int8 dynamic quantization of the shared embedding model (CPU only)
+    QUANTIZE_MODELS: bool = os.getenv("EDULINGUA_QUANTIZE", "0") == "1"
+    
+    # Worker processes for heavy inference (0 = run in the web process) and
+    # the CUDA devices they are pinned to, round-robin (e.g. "0,1")
+    INFERENCE_WORKERS: int = int(os.getenv("INFERENCE_WORKERS", "0"))
+    INFERENCE_DEVICES: str = os.getenv("INFERENCE_DEVICES", "")
+    
+    # SQLite file for generated content that outlives the process (challenges, drills)
+    DISK_CACHE_PATH: str = os.getenv("DISK_CACHE_PATH", "edulingua_cache.sqlite3")
+    
+    # Seconds the evaluation dashboard metrics are cached (dashboards poll them)
+    METRICS_CACHE_TTL: int = int(os.getenv("METRICS_CACHE_TTL", "30"))
+    # Seconds the XP leaderboard is cached
+    LEADERBOARD_CACHE_TTL: int = int(os.getenv("LEADERBOARD_CACHE_TTL", "15"))
+    
+    # Worker threads for blocking NLP/LLM calls made from async endpoints
+    WORKER_THREADS: int = int(os.getenv("WORKER_THREADS", str((os.cpu_count() or 1) * 2)))
     
     class Config:
         env_file = ".env"
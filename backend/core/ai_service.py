@@ -2,7 +2,7 @@
 AI Service Module - Integrates OpenAI-compatible API for enhanced responses.
 Uses OpenRouter or OpenAI-compatible API for intelligent text generation.
 """
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional
 import os
 import json
 
@@ -87,6 +87,45 @@ def generate_ai_response(prompt: str, system_prompt: Optional[str] = None, max_t
     
     return None
 
+def stream_ai_response(prompt: str, system_prompt: Optional[str] = None, max_tokens: int = 200, temperature: float = 0.7) -> Iterator[str]:
+    """
+    Stream an AI response token by token using OpenAI-compatible API.
+    
+    Args:
+        prompt: User's prompt/question
+        system_prompt: System instruction for the AI
+        max_tokens: Maximum tokens in response
+        temperature: Creativity level (0-1)
+    
+    Yields:
+        Text deltas as they arrive; yields nothing if unavailable
+    """
+    ai_client = get_client()
+    if not ai_client or not API_KEY:
+        return
+    
+    messages = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    messages.append({"role": "user", "content": prompt})
+    
+    try:
+        stream = ai_client.chat.completions.create(
+            model=MODEL,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True
+        )
+        
+        for event in stream:
+            if event.choices:
+                delta = event.choices[0].delta.content
+                if delta:
+                    yield delta
+    except Exception as e:
+        print(f"⚠️ Error streaming AI response: {e}")
+
 def enhance_chatbot_response(user_query: str, context: Optional[List[Dict]] = None) -> Optional[str]:
     """
     Enhance chatbot response using AI.
@@ -1,6 +1,9 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status, Security
 from fastapi.security import OAuth2PasswordBearer, HTTPAuthorizationCredentials, HTTPBearer
@@ -12,6 +15,16 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="user/login", auto_error=False)
 security = HTTPBearer(auto_error=False)
 
+# Signing key built once; jose would otherwise construct it on every encode/decode
+_jwt_key = jwk.construct(settings.SECRET_KEY, settings.ALGORITHM)
+
+# Usernames allowed to use operator endpoints
+_ADMIN_USERNAMES = frozenset(name.strip() for name in settings.ADMIN_USERNAMES.split(",") if name.strip())
+
+# bcrypt is deliberately slow; hashing runs on its own threads so it neither
+# blocks the event loop nor queues behind NLP work in the shared executor
+_kdf_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="edulingua-kdf")
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
     return pwd_context.verify(plain_password, hashed_password)
@@ -20,6 +33,24 @@ def get_password_hash(password: str) -> str:
     """Hash a password."""
     return pwd_context.hash(password)
 
+async def averify_password(plain_password: str, hashed_password: Optional[str]) -> bool:
+    """
+    Verify a password against its hash without blocking the event loop.
+    
+    With no hash (unknown user) a dummy verification of the same cost is run
+    and False is returned, so a miss takes as long as a wrong password.
+    """
+    loop = asyncio.get_running_loop()
+    if hashed_password is None:
+        await loop.run_in_executor(_kdf_executor, pwd_context.dummy_verify)
+        return False
+    return await loop.run_in_executor(_kdf_executor, verify_password, plain_password, hashed_password)
+
+async def aget_password_hash(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_kdf_executor, get_password_hash, password)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -28,7 +59,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _jwt_key, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
@@ -39,7 +70,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = jwt.decode(token, _jwt_key, algorithms=[settings.ALGORITHM])
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
@@ -55,6 +86,15 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
         raise credentials_exception
     return user
 
+async def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
+    """Get the current user if they are listed in ADMIN_USERNAMES, otherwise reject with 403."""
+    if current_user.username not in _ADMIN_USERNAMES:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required"
+        )
+    return current_user
+
 async def get_current_user_optional(
     credentials: Optional[HTTPAuthorizationCredentials] = Security(security)
 ) -> Optional[User]:
@@ -63,7 +103,7 @@ async def get_current_user_optional(
         return None
     token = credentials.credentials
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = jwt.decode(token, _jwt_key, algorithms=[settings.ALGORITHM])
         user_id: str = payload.get("sub")
         if user_id is None:
             return None
@@ -2,10 +2,92 @@
 Context-Aware Grammar Correction Module
 Corrects entire paragraphs preserving context across sentences.
 """
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
 from nltk.tokenize import sent_tokenize
 from core.grammar_analysis import correct_grammar, detect_grammar_errors
-from core.ai_service import generate_ai_response, is_ai_available
+from core.ai_service import generate_ai_response, stream_ai_response, is_ai_available
+from core.executor import run_blocking
+from core.streaming import aiter_blocking, batch_chunks
+
+CONTEXTUAL_SYSTEM_PROMPT = "You are an English grammar expert specializing in contextual paragraph correction. Preserve meaning and coherence while fixing all errors."
+
+def _contextual_prompt(text: str) -> str:
+    """Build the AI prompt for context-aware paragraph correction."""
+    return f"""Correct this English paragraph while preserving context and coherence across sentences. Fix:
+1. Grammar errors in each sentence
+2. Spelling mistakes
+3. Punctuation and capitalization
+4. Sentence structure and word order
+5. Cross-sentence coherence (pronoun references, tense consistency, logical flow)
+6. Paragraph structure and transitions
+
+Maintain the original meaning and context. Return the fully corrected paragraph.
+
+Original Paragraph:
+{text}
+
+Corrected Paragraph:"""
+
+def _empty_result(text: str) -> Dict:
+    return {
+        "original": text,
+        "corrected": text,
+        "changes": [],
+        "context_preserved": True
+    }
+
+def _ai_result(text: str, sentences: List[str], ai_corrected: Optional[str]) -> Optional[Dict]:
+    """Compare the AI-corrected paragraph with the original sentences; None if unusable."""
+    if not ai_corrected or not ai_corrected.strip() or ai_corrected.strip() == text:
+        return None
+    
+    # Analyze changes
+    corrected_sentences = sent_tokenize(ai_corrected.strip())
+    changes = []
+    
+    # Compare original and corrected sentences
+    for i, (orig_sent, corr_sent) in enumerate(zip(sentences, corrected_sentences[:len(sentences)])):
+        if orig_sent.strip() != corr_sent.strip():
+            changes.append({
+                "sentence_index": i,
+                "original": orig_sent.strip(),
+                "corrected": corr_sent.strip(),
+                "type": "contextual_correction",
+                "message": f"Sentence {i+1} corrected with context awareness"
+            })
+    
+    return {
+        "original": text,
+        "corrected": ai_corrected.strip(),
+        "changes": changes,
+        "context_preserved": True,
+        "method": "ai_contextual",
+        "sentence_count": len(sentences),
+        "corrections_applied": len(changes)
+    }
+
+def _correct_sentence(sentence: str, index: int, sentence_count: int, use_ai: bool) -> Dict:
+    """Correct one sentence of a paragraph, tagging its changes with their position."""
+    correction = correct_grammar(sentence, use_ai=use_ai)
+    changes = correction.get("changes") or []
+    for change in changes:
+        change["sentence_index"] = index
+        change["context_note"] = f"Part of paragraph with {sentence_count} sentences"
+    return {
+        "corrected": correction.get("corrected", sentence),
+        "changes": changes
+    }
+
+def _sentence_by_sentence_result(text: str, sentences: List[str], corrected_sentences: List[str], all_changes: List[Dict]) -> Dict:
+    return {
+        "original": text,
+        "corrected": " ".join(corrected_sentences),
+        "changes": all_changes,
+        "context_preserved": True,
+        "method": "sentence_by_sentence",
+        "sentence_count": len(sentences),
+        "corrections_applied": len(all_changes)
+    }
 
 def correct_paragraph_with_context(text: str, use_ai: bool = True) -> Dict:
     """
@@ -20,12 +102,7 @@ def correct_paragraph_with_context(text: str, use_ai: bool = True) -> Dict:
         Dictionary with corrected text, changes, and context notes
     """
     if not text or not text.strip():
-        return {
-            "original": text,
-            "corrected": text,
-            "changes": [],
-            "context_preserved": True
-        }
+        return _empty_result(text)
     
     # Split into sentences
     sentences = sent_tokenize(text.strip())
@@ -38,91 +115,76 @@ def correct_paragraph_with_context(text: str, use_ai: bool = True) -> Dict:
     if use_ai and is_ai_available():
         try:
             # Use AI for context-aware correction
-            ai_prompt = f"""Correct this English paragraph while preserving context and coherence across sentences. Fix:
-1. Grammar errors in each sentence
-2. Spelling mistakes
-3. Punctuation and capitalization
-4. Sentence structure and word order
-5. Cross-sentence coherence (pronoun references, tense consistency, logical flow)
-6. Paragraph structure and transitions
-
-Maintain the original meaning and context. Return the fully corrected paragraph.
-
-Original Paragraph:
-{text}
-
-Corrected Paragraph:"""
-            
             ai_corrected = generate_ai_response(
-                ai_prompt,
-                "You are an English grammar expert specializing in contextual paragraph correction. Preserve meaning and coherence while fixing all errors.",
+                _contextual_prompt(text),
+                CONTEXTUAL_SYSTEM_PROMPT,
                 max_tokens=500,
                 temperature=0.3
             )
             
-            if ai_corrected and ai_corrected.strip() and ai_corrected.strip() != text:
-                # Analyze changes
-                corrected_sentences = sent_tokenize(ai_corrected.strip())
-                changes = []
-                
-                # Compare original and corrected sentences
-                for i, (orig_sent, corr_sent) in enumerate(zip(sentences, corrected_sentences[:len(sentences)])):
-                    if orig_sent.strip() != corr_sent.strip():
-                        changes.append({
-                            "sentence_index": i,
-                            "original": orig_sent.strip(),
-                            "corrected": corr_sent.strip(),
-                            "type": "contextual_correction",
-                            "message": f"Sentence {i+1} corrected with context awareness"
-                        })
-                
-                return {
-                    "original": text,
-                    "corrected": ai_corrected.strip(),
-                    "changes": changes,
-                    "context_preserved": True,
-                    "method": "ai_contextual",
-                    "sentence_count": len(sentences),
-                    "corrections_applied": len(changes)
-                }
+            result = _ai_result(text, sentences, ai_corrected)
+            if result:
+                return result
         except Exception as e:
             print(f"⚠️ AI contextual correction failed: {e}")
     
     # Fallback: sentence-by-sentence correction with context notes
     corrected_sentences = []
     all_changes = []
-    previous_context = {}
     
     for i, sentence in enumerate(sentences):
-        # Correct individual sentence
-        correction = correct_grammar(sentence, use_ai=use_ai)
-        corrected_sent = correction.get("corrected", sentence)
-        corrected_sentences.append(corrected_sent)
-        
-        # Track changes with context
-        if correction.get("changes"):
-            for change in correction.get("changes", []):
-                change["sentence_index"] = i
-                change["context_note"] = f"Part of paragraph with {len(sentences)} sentences"
-                all_changes.append(change)
+        correction = _correct_sentence(sentence, i, len(sentences), use_ai)
+        corrected_sentences.append(correction["corrected"])
+        all_changes.extend(correction["changes"])
+    
+    return _sentence_by_sentence_result(text, sentences, corrected_sentences, all_changes)
+
+async def astream_paragraph_correction(text: str, use_ai: bool = True) -> AsyncIterator[Dict]:
+    """
+    Streaming variant of correct_paragraph_with_context.
+    
+    Yields `token` events while the AI rewrites the paragraph, or one
+    `sentence` event per sentence on the fallback path, followed by a
+    `result` event carrying the same dictionary the sync variant returns.
+    """
+    if not text or not text.strip():
+        yield {"type": "result", "data": _empty_result(text)}
+        return
+    
+    sentences = await run_blocking(sent_tokenize, text.strip())
+    
+    if len(sentences) == 1:
+        result = await run_blocking(correct_grammar, text, use_ai=use_ai)
+        yield {"type": "result", "data": result}
+        return
+    
+    if use_ai and is_ai_available():
+        parts = []
+        deltas = stream_ai_response(
+            _contextual_prompt(text),
+            CONTEXTUAL_SYSTEM_PROMPT,
+            max_tokens=500,
+            temperature=0.3
+        )
+        async for chunk in aiter_blocking(batch_chunks(deltas)):
+            parts.append(chunk)
+            yield {"type": "token", "text": chunk}
         
-        # Update context for next sentence (e.g., tense consistency)
-        if i < len(sentences) - 1:
-            # Extract tense from current sentence for consistency
-            # This is a simplified version - could be enhanced with NLP
-            previous_context["sentence_index"] = i
+        result = await run_blocking(_ai_result, text, sentences, "".join(parts))
+        if result:
+            yield {"type": "result", "data": result}
+            return
     
-    corrected_paragraph = " ".join(corrected_sentences)
+    corrected_sentences = []
+    all_changes = []
     
-    return {
-        "original": text,
-        "corrected": corrected_paragraph,
-        "changes": all_changes,
-        "context_preserved": True,
-        "method": "sentence_by_sentence",
-        "sentence_count": len(sentences),
-        "corrections_applied": len(all_changes)
-    }
+    for i, sentence in enumerate(sentences):
+        correction = await run_blocking(_correct_sentence, sentence, i, len(sentences), use_ai)
+        corrected_sentences.append(correction["corrected"])
+        all_changes.extend(correction["changes"])
+        yield {"type": "sentence", "sentence_index": i, **correction}
+    
+    yield {"type": "result", "data": _sentence_by_sentence_result(text, sentences, corrected_sentences, all_changes)}
 
 def analyze_paragraph_coherence(text: str) -> Dict:
     """
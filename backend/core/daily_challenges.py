@@ -2,6 +2,8 @@
 Daily Challenges Module
 Auto-generates random writing prompts for daily practice.
 """
+import random
+from functools import lru_cache
 from typing import Dict, List, Optional
 from datetime import datetime, date
 from core.ai_service import generate_ai_response, is_ai_available
@@ -69,7 +71,6 @@ def generate_daily_challenge(user_id: Optional[str] = None, category: Optional[s
     """
     # Select category
     if not category or category not in CHALLENGE_CATEGORIES:
-        import random
         category = random.choice(list(CHALLENGE_CATEGORIES.keys()))
     
     category_info = CHALLENGE_CATEGORIES[category]
@@ -102,17 +103,14 @@ Prompt:"""
                 method = "ai_generated"
             else:
                 # Fallback to predefined prompts
-                import random
                 challenge_prompt = random.choice(category_info["prompts"])
                 method = "predefined"
         except Exception as e:
             print(f"⚠️ AI challenge generation failed: {e}")
-            import random
             challenge_prompt = random.choice(category_info["prompts"])
             method = "predefined"
     else:
         # Use predefined prompts
-        import random
         challenge_prompt = random.choice(category_info["prompts"])
         method = "predefined"
     
@@ -167,6 +165,7 @@ def get_challenge_tips(category: str) -> List[str]:
         "Review and revise your work"
     ])
 
+@lru_cache(maxsize=1)
 def get_challenge_categories() -> List[Dict]:
     """Get all available challenge categories."""
     return [
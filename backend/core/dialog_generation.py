@@ -4,6 +4,8 @@ Generates realistic conversation scenarios for language learning.
 """
 from typing import List, Dict, Optional
 import random
+import re
+from core.lazy import Lazy
 
 # Try to import transformers for dialog generation
 try:
@@ -16,6 +18,7 @@ except ImportError:
 # Global dialog generator
 dialog_generator = None
 
+@Lazy
 def load_dialog_model():
     """Lazy load dialog generation model."""
     global dialog_generator
@@ -369,7 +372,6 @@ def generate_response(user_input: str, context: List[Dict], topic: str) -> Dict:
     # Name responses
     if "name" in user_lower and ("my" in user_lower or "i'm" in user_lower or "i am" in user_lower):
         # Try to extract name
-        import re
         name_match = re.search(r'(?:my name is|i\'?m|i am)\s+([A-Z][a-z]+)', user_input, re.IGNORECASE)
         if name_match:
             name = name_match.group(1)
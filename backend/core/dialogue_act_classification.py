@@ -5,6 +5,28 @@ Classifies dialogue acts: question, request, greeting, statement, etc.
 from typing import Dict, List, Optional
 import re
 
+# Dialogue act cue patterns, compiled once
+_GREETING_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'^(hi|hello|hey|greetings|good morning|good afternoon|good evening)',
+    r'\b(how are you|how do you do|nice to meet you)\b'
+))
+
+_QUESTION_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b(can you|could you|would you|will you|do you|did you|are you|is it)\b',
+    r'\b(what is|what are|how is|how are|where is|where are)\b'
+))
+
+_REQUEST_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b(please|kindly|could you|would you|can you)\b',
+    r'\b(i want|i need|i would like|i\'d like|help me|show me|tell me)\b',
+    r'\b(explain|describe|give me|provide|send)\b'
+))
+
+_APOLOGY_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b(sorry|apologize|apology|excuse me|pardon|forgive)\b',
+    r'\b(my bad|my mistake|i was wrong)\b'
+))
+
 def classify_dialogue_act(text: str, context: Optional[List[Dict]] = None) -> Dict:
     """
     Classify the dialogue act (intent) of user input.
@@ -78,14 +100,9 @@ def classify_dialogue_act(text: str, context: Optional[List[Dict]] = None) -> Di
 
 def score_greeting(text: str) -> float:
     """Score likelihood of greeting."""
-    greeting_patterns = [
-        r'^(hi|hello|hey|greetings|good morning|good afternoon|good evening)',
-        r'\b(how are you|how do you do|nice to meet you)\b'
-    ]
-    
     score = 0.0
-    for pattern in greeting_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
+    for pattern in _GREETING_PATTERNS:
+        if pattern.search(text):
             score += 0.5
     
     # Check for greeting punctuation
@@ -107,29 +124,17 @@ def score_question(text: str) -> float:
     question_word_count = sum(1 for word in question_words if word in text)
     score += question_word_count * 0.15
     
-    # Question patterns
-    question_patterns = [
-        r'\b(can you|could you|would you|will you|do you|did you|are you|is it)\b',
-        r'\b(what is|what are|how is|how are|where is|where are)\b'
-    ]
-    
-    for pattern in question_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
+    for pattern in _QUESTION_PATTERNS:
+        if pattern.search(text):
             score += 0.2
     
     return min(1.0, score)
 
 def score_request(text: str) -> float:
     """Score likelihood of request."""
-    request_patterns = [
-        r'\b(please|kindly|could you|would you|can you)\b',
-        r'\b(i want|i need|i would like|i\'d like|help me|show me|tell me)\b',
-        r'\b(explain|describe|give me|provide|send)\b'
-    ]
-    
     score = 0.0
-    for pattern in request_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
+    for pattern in _REQUEST_PATTERNS:
+        if pattern.search(text):
             score += 0.3
     
     # Imperative mood (commands)
@@ -167,14 +172,9 @@ def score_complaint(text: str) -> float:
 
 def score_apology(text: str) -> float:
     """Score likelihood of apology."""
-    apology_patterns = [
-        r'\b(sorry|apologize|apology|excuse me|pardon|forgive)\b',
-        r'\b(my bad|my mistake|i was wrong)\b'
-    ]
-    
     score = 0.0
-    for pattern in apology_patterns:
-        if re.search(pattern, text, re.IGNORECASE):
+    for pattern in _APOLOGY_PATTERNS:
+        if pattern.search(text):
             score += 0.5
     
     return min(1.0, score)
@@ -0,0 +1,107 @@
+"""
+Disk Cache Module
+Persistent SQLite-backed cache for generated content that stays valid across
+restarts and can be shared between worker processes (daily challenges, drills).
+"""
+import json
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from config import settings
+
+def seconds_until_local_midnight() -> float:
+    """Return the number of seconds left until the next local midnight."""
+    now = datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return (midnight - now).total_seconds()
+
+class DiskCache:
+    """
+    Key/value cache stored in a single SQLite table.
+
+    Keys are JSON-encoded sequences and values are JSON documents. Each call
+    opens its own connection, so the cache is safe to use from worker
+    threads and from several processes sharing the same file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5)
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    @staticmethod
+    def _key(key: Sequence) -> str:
+        return json.dumps(list(key), separators=(",", ":"))
+
+    def get(self, key: Sequence) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (self._key(key), time.time()),
+            ).fetchone()
+        finally:
+            conn.close()
+        return json.loads(row[0]) if row else None
+
+    def setdefault(self, key: Sequence, value: Any, ttl: Optional[float] = None) -> Any:
+        """
+        Store value unless a live entry already exists, and return the stored value.
+
+        When two workers race on the same key, both get the first one's value.
+        """
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        encoded_key = self._key(key)
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT INTO cache (key, value, expires_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires_at = excluded.expires_at "
+                    "WHERE cache.expires_at IS NOT NULL AND cache.expires_at <= ?",
+                    (encoded_key, json.dumps(value), expires_at, now),
+                )
+            row = conn.execute("SELECT value FROM cache WHERE key = ?", (encoded_key,)).fetchone()
+        finally:
+            conn.close()
+        return json.loads(row[0]) if row else value
+
+    def get_or_compute(self, key: Sequence, compute: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """Return the cached value for key, computing and storing it on a miss."""
+        value = self.get(key)
+        if value is not None:
+            return value
+        return self.setdefault(key, compute(), ttl=ttl)
+
+    def export(self) -> List[Dict]:
+        """Return all live entries, e.g. to pre-populate another deployment."""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT key, value, expires_at FROM cache WHERE expires_at IS NULL OR expires_at > ?",
+                (time.time(),),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [
+            {"key": json.loads(key), "value": json.loads(value), "expires_at": expires_at}
+            for key, value, expires_at in rows
+        ]
+
+# Shared cache used by the advanced AI endpoints
+disk_cache = DiskCache(settings.DISK_CACHE_PATH)
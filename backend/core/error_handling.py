@@ -0,0 +1,64 @@
+"""
+Error Handling Module
+Shared decorator that turns unexpected endpoint failures into logged HTTP 500s,
+and a route class that reports request validation errors as a plain string.
+"""
+import functools
+import logging
+from typing import Callable
+from fastapi import HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+
+logger = logging.getLogger(__name__)
+
+def handle_errors(operation: str) -> Callable:
+    """
+    Wrap an async endpoint so unexpected exceptions are logged with their
+    traceback and re-raised as HTTP 500 `"<operation> failed: <error>"`.
+    HTTPExceptions raised by the endpoint pass through unchanged.
+    
+    Args:
+        operation: Human-readable name of the operation, e.g. "Tone transfer"
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.exception("%s failed", operation)
+                raise HTTPException(status_code=500, detail=f"{operation} failed: {str(e)}")
+        return wrapper
+    return decorator
+
+def _validation_message(exc: RequestValidationError) -> str:
+    """Describe the first validation error, e.g. "Text must be at least 10 characters"."""
+    error = exc.errors()[0]
+    if error["type"] == "value_error":
+        # Message raised by one of our validators; Pydantic prefixes "Value error, "
+        return str(error["ctx"]["error"])
+    field = error["loc"][-1] if error["loc"] else "request"
+    return f"{field}: {error['msg']}"
+
+class PlainDetailRoute(APIRoute):
+    """
+    Route that turns request validation failures into a 400 whose `detail` is
+    a single message string, the shape the frontend renders for every other
+    error, instead of FastAPI's 422 list of error objects.
+    """
+    
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        
+        async def route_handler(request: Request):
+            try:
+                return await handler(request)
+            except RequestValidationError as exc:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=_validation_message(exc)
+                )
+        return route_handler
@@ -13,18 +13,13 @@ def mine_common_errors(feedback_logs: List[Dict]) -> Dict:
             "trends": {}
         }
     
-    all_errors = []
-    error_types = []
-    
-    for log in feedback_logs:
-        corrections = log.get("corrections", [])
-        for correction in corrections:
-            error_type = correction.get("type", "unknown")
-            error_types.append(error_type)
-            all_errors.append(correction)
-    
-    # Count error frequencies
-    error_freq = Counter(error_types)
+    # Count error frequencies in one pass, without materializing the error list
+    error_freq = Counter(
+        correction.get("type", "unknown")
+        for log in feedback_logs
+        for correction in log.get("corrections", [])
+    )
+    total_errors = sum(error_freq.values())
     
     # Get top 10 most common errors
     common_errors = []
@@ -32,15 +27,15 @@ def mine_common_errors(feedback_logs: List[Dict]) -> Dict:
         common_errors.append({
             "type": error_type,
             "frequency": count,
-            "percentage": round((count / len(error_types) * 100), 2) if error_types else 0
+            "percentage": round((count / total_errors * 100), 2) if total_errors else 0
         })
     
     return {
         "common_errors": common_errors,
         "error_frequency": dict(error_freq),
-        "total_errors": len(error_types),
+        "total_errors": total_errors,
         "trends": {
             "most_common": error_freq.most_common(1)[0][0] if error_freq else None,
-            "error_rate": len(error_types) / len(feedback_logs) if feedback_logs else 0
+            "error_rate": total_errors / len(feedback_logs) if feedback_logs else 0
         }
     }
@@ -2,6 +2,7 @@
 Evaluation Metrics Module
 Comprehensive metrics for evaluating NLP performance, user learning outcomes, and system effectiveness.
 """
+import asyncio
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from collections import Counter, defaultdict
@@ -13,6 +14,10 @@ from models.xp_model import XPBadge
 from models.grammar_log_model import GrammarLog
 import statistics
 
+# CEFR levels in ascending order, and each level's rank (A1 = 1 ... C2 = 6)
+CEFR_LEVELS = ("A1", "A2", "B1", "B2", "C1", "C2")
+CEFR_RANK = {level: rank for rank, level in enumerate(CEFR_LEVELS, start=1)}
+
 # ============================================================================
 # NLP MODEL PERFORMANCE METRICS
 # ============================================================================
@@ -171,9 +176,11 @@ async def calculate_learning_effectiveness(user_id: Optional[PydanticObjectId] =
             "learning_velocity": 0
         }
     
+    # Order by date once for the error, proficiency and velocity comparisons
+    sorted_records = sorted(progress_records, key=lambda x: x.date)
+    
     # Calculate error reduction
     if len(progress_records) > 1:
-        sorted_records = sorted(progress_records, key=lambda x: x.date)
         initial_errors = sorted_records[0].grammar_errors if sorted_records[0].grammar_errors else 0
         recent_errors = sorted_records[-1].grammar_errors if sorted_records[-1].grammar_errors else 0
         
@@ -185,11 +192,9 @@ async def calculate_learning_effectiveness(user_id: Optional[PydanticObjectId] =
         error_reduction = 0
     
     # Calculate proficiency improvement
-    cefr_levels = {"A1": 1, "A2": 2, "B1": 3, "B2": 4, "C1": 5, "C2": 6}
     if len(progress_records) > 1:
-        sorted_records = sorted(progress_records, key=lambda x: x.date)
-        initial_level = cefr_levels.get(sorted_records[0].cefr_level, 1)
-        recent_level = cefr_levels.get(sorted_records[-1].cefr_level, 1)
+        initial_level = CEFR_RANK.get(sorted_records[0].cefr_level, 1)
+        recent_level = CEFR_RANK.get(sorted_records[-1].cefr_level, 1)
         proficiency_improvement = recent_level - initial_level
     else:
         proficiency_improvement = 0
@@ -207,7 +212,6 @@ async def calculate_learning_effectiveness(user_id: Optional[PydanticObjectId] =
     
     # Learning velocity (errors reduced per day)
     if len(progress_records) > 1:
-        sorted_records = sorted(progress_records, key=lambda x: x.date)
         days = (sorted_records[-1].date - sorted_records[0].date).days
         if days > 0:
             learning_velocity = error_reduction / days
@@ -442,6 +446,32 @@ async def calculate_quality_metrics(user_id: Optional[PydanticObjectId] = None)
 # COMPREHENSIVE EVALUATION REPORT
 # ============================================================================
 
+async def _no_trends() -> Dict:
+    return {}
+
+async def gather_evaluation_metrics(
+    user_id: Optional[PydanticObjectId] = None,
+    days: int = 30
+) -> Tuple[Dict, Dict, Dict, Dict, Dict]:
+    """
+    Run the independent metric queries concurrently.
+    
+    Args:
+        user_id: Optional user ID for user-specific metrics
+        days: Number of days to analyze
+    
+    Returns:
+        (learning, quality, system, feature usage, trends); trends is empty
+        without a user_id
+    """
+    return await asyncio.gather(
+        calculate_learning_effectiveness(user_id),
+        calculate_quality_metrics(user_id),
+        calculate_system_performance_metrics(),
+        calculate_feature_usage_metrics(days),
+        calculate_user_progress_trends(user_id, days) if user_id else _no_trends(),
+    )
+
 async def generate_comprehensive_evaluation_report(
     user_id: Optional[PydanticObjectId] = None,
     days: int = 30
@@ -456,16 +486,10 @@ async def generate_comprehensive_evaluation_report(
     Returns:
         Complete evaluation report
     """
-    # Collect all metrics
-    learning_metrics = await calculate_learning_effectiveness(user_id)
-    quality_metrics = await calculate_quality_metrics(user_id)
-    system_metrics = await calculate_system_performance_metrics()
-    feature_usage = await calculate_feature_usage_metrics(days)
-    
-    # User-specific trends if user_id provided
-    trends = {}
-    if user_id:
-        trends = await calculate_user_progress_trends(user_id, days)
+    # Collect all metrics (user-specific trends only if user_id provided)
+    learning_metrics, quality_metrics, system_metrics, feature_usage, trends = (
+        await gather_evaluation_metrics(user_id, days)
+    )
     
     # Calculate overall score
     overall_score = (
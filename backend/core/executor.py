@@ -0,0 +1,21 @@
+"""
+Executor Module
+Shared thread pool for running blocking NLP/LLM calls off the event loop.
+"""
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+from config import settings
+
+# Threads rather than processes: the loaded models and caches live in this
+# process, and spaCy, numpy and torch release the GIL in their native code.
+EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.WORKER_THREADS,
+    thread_name_prefix="edulingua-worker"
+)
+
+async def run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking function in the shared executor and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(EXECUTOR, functools.partial(func, *args, **kwargs))
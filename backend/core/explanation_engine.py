@@ -4,6 +4,7 @@ Provides detailed explanations for grammar corrections.
 """
 from typing import List, Dict, Optional
 import re
+from core.lazy import Lazy
 
 # Try to import language_tool_python
 try:
@@ -16,6 +17,7 @@ except ImportError:
 # Global LanguageTool instance
 language_tool = None
 
+@Lazy
 def load_language_tool():
     """Lazy load LanguageTool."""
     global language_tool
@@ -5,14 +5,7 @@ import nltk
 from nltk.tokenize import sent_tokenize, word_tokenize
 from nltk.tag import pos_tag
 from .sentence_structure import analyze_sentence_structure, correct_sentence_structure
-
-# Try to import spaCy (optional)
-try:
-    import spacy
-    SPACY_AVAILABLE = True
-except ImportError:
-    SPACY_AVAILABLE = False
-    spacy = None
+from .spacy_cache import nlp, get_doc, prime_docs
 
 # Try to import transformers (optional)
 try:
@@ -22,14 +15,6 @@ except ImportError:
     TRANSFORMERS_AVAILABLE = False
     pipeline = None
 
-# Load spaCy model (optional)
-nlp = None
-if SPACY_AVAILABLE:
-    try:
-        nlp = spacy.load("en_core_web_sm")
-    except (OSError, IOError):
-        nlp = None
-
 # Initialize grammar correction pipeline (T5 model) - optional
 corrector = None
 if TRANSFORMERS_AVAILABLE:
@@ -39,23 +24,10 @@ if TRANSFORMERS_AVAILABLE:
         print(f"Warning: Could not load T5 model: {e}")
         corrector = None
 
-def detect_grammar_errors(text: str) -> List[Dict]:
-    """
-    Enhanced grammar error detection including sentence formation errors.
-    Returns list of errors with positions, suggestions, and corrections.
-    """
-    errors = []
-    
-    if not text or not text.strip():
-        return errors
-    
-    # First, analyze sentence structure
-    structure_analysis = analyze_sentence_structure(text)
-    structure_errors = structure_analysis.get("errors", [])
-    errors.extend(structure_errors)
-    
-    # Rule-based checks for common mistakes
-    common_mistakes = {
+# Rule-based checks for common mistakes, compiled once
+_COMMON_MISTAKES = tuple(
+    (re.compile(pattern, re.IGNORECASE), info)
+    for pattern, info in {
         r'\b(your|you\'re)\b.*\b(your|you\'re)\b': {
             "message": "Check usage of 'your' vs 'you're'",
             "correction": "Use 'your' for possession, 'you're' for 'you are'"
@@ -84,11 +56,36 @@ def detect_grammar_errors(text: str) -> List[Dict]:
             "message": "Check 'then' (time) vs 'than' (comparison)",
             "correction": "Use 'then' for time sequence, 'than' for comparisons"
         },
-    }
+    }.items()
+)
+
+_DOUBLE_SPACE = re.compile(r'\s{2,}')
+
+# Redundant intensifiers removed by rule-based rephrasing
+_REDUNDANT_PATTERNS = (
+    (re.compile(r'\bvery\s+(\w+)\b', re.IGNORECASE), r'\1'),  # "very good" -> "good" (sometimes)
+    (re.compile(r'\breally\s+(\w+)\b', re.IGNORECASE), r'\1'),  # "really nice" -> "nice"
+)
+
+def detect_grammar_errors(text: str) -> List[Dict]:
+    """
+    Enhanced grammar error detection including sentence formation errors.
+    Returns list of errors with positions, suggestions, and corrections.
+    """
+    errors = []
+    
+    if not text or not text.strip():
+        return errors
     
-    for pattern, info in common_mistakes.items():
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
+    # First, analyze sentence structure
+    structure_analysis = analyze_sentence_structure(text)
+    structure_errors = structure_analysis.get("errors", [])
+    errors.extend(structure_errors)
+    
+    # Rule-based checks for common mistakes
+    
+    for pattern, info in _COMMON_MISTAKES:
+        for match in pattern.finditer(text):
             errors.append({
                 "type": "common_mistake",
                 "message": info["message"],
@@ -100,7 +97,7 @@ def detect_grammar_errors(text: str) -> List[Dict]:
             })
     
     # Check for double spaces
-    double_space_matches = re.finditer(r'\s{2,}', text)
+    double_space_matches = _DOUBLE_SPACE.finditer(text)
     for match in double_space_matches:
         errors.append({
             "type": "formatting",
@@ -198,7 +195,7 @@ def detect_grammar_errors(text: str) -> List[Dict]:
     
     # Use spaCy for advanced dependency parsing errors
     if nlp:
-        doc = nlp(text)
+        doc = get_doc(text)
         for token in doc:
             # Check for missing articles before nouns
             if token.pos_ == "NOUN" and token.i > 0:
@@ -240,6 +237,19 @@ def detect_grammar_errors(text: str) -> List[Dict]:
     
     return errors
 
+def detect_grammar_errors_batch(texts: List[str]) -> List[List[Dict]]:
+    """
+    Detect grammar errors in several texts at once.
+    
+    All texts and their sentences are parsed in one batched spaCy pass first,
+    so the per-text detection below reuses the parsed documents.
+    Returns one error list per text, in the same order.
+    """
+    valid = [text for text in texts if text and text.strip()]
+    sentences = [s.strip() for text in valid for s in sent_tokenize(text) if s.strip()]
+    prime_docs(valid + sentences)
+    return [detect_grammar_errors(text) for text in texts]
+
 def correct_grammar(text: str, use_ai: bool = True) -> Dict:
     """
     Correct grammar errors and return corrected text with detailed changes.
@@ -483,14 +493,9 @@ def rephrase_sentence(text: str, style: str = "clear", use_ai: bool = True) -> D
         rephrased = sentence
         
         # Remove redundant words
-        redundant_patterns = [
-            (r'\bvery\s+(\w+)\b', r'\1'),  # "very good" -> "good" (sometimes)
-            (r'\breally\s+(\w+)\b', r'\1'),  # "really nice" -> "nice"
-        ]
-        
-        for pattern, replacement in redundant_patterns:
-            if re.search(pattern, sentence, re.IGNORECASE):
-                rephrased = re.sub(pattern, replacement, rephrased, flags=re.IGNORECASE)
+        for pattern, replacement in _REDUNDANT_PATTERNS:
+            if pattern.search(sentence):
+                rephrased = pattern.sub(replacement, rephrased)
                 suggestions.append({
                     "type": "redundancy",
                     "original": sentence,
@@ -4,6 +4,7 @@ Uses T5-based grammar correction models for accurate fixes.
 """
 from typing import Dict, Optional
 import re
+from core.lazy import Lazy
 
 # Try to import transformers
 try:
@@ -20,6 +21,7 @@ grammar_tokenizer = None
 grammar_model = None
 grammar_pipeline = None
 
+@Lazy
 def load_grammar_model():
     """Lazy load grammar correction model."""
     global grammar_tokenizer, grammar_model, grammar_pipeline
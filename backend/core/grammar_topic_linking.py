@@ -2,6 +2,7 @@
 Grammar Topic Linking Module
 Shows mini-lessons when user makes mistakes.
 """
+from functools import lru_cache
 from typing import Dict, List, Optional
 from core.ai_service import generate_ai_response, is_ai_available
 
@@ -219,6 +220,7 @@ Provide a brief, encouraging explanation (2-3 sentences):"""
         "message": f"Found {len(errors)} error(s). Here are lessons to help you improve!"
     }
 
+@lru_cache(maxsize=1)
 def get_all_grammar_topics() -> List[Dict]:
     """Get all available grammar topics."""
     return [
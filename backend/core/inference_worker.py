@@ -0,0 +1,92 @@
+"""
+Inference Worker Module
+Optional pool of worker processes that own the NLP models, so heavy inference
+runs outside the web process (one worker per GPU when devices are configured).
+"""
+import asyncio
+import functools
+import importlib
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from config import settings
+from core.executor import run_blocking
+
+# Task name -> (module, function) run by the workers
+TASKS: Dict[str, Tuple[str, str]] = {
+    "tone_transfer": ("core.tone_style_transfer", "transfer_tone"),
+    "quality_score": ("core.writing_quality_score", "calculate_writing_quality_score"),
+    "emotion_intent": ("core.emotion_intent_analysis", "analyze_emotion_and_intent"),
+    "semantic_similarity": ("core.semantic_similarity", "compare_with_target"),
+    "essay_scoring": ("core.essay_scoring", "score_essay"),
+}
+
+@functools.lru_cache(maxsize=None)
+def _resolve(task: str) -> Callable:
+    module_name, attr = TASKS[task]
+    return getattr(importlib.import_module(module_name), attr)
+
+def _init_worker(devices: Sequence[str], counter) -> None:
+    """Pin this worker to its device and load the models before serving tasks."""
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    if devices:
+        os.environ["CUDA_VISIBLE_DEVICES"] = devices[index % len(devices)]
+
+    from core.model_registry import warm_up
+    warm_up()
+
+def _invoke(task: str, args: tuple, kwargs: dict) -> Any:
+    return _resolve(task)(*args, **kwargs)
+
+class InferenceClient:
+    """
+    Run named inference tasks in the worker pool.
+
+    With no workers configured, tasks run in-process on the shared thread
+    pool, which keeps single-process deployments unchanged.
+    """
+
+    def __init__(self, workers: int = 0, devices: Sequence[str] = ()):
+        self.workers = workers
+        self.devices = list(devices)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: CUDA cannot be re-initialised in a forked child
+            context = multiprocessing.get_context("spawn")
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self.devices, context.Value("i", 0)),
+            )
+        return self._pool
+
+    async def call(self, task: str, *args, **kwargs) -> Any:
+        """Run task with the given arguments and await its result."""
+        if task not in TASKS:
+            raise ValueError(f"Unknown inference task: {task}")
+        if not self.enabled:
+            return await run_blocking(_resolve(task), *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_pool(), _invoke, task, args, kwargs)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; the next call starts fresh ones."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+inference = InferenceClient(
+    workers=settings.INFERENCE_WORKERS,
+    devices=[d.strip() for d in settings.INFERENCE_DEVICES.split(",") if d.strip()],
+)
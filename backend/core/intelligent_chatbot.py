@@ -153,6 +153,26 @@ Would you like tips on a specific writing topic?""",
     }
 }
 
+# Malformed sentences that signal a correction request without correction keywords
+_MALFORMED_INTENT_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'^(i|she|he|they|we|you)\s+\w+\s+name',  # "i nishanth name"
+    r'^\w+\s+am\s+i$',  # "nishanth am i"
+    r'^name\s+\w+',  # "name nishanth"
+    r'^\w+\s+name$',  # "nishanth name"
+    r'^i\s+am\s+\w+$',  # "i am student" (might need article)
+    r'^i\s+like\s+\w+\s+\w+$',  # "i like play football" (missing to)
+)]
+
+# Looser patterns used to pick the whole query as the sentence to correct
+_MALFORMED_SENTENCE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'^(i|she|he|they|we|you)\s+\w+',  # "i nishanth name"
+    r'^\w+\s+am\s+i$',  # "nishanth am i"
+    r'^name\s+\w+',  # "name nishanth"
+    r'^\w+\s+name',  # "nishanth name"
+    r'^i\s+am\s+\w+$',  # "i am student" (missing article)
+    r'^i\s+like\s+\w+$',  # "i like play" (missing to)
+)]
+
 def analyze_query_intent(query: str) -> Dict:
     """Analyze user query to understand intent and extract information."""
     query_lower = query.lower().strip()
@@ -177,16 +197,8 @@ def analyze_query_intent(query: str) -> Dict:
     
     # Also detect malformed sentences even without correction keywords
     if not intent["needs_correction"]:
-        malformed_patterns = [
-            r'^(i|she|he|they|we|you)\s+\w+\s+name',  # "i nishanth name"
-            r'^\w+\s+am\s+i$',  # "nishanth am i"
-            r'^name\s+\w+',  # "name nishanth"
-            r'^\w+\s+name$',  # "nishanth name"
-            r'^i\s+am\s+\w+$',  # "i am student" (might need article)
-            r'^i\s+like\s+\w+\s+\w+$',  # "i like play football" (missing to)
-        ]
-        for pattern in malformed_patterns:
-            if re.match(pattern, query, re.IGNORECASE):
+        for pattern in _MALFORMED_INTENT_PATTERNS:
+            if pattern.match(query):
                 intent["type"] = "correction"
                 intent["confidence"] = 0.7
                 intent["needs_correction"] = True
@@ -366,16 +378,8 @@ What grammar topic would you like help with?""",
         # Pattern 3: If query itself looks like a malformed sentence (common patterns)
         if not text_to_correct:
             # Check for common malformed patterns
-            malformed_patterns = [
-                r'^(i|she|he|they|we|you)\s+\w+',  # "i nishanth name"
-                r'^\w+\s+am\s+i$',  # "nishanth am i"
-                r'^name\s+\w+',  # "name nishanth"
-                r'^\w+\s+name',  # "nishanth name"
-                r'^i\s+am\s+\w+$',  # "i am student" (missing article)
-                r'^i\s+like\s+\w+$',  # "i like play" (missing to)
-            ]
-            for pattern in malformed_patterns:
-                if re.match(pattern, query, re.IGNORECASE):
+            for pattern in _MALFORMED_SENTENCE_PATTERNS:
+                if pattern.match(query):
                     text_to_correct = query
                     break
         
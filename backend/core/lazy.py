@@ -0,0 +1,89 @@
+"""
+Lazy Import Module
+Defers importing heavy analyzer modules (and the models they load) until
+an endpoint first needs them.
+"""
+import contextlib
+import importlib
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from core.executor import run_blocking
+
+_UNSET = object()
+
+class Lazy:
+    """
+    Memoize a zero-argument loader: the first call runs it, later calls
+    return the stored value.
+    """
+    
+    def __init__(self, loader: Callable[[], Any]):
+        self._loader = loader
+        self._value = _UNSET
+        self._lock = threading.Lock()
+    
+    def __call__(self) -> Any:
+        if self._value is _UNSET:
+            with self._lock:
+                if self._value is _UNSET:
+                    self._value = self._loader()
+        return self._value
+    
+    @property
+    def loaded(self) -> bool:
+        return self._value is not _UNSET
+
+async def _aload(lazy: Lazy) -> Any:
+    """Return lazy's value, running the loader in the shared executor on first use."""
+    if lazy.loaded:
+        return lazy()
+    return await run_blocking(lazy)
+
+def lazy_module(name: str) -> Lazy:
+    """Return a Lazy that imports the named module on first call."""
+    return Lazy(lambda: importlib.import_module(name))
+
+def lazy_function(module_name: str, attr: str) -> Callable:
+    """
+    Return a stand-in for `module_name.attr` that imports the module on first call.
+    
+    Because the import happens when the function is called, passing the
+    stand-in to run_blocking keeps a slow first import off the event loop.
+    """
+    module = lazy_module(module_name)
+    
+    def proxy(*args, **kwargs):
+        return getattr(module(), attr)(*args, **kwargs)
+    
+    proxy.__name__ = proxy.__qualname__ = attr
+    return proxy
+
+def lazy_coroutine_function(module_name: str, attr: str) -> Callable[..., Awaitable]:
+    """
+    Like lazy_function, for an `async def` called directly from a handler.
+    
+    The first call imports the module in the shared executor, so the
+    event loop never runs the slow import itself.
+    """
+    module = lazy_module(module_name)
+    
+    async def proxy(*args, **kwargs):
+        return await getattr(await _aload(module), attr)(*args, **kwargs)
+    
+    proxy.__name__ = proxy.__qualname__ = attr
+    return proxy
+
+def lazy_async_generator_function(module_name: str, attr: str) -> Callable[..., AsyncIterator]:
+    """Like lazy_coroutine_function, for an async generator (e.g. a streaming analyzer)."""
+    module = lazy_module(module_name)
+    
+    async def proxy(*args, **kwargs):
+        func = getattr(await _aload(module), attr)
+        # Close the wrapped generator with the proxy so its cleanup runs promptly
+        async with contextlib.aclosing(func(*args, **kwargs)) as events:
+            async for event in events:
+                yield event
+    
+    proxy.__name__ = proxy.__qualname__ = attr
+    return proxy
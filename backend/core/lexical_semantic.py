@@ -2,23 +2,10 @@ from typing import Dict, List
 from collections import Counter
 from textstat import syllable_count
 import numpy as np
+from core.model_registry import get_sbert, encode
 
-# Try to import sentence_transformers (optional)
-try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
-    SentenceTransformer = None
-
-# Load Sentence-BERT model for semantic analysis (optional)
-sbert_model = None
-if SENTENCE_TRANSFORMERS_AVAILABLE:
-    try:
-        sbert_model = SentenceTransformer('all-MiniLM-L6-v2')
-    except Exception as e:
-        print(f"Warning: Could not load Sentence-BERT model: {e}")
-        sbert_model = None
+# Shared Sentence-BERT model for semantic analysis (optional)
+sbert_model = get_sbert()
 
 def calculate_lexical_diversity(tokens: List[str]) -> Dict:
     """
@@ -56,40 +43,46 @@ def calculate_lexical_diversity(tokens: List[str]) -> Dict:
         "word_frequency": dict(word_freq.most_common(20))
     }
 
+# Basic synonym suggestions (can be enhanced with WordNet or API)
+_BASIC_SYNONYMS = {
+    "good": ["excellent", "great", "wonderful", "fantastic", "superb"],
+    "bad": ["poor", "terrible", "awful", "horrible", "dreadful"],
+    "big": ["large", "huge", "enormous", "massive", "gigantic"],
+    "small": ["tiny", "little", "mini", "petite", "minuscule"],
+    "important": ["significant", "crucial", "vital", "essential", "key"],
+    "nice": ["pleasant", "lovely", "delightful", "charming", "agreeable"],
+}
+
 def suggest_synonyms(word: str, context: str = "") -> List[Dict]:
     """
     Suggest synonyms and alternative words using semantic similarity.
     """
-    suggestions = []
-    
-    # Basic synonym suggestions (can be enhanced with WordNet or API)
-    basic_synonyms = {
-        "good": ["excellent", "great", "wonderful", "fantastic", "superb"],
-        "bad": ["poor", "terrible", "awful", "horrible", "dreadful"],
-        "big": ["large", "huge", "enormous", "massive", "gigantic"],
-        "small": ["tiny", "little", "mini", "petite", "minuscule"],
-        "important": ["significant", "crucial", "vital", "essential", "key"],
-        "nice": ["pleasant", "lovely", "delightful", "charming", "agreeable"],
-    }
+    return suggest_synonyms_batch([word], context)[0]
+
+def suggest_synonyms_batch(words: List[str], context: str = "") -> List[List[Dict]]:
+    """
+    Suggest synonyms for several words from the same context in one call.
+    
+    Args:
+        words: Words to find alternatives for
+        context: Text the words appear in (not used by the basic synonym table)
     
-    word_lower = word.lower()
-    if word_lower in basic_synonyms:
-        for synonym in basic_synonyms[word_lower]:
-            suggestions.append({
+    Returns:
+        One list of suggestions per word, in the same order
+    """
+    results = []
+    for word in words:
+        suggestions = [
+            {
                 "word": synonym,
                 "similarity": 0.8,
                 "example": f"Use '{synonym}' instead of '{word}' for more variety."
-            })
-    
-    # Use Sentence-BERT for contextual suggestions if available
-    if sbert_model and context:
-        try:
-            # This is a simplified version - can be enhanced
-            pass
-        except Exception as e:
-            print(f"Error in semantic similarity: {e}")
+            }
+            for synonym in _BASIC_SYNONYMS.get(word.lower(), [])
+        ]
+        results.append(suggestions[:5])  # Return top 5 suggestions
     
-    return suggestions[:5]  # Return top 5 suggestions
+    return results
 
 def extract_keywords(text: str, top_n: int = 10) -> List[Dict]:
     """
@@ -152,7 +145,7 @@ def analyze_semantic_coherence(text: str) -> Dict:
     coherence_scores = []
     if sbert_model:
         try:
-            embeddings = sbert_model.encode(sentences)
+            embeddings = encode(sentences)
             for i in range(len(embeddings) - 1):
                 similarity = np.dot(embeddings[i], embeddings[i+1]) / (
                     np.linalg.norm(embeddings[i]) * np.linalg.norm(embeddings[i+1])
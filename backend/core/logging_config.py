@@ -0,0 +1,61 @@
+"""
+Logging Configuration Module
+Routes log records through a queue so handlers write to stderr off the request path.
+"""
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import List
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+# Loggers uvicorn configures with its own handlers before the app is imported
+UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+_listeners: List[QueueListener] = []
+
+class _RecordQueueHandler(QueueHandler):
+    """
+    Queue records unformatted, leaving formatting to the target handlers.
+    uvicorn's access formatter reads the record's args, which the default
+    prepare() would replace with the pre-formatted message.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+def _start_listener(log_queue: queue.SimpleQueue, *handlers: logging.Handler) -> None:
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Install a QueueHandler on the root logger and start a background
+    QueueListener that performs the actual stderr writes. uvicorn's loggers
+    (including the per-request access log) keep their handlers and formats
+    but are queued the same way. Safe to call twice.
+    """
+    if _listeners:
+        return
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(QueueHandler(log_queue))
+    _start_listener(log_queue, stream_handler)
+    
+    for name in UVICORN_LOGGERS:
+        logger = logging.getLogger(name)
+        if logger.handlers:
+            uvicorn_queue: queue.SimpleQueue = queue.SimpleQueue()
+            _start_listener(uvicorn_queue, *logger.handlers)
+            logger.handlers = [_RecordQueueHandler(uvicorn_queue)]
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background listeners."""
+    while _listeners:
+        _listeners.pop().stop()
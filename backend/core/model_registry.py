@@ -0,0 +1,89 @@
+"""
+Model Registry Module
+Process-wide singletons for the shared NLP models.
+Every analyzer gets the same Sentence-BERT and spaCy instances, and
+embedding inference is gated so concurrent endpoints queue for the
+device instead of oversubscribing it.
+"""
+import threading
+from functools import lru_cache
+from typing import List, Union
+from config import settings
+from core.spacy_cache import nlp
+
+# Try to import sentence_transformers (optional)
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+    SentenceTransformer = None
+
+# Try to import torch (optional, needed for quantization)
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+    torch = None
+
+# Concurrent forward passes allowed on the embedding model
+_inference_slots = threading.BoundedSemaphore(settings.MODEL_INFERENCE_CONCURRENCY)
+
+def _quantize(model):
+    """
+    Convert the model's Linear layers to int8 with dynamic quantization.
+    Only applied on CPU, where it roughly halves memory traffic; the
+    original model is returned if quantization is unavailable or fails.
+    """
+    if not TORCH_AVAILABLE or str(getattr(model, "device", "cpu")) != "cpu":
+        return model
+    try:
+        quantized = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        print("✅ Sentence-BERT model quantized to int8")
+        return quantized
+    except Exception as e:
+        print(f"⚠️ Could not quantize Sentence-BERT model: {e}")
+        return model
+
+@lru_cache(maxsize=1)
+def get_sbert():
+    """Load the Sentence-BERT model once. Returns None if unavailable."""
+    if not SENTENCE_TRANSFORMERS_AVAILABLE:
+        return None
+    try:
+        model = SentenceTransformer(settings.SBERT_MODEL)
+        print("✅ Sentence-BERT model loaded")
+        if settings.QUANTIZE_MODELS:
+            model = _quantize(model)
+        return model
+    except Exception as e:
+        print(f"⚠️ Could not load Sentence-BERT model: {e}")
+        return None
+
+def get_spacy():
+    """Return the shared spaCy pipeline, or None if unavailable."""
+    return nlp
+
+def encode(texts: Union[str, List[str]]):
+    """
+    Embed text(s) with the shared Sentence-BERT model.
+    
+    Raises:
+        RuntimeError: If no Sentence-BERT model is available
+    """
+    model = get_sbert()
+    if model is None:
+        raise RuntimeError("Sentence-BERT model is not available")
+    with _inference_slots:
+        return model.encode(texts)
+
+def warm_up() -> None:
+    """Load the models and run one dummy forward pass so the first request is not slowed down."""
+    if get_sbert() is not None:
+        try:
+            encode("Warm-up sentence.")
+        except Exception as e:
+            print(f"⚠️ Sentence-BERT warm-up failed: {e}")
+    if nlp is not None:
+        nlp("Warm-up sentence.")
@@ -2,7 +2,7 @@
 Plagiarism & Repetition Detection - Ensures originality in written exercises.
 """
 from typing import Dict, List, Tuple, Optional
-from collections import Counter
+import numpy as np
 
 def detect_plagiarism(text: str, reference_texts: Optional[List[str]] = None) -> Dict:
     """
@@ -71,48 +71,74 @@ def detect_internal_repetition(text: str) -> Dict:
             "phrases": []
         }
     
-    # Check for repeated phrases (3+ words)
-    all_phrases = []
+    # Check for repeated phrases (3+ words). Words are mapped to integer ids
+    # with -1 marking sentence boundaries, so every 3-word window that stays
+    # inside a sentence gets an exact integer key and all of them can be
+    # counted in one vectorized pass.
+    word_ids = {}
+    ids = []
+    words = []
     for sentence in sentences:
-        words = sentence.lower().split()
-        for i in range(len(words) - 2):
-            phrase = " ".join(words[i:i+3])
-            all_phrases.append(phrase)
+        for word in sentence.lower().split():
+            ids.append(word_ids.setdefault(word, len(word_ids)))
+            words.append(word)
+        ids.append(-1)
+        words.append("")
+    
+    ids = np.asarray(ids, dtype=np.int64)
+    vocab_size = max(len(word_ids), 1)
+    first, second, third = ids[:-2], ids[1:-1], ids[2:]
+    in_sentence = (first >= 0) & (second >= 0) & (third >= 0)
+    positions = np.flatnonzero(in_sentence)
+    keys = (first[positions] * vocab_size + second[positions]) * vocab_size + third[positions]
+    
+    total_phrases = len(keys)
+    if total_phrases == 0:
+        return {
+            "score": 0.0,
+            "phrases": []
+        }
     
-    phrase_counts = Counter(all_phrases)
-    repeated_phrases = [(phrase, count) for phrase, count in phrase_counts.items() if count > 1]
+    unique_keys, first_index, counts = np.unique(keys, return_index=True, return_counts=True)
+    repeated = np.flatnonzero(counts > 1)
+    # Report phrases in order of first appearance
+    repeated = repeated[np.argsort(first_index[repeated], kind="stable")]
+    repeated_phrases = []
+    for idx in repeated[:10]:
+        start = positions[first_index[idx]]
+        repeated_phrases.append((" ".join(words[start:start + 3]), int(counts[idx])))
     
     # Calculate repetition score
-    total_phrases = len(all_phrases)
-    repeated_count = sum(count - 1 for _, count in repeated_phrases)  # Count extra occurrences
-    repetition_score = repeated_count / total_phrases if total_phrases > 0 else 0.0
+    repeated_count = int(np.sum(counts[counts > 1] - 1))  # Count extra occurrences
+    repetition_score = repeated_count / total_phrases
     
     return {
         "score": round(repetition_score, 3),
-        "phrases": [{"phrase": phrase, "count": count} for phrase, count in repeated_phrases[:10]]
+        "phrases": [{"phrase": phrase, "count": count} for phrase, count in repeated_phrases]
     }
 
 def check_against_references(text: str, reference_texts: List[str]) -> List[Dict]:
     """
     Check text against reference texts for potential plagiarism.
     """
-    from core.semantic_similarity import calculate_semantic_similarity
-    
-    matches = []
-    
-    for i, ref_text in enumerate(reference_texts):
-        similarity = calculate_semantic_similarity(text, ref_text)
-        
-        if similarity > 0.5:  # Threshold for potential match
-            matches.append({
-                "reference_index": i,
-                "similarity": round(similarity * 100, 1),
-                "risk_level": "high" if similarity > 0.8 else "medium" if similarity > 0.6 else "low",
-                "excerpt": ref_text[:100] + "..." if len(ref_text) > 100 else ref_text
-            })
+    from core.semantic_similarity import calculate_semantic_similarities
     
+    # One batched embedding pass and matmul instead of a model call per reference
+    similarities = calculate_semantic_similarities(text, reference_texts)
+    candidates = np.flatnonzero(similarities > 0.5)  # Threshold for potential match
     # Sort by similarity
-    matches.sort(key=lambda x: x["similarity"], reverse=True)
+    candidates = candidates[np.argsort(-similarities[candidates], kind="stable")]
+    
+    matches = []
+    for i in candidates:
+        similarity = float(similarities[i])
+        ref_text = reference_texts[i]
+        matches.append({
+            "reference_index": int(i),
+            "similarity": round(similarity * 100, 1),
+            "risk_level": "high" if similarity > 0.8 else "medium" if similarity > 0.6 else "low",
+            "excerpt": ref_text[:100] + "..." if len(ref_text) > 100 else ref_text
+        })
     
     return matches
 
@@ -4,14 +4,10 @@ from nltk.tokenize import word_tokenize, sent_tokenize
 from nltk.stem import WordNetLemmatizer
 from textblob import TextBlob
 import re
-
-# Try to import spaCy (optional)
-try:
-    import spacy
-    SPACY_AVAILABLE = True
-except ImportError:
-    SPACY_AVAILABLE = False
-    spacy = None
+import threading
+from collections import OrderedDict
+from typing import Dict
+from core.spacy_cache import nlp, get_doc
 
 # Download required NLTK data
 try:
@@ -43,23 +39,48 @@ except LookupError:
         except:
             pass
 
-# Load spaCy model (optional)
-nlp = None
-if SPACY_AVAILABLE:
-    try:
-        nlp = spacy.load("en_core_web_sm")
-    except (OSError, IOError):
-        # Model not found or not installed
-        nlp = None
-
 lemmatizer = WordNetLemmatizer()
 stop_words = set(stopwords.words('english'))
 
+# Most recently preprocessed texts. Several analyzers preprocess the same
+# text within one request, so they share a single result; callers must
+# treat it as read-only.
+_PREPROCESS_CACHE_SIZE = 256
+_preprocess_cache: "OrderedDict[str, dict]" = OrderedDict()
+_preprocess_cache_lock = threading.Lock()
+# Per-text locks so concurrent callers wait for one computation
+_inflight_locks: Dict[str, threading.Lock] = {}
+
 def preprocess_text(text: str) -> dict:
     """
     Comprehensive text preprocessing pipeline.
     Returns tokenized, lemmatized, and POS-tagged text.
+    Results are cached per text and shared between callers.
     """
+    with _preprocess_cache_lock:
+        result = _preprocess_cache.get(text)
+        if result is not None:
+            _preprocess_cache.move_to_end(text)
+            return result
+        text_lock = _inflight_locks.setdefault(text, threading.Lock())
+    
+    try:
+        with text_lock:
+            with _preprocess_cache_lock:
+                result = _preprocess_cache.get(text)
+            if result is None:
+                result = _preprocess_text(text)
+                with _preprocess_cache_lock:
+                    _preprocess_cache[text] = result
+                    _preprocess_cache.move_to_end(text)
+                    if len(_preprocess_cache) > _PREPROCESS_CACHE_SIZE:
+                        _preprocess_cache.popitem(last=False)
+    finally:
+        with _preprocess_cache_lock:
+            _inflight_locks.pop(text, None)
+    return result
+
+def _preprocess_text(text: str) -> dict:
     if not text or not text.strip():
         return {
             "tokens": [],
@@ -91,7 +112,7 @@ def preprocess_text(text: str) -> dict:
     # Named Entity Recognition (if spaCy is available)
     entities = []
     if nlp:
-        doc = nlp(text)
+        doc = get_doc(text)
         entities = [
             {
                 "text": ent.text,
@@ -3,6 +3,7 @@ Text Rephrasing Engine using Pegasus and other models.
 Generates multiple fluent variants of corrected text.
 """
 from typing import List, Dict, Optional
+from core.lazy import Lazy
 
 # Try to import transformers
 try:
@@ -17,6 +18,7 @@ rephrase_pipeline = None
 pegasus_tokenizer = None
 pegasus_model = None
 
+@Lazy
 def load_rephrase_model():
     """Lazy load rephrasing model."""
     global rephrase_pipeline, pegasus_tokenizer, pegasus_model
@@ -0,0 +1,92 @@
+"""
+Request Batcher Module
+Coalesces concurrent requests into micro-batches so a batched model call
+serves several in-flight requests at once.
+"""
+import asyncio
+from typing import Any, Callable, List, Optional, Set, Tuple
+from core.executor import run_blocking
+from core.lazy import lazy_function
+
+class AsyncMicroBatcher:
+    """
+    Collect items submitted by concurrent requests and process them together.
+    
+    A batch is flushed when it reaches max_batch items, when its texts reach
+    max_tokens whitespace-separated tokens (if set), or max_wait_ms after its
+    first item arrived, whichever comes first. Capping tokens keeps one long
+    essay from being batched with many others into an oversized pass.
+    
+    batch_fn is a synchronous function mapping a list of inputs to a list of
+    outputs in the same order; it runs in the shared executor so the event
+    loop stays free.
+    """
+    
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        max_batch: int = 16,
+        max_wait_ms: float = 10,
+        max_tokens: Optional[int] = None
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self.max_tokens = max_tokens
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._pending_tokens = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # The loop only keeps weak references to tasks; hold running batches here
+        self._tasks: Set[asyncio.Task] = set()
+    
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if isinstance(item, str):
+            self._pending_tokens += len(item.split())
+        
+        if len(self._pending) >= self.max_batch or self._over_token_budget():
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        
+        return await future
+    
+    def _over_token_budget(self) -> bool:
+        return self.max_tokens is not None and self._pending_tokens >= self.max_tokens
+    
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        self._pending_tokens = 0
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        items = [item for item, _ in batch]
+        try:
+            results = await run_blocking(self.batch_fn, items)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+# Grammar detection shared by every endpoint: concurrent requests are
+# parsed in one batched spaCy pass
+grammar_batcher = AsyncMicroBatcher(
+    lazy_function("core.grammar_analysis", "detect_grammar_errors_batch"),
+    max_batch=16,
+    max_wait_ms=10,
+    max_tokens=4096
+)
@@ -0,0 +1,240 @@
+"""
+Response Cache Module
+In-process TTL + LRU cache for expensive endpoint responses, with an optional
+semantic tier that also serves near-identical texts (by embedding similarity).
+"""
+import functools
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+from config import settings
+from core.executor import run_blocking
+from core.singleflight import SingleFlight
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Sentinel returned by ResponseCache.get on a miss (None is a valid cached value)
+MISS = object()
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for wording-insensitive cache keys by collapsing whitespace.
+    Case is preserved because corrections depend on it ("i" vs "I").
+    """
+    return _WHITESPACE.sub(" ", text).strip()
+
+def _text_digest(text: str, normalize: bool = False) -> str:
+    if normalize:
+        text = normalize_text(text)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def _encode(text: str) -> Optional[np.ndarray]:
+    """Return a unit-length sentence embedding, or None if no model is available."""
+    from core.model_registry import get_sbert, encode
+    
+    if get_sbert() is None:
+        return None
+    try:
+        embedding = np.asarray(encode(normalize_text(text)), dtype=np.float32)
+    except Exception as e:
+        print(f"⚠️ Response cache embedding failed: {e}")
+        return None
+    norm = np.linalg.norm(embedding)
+    return embedding / norm if norm else None
+
+class ResponseCache:
+    """
+    Thread-safe TTL + LRU cache.
+    
+    Entries are keyed by any hashable key. Entries stored with a namespace
+    and an embedding can also be found by similarity via get_similar().
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        # namespace -> {key: embedding} for the semantic tier
+        self._embeddings: Dict[Hashable, Dict[Hashable, np.ndarray]] = {}
+        self._key_namespace: Dict[Hashable, Hashable] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+    
+    def get(self, key: Hashable, count_miss: bool = True) -> Any:
+        """
+        Return the cached value for key, or MISS.
+        Pass count_miss=False when a get_similar lookup follows a miss.
+        """
+        with self._lock:
+            value = self._get_locked(key)
+            if value is not MISS:
+                self.hits += 1
+            elif count_miss:
+                self.misses += 1
+            return value
+    
+    def get_similar(self, namespace: Hashable, embedding: np.ndarray, threshold: float) -> Any:
+        """Return the value of the most similar entry in namespace, or MISS."""
+        with self._lock:
+            value = MISS
+            candidates = self._embeddings.get(namespace)
+            if candidates:
+                keys = list(candidates)
+                similarities = np.stack([candidates[k] for k in keys]) @ embedding
+                best = int(np.argmax(similarities))
+                if similarities[best] >= threshold:
+                    value = self._get_locked(keys[best])
+            if value is MISS:
+                self.misses += 1
+            else:
+                self.semantic_hits += 1
+            return value
+    
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        namespace: Hashable = None,
+        embedding: Optional[np.ndarray] = None
+    ) -> None:
+        """Store value under key, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            if embedding is not None:
+                self._embeddings.setdefault(namespace, {})[key] = embedding
+                self._key_namespace[key] = namespace
+            while len(self._entries) > self.maxsize:
+                oldest, _ = self._entries.popitem(last=False)
+                self._forget_embedding(oldest)
+    
+    def record_miss(self) -> None:
+        """Count a miss for a lookup that did not go through get/get_similar."""
+        with self._lock:
+            self.misses += 1
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._embeddings.clear()
+            self._key_namespace.clear()
+    
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.semantic_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.hits + self.semantic_hits) / lookups, 3) if lookups else 0.0
+            }
+    
+    def _get_locked(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISS
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self._forget_embedding(key)
+            return MISS
+        self._entries.move_to_end(key)
+        return value
+    
+    def _forget_embedding(self, key: Hashable) -> None:
+        namespace = self._key_namespace.pop(key, None)
+        if namespace is not None:
+            self._embeddings.get(namespace, {}).pop(key, None)
+
+# Shared cache for endpoint responses
+response_cache = ResponseCache()
+
+# Aggregate dashboard metrics polled by the UI; short-lived so they stay fresh
+metrics_cache = ResponseCache(maxsize=256, ttl=settings.METRICS_CACHE_TTL)
+
+# Concurrent misses for the same key share a single endpoint run
+_singleflight = SingleFlight()
+
+def cached_endpoint(
+    name: str,
+    key_fields: Sequence[str] = ("text", "use_ai"),
+    sim_threshold: Optional[float] = None,
+    cache: ResponseCache = response_cache,
+    refresh_field: Optional[str] = None,
+    normalize_whitespace: bool = False
+) -> Callable:
+    """
+    Cache an async endpoint's response.
+    
+    The cache key is the endpoint name plus the values of key_fields, looked
+    up first among the endpoint's keyword arguments (e.g. path parameters) and
+    then on its `request` body. A "text" field is hashed exactly as given,
+    since corrections and error offsets depend on its spacing; with
+    normalize_whitespace, runs of whitespace are collapsed first.
+    
+    If sim_threshold is set, a miss falls back to the most similar cached text
+    for the same endpoint and other fields, when the cosine similarity of their
+    sentence embeddings is at least sim_threshold. Only use this for endpoints
+    whose output does not depend on exact wording (e.g. classification).
+    
+    Concurrent misses for the same key are coalesced: only the first runs the
+    endpoint and the others await its result.
+    
+    If refresh_field names a keyword argument, a truthy value skips the lookup
+    and replaces the cached entry with a fresh result.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request = kwargs.get("request")
+            values = {}
+            for field in key_fields:
+                values[field] = kwargs[field] if field in kwargs else getattr(request, field, None)
+            
+            text = values.get("text")
+            key_parts = tuple(
+                _text_digest(value, normalize_whitespace) if field == "text" and isinstance(value, str) else value
+                for field, value in values.items()
+            )
+            key = (name,) + key_parts
+            
+            refresh = refresh_field is not None and bool(kwargs.get(refresh_field))
+            semantic = sim_threshold is not None and isinstance(text, str) and not refresh
+            if refresh:
+                cache.record_miss()
+            else:
+                cached = cache.get(key, count_miss=not semantic)
+                if cached is not MISS:
+                    return cached
+            
+            namespace = None
+            embedding = None
+            if semantic:
+                namespace = (name,) + tuple(v for f, v in values.items() if f != "text")
+                # Sentence-BERT forward pass; keep it off the event loop
+                embedding = await run_blocking(_encode, text)
+                if embedding is not None:
+                    cached = cache.get_similar(namespace, embedding, sim_threshold)
+                    if cached is not MISS:
+                        return cached
+                else:
+                    cache.record_miss()
+            
+            async def compute():
+                result = await func(*args, **kwargs)
+                cache.set(key, result, namespace=namespace, embedding=embedding)
+                return result
+            
+            return await _singleflight.do(key, compute)
+        return wrapper
+    return decorator
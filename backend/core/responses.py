@@ -0,0 +1,18 @@
+"""
+Response Classes Module
+JSON response class shared by the routers: orjson when installed,
+the standard library encoder otherwise.
+"""
+from fastapi.responses import JSONResponse
+
+# Try to import orjson (optional, ~3x faster JSON encoding)
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+    ORJSONResponse = None
+
+FastJSONResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
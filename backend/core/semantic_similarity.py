@@ -3,35 +3,11 @@ Semantic Similarity Scoring - Compares learner-written sentences with target ans
 """
 from typing import Dict, List, Tuple
 import numpy as np
-
-# Try to import sentence transformers
-try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
-    SentenceTransformer = None
-
-# Global model
-sbert_model = None
+from core.model_registry import SENTENCE_TRANSFORMERS_AVAILABLE, get_sbert, encode
 
 def load_similarity_model():
-    """Lazy load sentence transformer model."""
-    global sbert_model
-    
-    if not SENTENCE_TRANSFORMERS_AVAILABLE:
-        return False
-    
-    if sbert_model is not None:
-        return True
-    
-    try:
-        sbert_model = SentenceTransformer('all-MiniLM-L6-v2')
-        print("✅ Semantic similarity model loaded")
-        return True
-    except Exception as e:
-        print(f"⚠️ Could not load similarity model: {e}")
-        return False
+    """Check that the shared sentence transformer model is loaded."""
+    return get_sbert() is not None
 
 def calculate_semantic_similarity(text1: str, text2: str) -> float:
     """
@@ -53,7 +29,7 @@ def calculate_semantic_similarity(text1: str, text2: str) -> float:
     # Use sentence transformers if available
     if SENTENCE_TRANSFORMERS_AVAILABLE and load_similarity_model():
         try:
-            embeddings = sbert_model.encode([text1, text2])
+            embeddings = encode([text1, text2])
             similarity = np.dot(embeddings[0], embeddings[1]) / (
                 np.linalg.norm(embeddings[0]) * np.linalg.norm(embeddings[1])
             )
@@ -64,6 +40,50 @@ def calculate_semantic_similarity(text1: str, text2: str) -> float:
     # Fallback: Simple word overlap
     return calculate_word_overlap(text1, text2)
 
+def calculate_semantic_similarities(text: str, others: List[str]) -> np.ndarray:
+    """
+    Calculate the semantic similarity between text and each of others (0-1).
+    
+    Equivalent to calling calculate_semantic_similarity for every pair, but
+    all texts are embedded in one batch and scored with a single matmul.
+    
+    Args:
+        text: Text to compare
+        others: Texts to compare it against
+    
+    Returns:
+        Array of similarity scores, one per entry in others
+    """
+    similarities = np.zeros(len(others), dtype=np.float64)
+    if not text or not others:
+        return similarities
+    
+    key = text.lower().strip()
+    pending = []
+    for i, other in enumerate(others):
+        if not other:
+            continue
+        if other.lower().strip() == key:
+            similarities[i] = 1.0
+        else:
+            pending.append(i)
+    if not pending:
+        return similarities
+    
+    if SENTENCE_TRANSFORMERS_AVAILABLE and load_similarity_model():
+        try:
+            embeddings = np.asarray(encode([text] + [others[i] for i in pending]), dtype=np.float64)
+            embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+            similarities[pending] = embeddings[1:] @ embeddings[0]
+            return similarities
+        except Exception as e:
+            print(f"Error calculating semantic similarity: {e}")
+    
+    # Fallback: Simple word overlap
+    for i in pending:
+        similarities[i] = calculate_word_overlap(text, others[i])
+    return similarities
+
 def calculate_word_overlap(text1: str, text2: str) -> float:
     """Calculate word overlap similarity (fallback)."""
     from core.preprocessing import preprocess_text
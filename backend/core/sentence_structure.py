@@ -8,21 +8,7 @@ from textblob import TextBlob
 import nltk
 from nltk.tokenize import word_tokenize, sent_tokenize
 from nltk.tag import pos_tag
-
-# Try to import spaCy
-try:
-    import spacy
-    SPACY_AVAILABLE = True
-except ImportError:
-    SPACY_AVAILABLE = False
-    spacy = None
-
-nlp = None
-if SPACY_AVAILABLE:
-    try:
-        nlp = spacy.load("en_core_web_sm")
-    except (OSError, IOError):
-        nlp = None
+from .spacy_cache import nlp, get_doc
 
 def analyze_sentence_structure(text: str) -> Dict:
     """
@@ -43,7 +29,7 @@ def analyze_sentence_structure(text: str) -> Dict:
         
         # Use spaCy for dependency parsing if available
         if nlp:
-            doc = nlp(sentence)
+            doc = get_doc(sentence)
             structure_errors = detect_structure_errors_spacy(doc, sentence)
             errors.extend(structure_errors)
         else:
@@ -0,0 +1,59 @@
+"""
+Singleflight Module
+Coalesces identical in-flight async calls so concurrent duplicates share one run.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+class _LeaderCancelled(Exception):
+    """Set on a shared future when the caller running the work was cancelled."""
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls by key.
+    
+    The first caller for a key runs the work; callers arriving while it is
+    still running await the same result (or exception) instead of running
+    it again. Nothing is remembered once the call completes - pair this
+    with a cache for that. If the running caller is cancelled (e.g. its
+    client disconnected), the waiting callers retry and one of them runs
+    the work instead.
+    """
+    
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+    
+    async def do(self, key: Hashable, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run coro_factory() for key, or join the run already in flight."""
+        future = self._inflight.get(key)
+        while future is not None:
+            try:
+                # Shield so a cancelled follower doesn't cancel the shared run
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                # The leader was cancelled; rejoin, or lead if nobody else has
+                future = self._inflight.get(key)
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await coro_factory()
+        except asyncio.CancelledError:
+            # Cancelling the future would cancel every follower too
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an exception with no followers isn't reported as unhandled
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def inflight(self) -> int:
+        """Number of keys currently being computed."""
+        return len(self._inflight)
@@ -0,0 +1,75 @@
+"""
+Shared spaCy pipeline and parsed-document cache.
+Loads the spaCy model once and reuses parsed Docs across analyzers, so a
+text that passes through several modules is only parsed a single time.
+"""
+import threading
+from collections import OrderedDict
+from config import settings
+
+# Try to import spaCy (optional)
+try:
+    import spacy
+    SPACY_AVAILABLE = True
+except ImportError:
+    SPACY_AVAILABLE = False
+    spacy = None
+
+# Load spaCy model (optional)
+nlp = None
+if SPACY_AVAILABLE:
+    try:
+        nlp = spacy.load(settings.SPACY_MODEL)
+    except (OSError, IOError):
+        # Model not found or not installed
+        nlp = None
+
+# Most recently parsed texts and their Docs
+_DOC_CACHE_SIZE = 256
+_doc_cache: "OrderedDict[str, object]" = OrderedDict()
+_doc_cache_lock = threading.Lock()
+
+def get_doc(text: str):
+    """
+    Return the spaCy Doc for text, parsing it only if it is not cached.
+    Returns None when spaCy is not available.
+    """
+    if nlp is None:
+        return None
+    
+    with _doc_cache_lock:
+        doc = _doc_cache.get(text)
+        if doc is not None:
+            _doc_cache.move_to_end(text)
+            return doc
+    
+    doc = nlp(text)
+    
+    with _doc_cache_lock:
+        _doc_cache[text] = doc
+        _doc_cache.move_to_end(text)
+        if len(_doc_cache) > _DOC_CACHE_SIZE:
+            _doc_cache.popitem(last=False)
+    return doc
+
+def prime_docs(texts, batch_size: int = 50) -> None:
+    """
+    Parse several texts in one nlp.pipe call and store them in the cache.
+    Later get_doc calls for these texts are served from the cache.
+    """
+    if nlp is None:
+        return
+    
+    with _doc_cache_lock:
+        pending = list(dict.fromkeys(t for t in texts if t and t not in _doc_cache))
+    if not pending:
+        return
+    
+    # n_process stays at 1: spaCy releases the GIL in its C code, and extra
+    # processes cost more than they save on batches of this size.
+    for text, doc in zip(pending, nlp.pipe(pending, batch_size=batch_size)):
+        with _doc_cache_lock:
+            _doc_cache[text] = doc
+            _doc_cache.move_to_end(text)
+            if len(_doc_cache) > _DOC_CACHE_SIZE:
+                _doc_cache.popitem(last=False)
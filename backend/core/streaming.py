@@ -0,0 +1,73 @@
+"""
+Streaming Module
+Helpers for streaming LLM output to clients as NDJSON.
+"""
+import json
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator
+from fastapi.responses import StreamingResponse
+from core.executor import run_blocking
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# GZipMiddleware buffers streamed chunks until enough compressed output
+# accumulates; an explicit Content-Encoding makes it pass the stream through
+_NDJSON_HEADERS = {"Content-Encoding": "identity", "Cache-Control": "no-cache"}
+
+_EXHAUSTED = object()
+
+def batch_chunks(deltas: Iterable[str], min_batch: int = 1, max_batch: int = 50, growth: int = 3) -> Iterator[str]:
+    """
+    Group token deltas into progressively larger chunks.
+    
+    The first chunk is sent as soon as possible for a fast first token; later
+    chunks grow by `growth` up to `max_batch` tokens to amortize HTTP framing.
+    
+    Args:
+        deltas: Token deltas from the model
+        min_batch: Tokens in the first chunk
+        max_batch: Upper bound on tokens per chunk
+        growth: Multiplier applied to the chunk size after each chunk
+    
+    Yields:
+        Joined text chunks
+    """
+    size = min_batch
+    buffer = []
+    for delta in deltas:
+        if not delta:
+            continue
+        buffer.append(delta)
+        if len(buffer) >= size:
+            yield "".join(buffer)
+            buffer = []
+            size = min(size * growth, max_batch)
+    if buffer:
+        yield "".join(buffer)
+
+async def aiter_blocking(iterator: Iterator[Any]) -> AsyncIterator[Any]:
+    """Consume a blocking iterator in the shared executor without stalling the event loop."""
+    while True:
+        item = await run_blocking(next, iterator, _EXHAUSTED)
+        if item is _EXHAUSTED:
+            break
+        yield item
+
+async def to_ndjson(events: AsyncIterator[Dict]) -> AsyncIterator[str]:
+    """
+    Encode streamed events as newline-delimited JSON.
+    
+    Failures after the response has started are reported as a final
+    `error` event, since the status code has already been sent.
+    """
+    try:
+        async for event in events:
+            yield json.dumps(event, default=str) + "\n"
+    except Exception as e:
+        # HTTPException carries its message in .detail; str() is empty
+        detail = getattr(e, "detail", None) or str(e)
+        print(f"⚠️ Streaming failed: {detail}")
+        yield json.dumps({"type": "error", "detail": detail}) + "\n"
+
+def ndjson_response(events: AsyncIterator[Dict]) -> StreamingResponse:
+    """Wrap an event stream in an uncompressed NDJSON StreamingResponse."""
+    return StreamingResponse(to_ndjson(events), media_type=NDJSON_MEDIA_TYPE, headers=_NDJSON_HEADERS)
@@ -2,12 +2,79 @@
 Long Text Summarizer + Reviewer Module
 Summarizes essays and provides improvement points.
 """
-from typing import Dict, List, Optional
-from core.ai_service import generate_ai_response, is_ai_available
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional
+from core.ai_service import generate_ai_response, stream_ai_response, is_ai_available
 from core.grammar_analysis import detect_grammar_errors, correct_grammar
 from core.writing_quality_score import calculate_writing_quality_score
 from core.readability import calculate_readability
 from core.lexical_semantic import calculate_lexical_diversity
+from core.executor import run_blocking
+from core.streaming import aiter_blocking, batch_chunks
+
+SUMMARY_SYSTEM_PROMPT = "You are a text summarization expert. Create concise, accurate summaries."
+
+def _summary_prompt(text: str) -> str:
+    return f"""Summarize this text in 2-3 sentences, capturing the main ideas:
+
+{text}
+
+Summary:"""
+
+def _too_short_result() -> Dict:
+    return {
+        "summary": "",
+        "key_points": [],
+        "improvements": [],
+        "word_count": 0,
+        "error": "Text must be at least 50 characters"
+    }
+
+def _analyze_text(text: str, use_ai: bool) -> Dict:
+    """Run the grammar, quality and readability analysis the review is built on."""
+    sentences = text.split('.')
+    return {
+        "word_count": len(text.split()),
+        "sentences": sentences,
+        "sentence_count": len([s for s in sentences if s.strip()]),
+        "grammar_errors": detect_grammar_errors(text),
+        "quality_score": calculate_writing_quality_score(text, use_ai=use_ai),
+        "readability": calculate_readability(text)
+    }
+
+def _complete_review(text: str, summary: Optional[str], analysis: Dict, use_ai: bool) -> Dict:
+    """Fill in a fallback summary if needed, then add key points and improvements."""
+    sentences = analysis["sentences"]
+    
+    # Fallback: extract first and last sentences
+    if not summary:
+        if analysis["sentence_count"] >= 2:
+            summary = f"{sentences[0].strip()}. {sentences[-1].strip()}."
+        else:
+            summary = text[:200] + "..." if len(text) > 200 else text
+    
+    # Extract key points
+    key_points = extract_key_points(text, use_ai=use_ai)
+    
+    # Generate improvement suggestions
+    improvements = generate_improvement_suggestions(
+        text,
+        analysis["grammar_errors"],
+        analysis["quality_score"],
+        analysis["readability"],
+        use_ai=use_ai
+    )
+    
+    return {
+        "summary": summary.strip(),
+        "key_points": key_points,
+        "improvements": improvements,
+        "word_count": analysis["word_count"],
+        "sentence_count": analysis["sentence_count"],
+        "quality_score": analysis["quality_score"].get("overall_score", 0),
+        "grammar_errors": len(analysis["grammar_errors"]),
+        "readability": analysis["readability"]
+    }
 
 def summarize_and_review(text: str, use_ai: bool = True) -> Dict:
     """
@@ -21,71 +88,60 @@ def summarize_and_review(text: str, use_ai: bool = True) -> Dict:
         Dictionary with summary, key points, and improvement suggestions
     """
     if not text or len(text.strip()) < 50:
-        return {
-            "summary": "",
-            "key_points": [],
-            "improvements": [],
-            "word_count": 0,
-            "error": "Text must be at least 50 characters"
-        }
-    
-    word_count = len(text.split())
-    sentences = text.split('.')
-    sentence_count = len([s for s in sentences if s.strip()])
+        return _too_short_result()
     
     # Analyze the text
-    grammar_errors = detect_grammar_errors(text)
-    quality_score = calculate_writing_quality_score(text, use_ai=use_ai)
-    readability = calculate_readability(text)
+    analysis = _analyze_text(text, use_ai)
     
     # Generate summary using AI
     summary = ""
     if use_ai and is_ai_available():
         try:
-            prompt = f"""Summarize this text in 2-3 sentences, capturing the main ideas:
-
-{text}
-
-Summary:"""
-            
             summary = generate_ai_response(
-                prompt,
-                "You are a text summarization expert. Create concise, accurate summaries.",
+                _summary_prompt(text),
+                SUMMARY_SYSTEM_PROMPT,
                 max_tokens=150,
                 temperature=0.5
             )
         except Exception as e:
             print(f"⚠️ AI summarization failed: {e}")
     
-    # Fallback: extract first and last sentences
-    if not summary:
-        if sentence_count >= 2:
-            summary = f"{sentences[0].strip()}. {sentences[-1].strip()}."
-        else:
-            summary = text[:200] + "..." if len(text) > 200 else text
+    return _complete_review(text, summary, analysis, use_ai)
+
+async def astream_summary_and_review(text: str, use_ai: bool = True) -> AsyncIterator[Dict]:
+    """
+    Streaming variant of summarize_and_review.
     
-    # Extract key points
-    key_points = extract_key_points(text, use_ai=use_ai)
+    Yields `token` events as the summary is generated, followed by a
+    `result` event carrying the same dictionary the sync variant returns.
+    """
+    if not text or len(text.strip()) < 50:
+        yield {"type": "result", "data": _too_short_result()}
+        return
     
-    # Generate improvement suggestions
-    improvements = generate_improvement_suggestions(
-        text,
-        grammar_errors,
-        quality_score,
-        readability,
-        use_ai=use_ai
-    )
+    # The analysis runs while the summary streams, so the first token is not
+    # held back by grammar detection and quality scoring
+    analysis_task = asyncio.ensure_future(run_blocking(_analyze_text, text, use_ai))
+    try:
+        parts = []
+        if use_ai and is_ai_available():
+            deltas = stream_ai_response(
+                _summary_prompt(text),
+                SUMMARY_SYSTEM_PROMPT,
+                max_tokens=150,
+                temperature=0.5
+            )
+            async for chunk in aiter_blocking(batch_chunks(deltas)):
+                parts.append(chunk)
+                yield {"type": "token", "text": chunk}
+        
+        analysis = await analysis_task
+    finally:
+        # Client disconnected or the stream failed: stop waiting on the analysis
+        analysis_task.cancel()
     
-    return {
-        "summary": summary.strip(),
-        "key_points": key_points,
-        "improvements": improvements,
-        "word_count": word_count,
-        "sentence_count": sentence_count,
-        "quality_score": quality_score.get("overall_score", 0),
-        "grammar_errors": len(grammar_errors),
-        "readability": readability
-    }
+    result = await run_blocking(_complete_review, text, "".join(parts), analysis, use_ai)
+    yield {"type": "result", "data": result}
 
 def extract_key_points(text: str, use_ai: bool = True) -> List[str]:
     """Extract key points from the text."""
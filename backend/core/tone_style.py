@@ -3,6 +3,21 @@ from typing import Dict, List
 import re
 from collections import Counter
 
+# Formality indicators, compiled once; each pattern is counted separately
+_FORMAL_INDICATORS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b(however|therefore|furthermore|moreover|consequently|nevertheless)\b',
+    r'\b(utilize|facilitate|implement|demonstrate|analyze)\b',
+    r'\b(according to|in accordance with|with regard to)\b'
+))
+
+_INFORMAL_INDICATORS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b(yeah|yep|nope|gonna|wanna|gotta)\b',
+    r'\b(cool|awesome|sucks|dude|hey)\b',
+    r'(!{2,}|\?{2,})'  # Multiple exclamation/question marks
+))
+
+_PASSIVE_INDICATOR = re.compile(r'\b(was|were|is|are|been)\s+\w+ed\b', re.IGNORECASE)
+
 def analyze_tone_and_style(text: str) -> Dict:
     """
     Analyze writing tone, style, and sentiment.
@@ -31,20 +46,8 @@ def analyze_tone_and_style(text: str) -> Dict:
         tone = "neutral"
     
     # Analyze formality
-    formal_indicators = [
-        r'\b(however|therefore|furthermore|moreover|consequently|nevertheless)\b',
-        r'\b(utilize|facilitate|implement|demonstrate|analyze)\b',
-        r'\b(according to|in accordance with|with regard to)\b'
-    ]
-    
-    informal_indicators = [
-        r'\b(yeah|yep|nope|gonna|wanna|gotta)\b',
-        r'\b(cool|awesome|sucks|dude|hey)\b',
-        r'(!{2,}|\?{2,})'  # Multiple exclamation/question marks
-    ]
-    
-    formal_count = sum(len(re.findall(pattern, text, re.IGNORECASE)) for pattern in formal_indicators)
-    informal_count = sum(len(re.findall(pattern, text, re.IGNORECASE)) for pattern in informal_indicators)
+    formal_count = sum(len(pattern.findall(text)) for pattern in _FORMAL_INDICATORS)
+    informal_count = sum(len(pattern.findall(text)) for pattern in _INFORMAL_INDICATORS)
     
     if formal_count > informal_count * 2:
         formality = "formal"
@@ -85,7 +88,7 @@ def analyze_tone_and_style(text: str) -> Dict:
         })
     
     # Check for passive voice (simplified)
-    passive_indicators = re.findall(r'\b(was|were|is|are|been)\s+\w+ed\b', text, re.IGNORECASE)
+    passive_indicators = _PASSIVE_INDICATOR.findall(text)
     if len(passive_indicators) > len(sentences) * 0.3:
         style_feedback.append({
             "type": "passive_voice",
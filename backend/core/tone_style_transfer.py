@@ -2,8 +2,11 @@
 Tone and Style Transfer Module
 Rephrase text into different tones: Formal, Friendly, Academic, Creative, Concise
 """
-from typing import Dict, List, Optional
-from core.ai_service import generate_ai_response, is_ai_available, rephrase_with_ai
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from core.ai_service import generate_ai_response, stream_ai_response, is_ai_available, rephrase_with_ai
+from core.executor import run_blocking
+from core.streaming import aiter_blocking, batch_chunks
 
 # Tone definitions
 TONE_STYLES = {
@@ -69,18 +72,26 @@ TONE_STYLES = {
     }
 }
 
-def transfer_tone(text: str, target_tone: str, use_ai: bool = True) -> Dict:
-    """
-    Rephrase text into a different tone/style.
+def _tone_prompts(text: str, target_tone: str, tone_info: Dict) -> Tuple[str, str]:
+    """Build the (prompt, system prompt) pair for an AI tone transfer."""
+    system_prompt = f"""You are a professional writing style expert. Rephrase text to match the {target_tone} tone.
+            
+Target Tone: {target_tone.upper()}
+Description: {tone_info['description']}
+Characteristics: {', '.join(tone_info['characteristics'])}
+
+Maintain the original meaning while adapting the tone."""
     
-    Args:
-        text: Input text to rephrase
-        target_tone: Target tone (formal, friendly, academic, creative, concise, casual)
-        use_ai: Whether to use AI for tone transfer
+    prompt = f"""Rephrase the following text in a {target_tone} tone:
+
+Original: {text}
+
+Rephrased ({target_tone} tone):"""
     
-    Returns:
-        Dictionary with rephrased text and tone analysis
-    """
+    return prompt, system_prompt
+
+def _validate_tone_request(text: str, target_tone: str) -> Optional[Dict]:
+    """Return the failure response for empty text or an unknown tone, else None."""
     if not text or not text.strip():
         return {
             "original": text,
@@ -89,56 +100,31 @@ def transfer_tone(text: str, target_tone: str, use_ai: bool = True) -> Dict:
             "success": False
         }
     
-    target_tone = target_tone.lower()
-    
-    if target_tone not in TONE_STYLES:
+    if target_tone.lower() not in TONE_STYLES:
         return {
             "original": text,
             "rephrased": text,
-            "target_tone": target_tone,
+            "target_tone": target_tone.lower(),
             "success": False,
-            "error": f"Unknown tone: {target_tone}. Available: {list(TONE_STYLES.keys())}"
+            "error": f"Unknown tone: {target_tone.lower()}. Available: {list(TONE_STYLES.keys())}"
         }
     
-    tone_info = TONE_STYLES[target_tone]
-    
-    # Use AI for tone transfer
-    if use_ai and is_ai_available():
-        try:
-            system_prompt = f"""You are a professional writing style expert. Rephrase text to match the {target_tone} tone.
-            
-Target Tone: {target_tone.upper()}
-Description: {tone_info['description']}
-Characteristics: {', '.join(tone_info['characteristics'])}
-
-Maintain the original meaning while adapting the tone."""
-            
-            prompt = f"""Rephrase the following text in a {target_tone} tone:
+    return None
 
-Original: {text}
+def _ai_tone_result(text: str, target_tone: str, tone_info: Dict, ai_rephrased: Optional[str]) -> Optional[Dict]:
+    if ai_rephrased and ai_rephrased.strip():
+        return {
+            "original": text,
+            "rephrased": ai_rephrased.strip(),
+            "target_tone": target_tone,
+            "tone_info": tone_info,
+            "success": True,
+            "method": "ai_enhanced"
+        }
+    return None
 
-Rephrased ({target_tone} tone):"""
-            
-            ai_rephrased = generate_ai_response(
-                prompt,
-                system_prompt,
-                max_tokens=300,
-                temperature=0.7
-            )
-            
-            if ai_rephrased and ai_rephrased.strip():
-                return {
-                    "original": text,
-                    "rephrased": ai_rephrased.strip(),
-                    "target_tone": target_tone,
-                    "tone_info": tone_info,
-                    "success": True,
-                    "method": "ai_enhanced"
-                }
-        except Exception as e:
-            print(f"⚠️ AI tone transfer failed: {e}")
-    
-    # Fallback: Use rephrase_with_ai from ai_service
+def _fallback_tone_transfer(text: str, target_tone: str, tone_info: Dict) -> Dict:
+    """Rephrase via rephrase_with_ai, or return the original text if that fails too."""
     try:
         rephrased = rephrase_with_ai(text, style=target_tone)
         if rephrased and rephrased != text:
@@ -163,6 +149,78 @@ Rephrased ({target_tone} tone):"""
         "error": "Tone transfer unavailable"
     }
 
+def transfer_tone(text: str, target_tone: str, use_ai: bool = True) -> Dict:
+    """
+    Rephrase text into a different tone/style.
+    
+    Args:
+        text: Input text to rephrase
+        target_tone: Target tone (formal, friendly, academic, creative, concise, casual)
+        use_ai: Whether to use AI for tone transfer
+    
+    Returns:
+        Dictionary with rephrased text and tone analysis
+    """
+    invalid = _validate_tone_request(text, target_tone)
+    if invalid:
+        return invalid
+    
+    target_tone = target_tone.lower()
+    tone_info = TONE_STYLES[target_tone]
+    
+    # Use AI for tone transfer
+    if use_ai and is_ai_available():
+        try:
+            prompt, system_prompt = _tone_prompts(text, target_tone, tone_info)
+            
+            ai_rephrased = generate_ai_response(
+                prompt,
+                system_prompt,
+                max_tokens=300,
+                temperature=0.7
+            )
+            
+            result = _ai_tone_result(text, target_tone, tone_info, ai_rephrased)
+            if result:
+                return result
+        except Exception as e:
+            print(f"⚠️ AI tone transfer failed: {e}")
+    
+    # Fallback: Use rephrase_with_ai from ai_service
+    return _fallback_tone_transfer(text, target_tone, tone_info)
+
+async def astream_tone_transfer(text: str, target_tone: str, use_ai: bool = True) -> AsyncIterator[Dict]:
+    """
+    Streaming variant of transfer_tone.
+    
+    Yields `token` events as the rephrased text is generated, followed by a
+    `result` event carrying the same dictionary the sync variant returns.
+    """
+    invalid = _validate_tone_request(text, target_tone)
+    if invalid:
+        yield {"type": "result", "data": invalid}
+        return
+    
+    target_tone = target_tone.lower()
+    tone_info = TONE_STYLES[target_tone]
+    
+    if use_ai and is_ai_available():
+        prompt, system_prompt = _tone_prompts(text, target_tone, tone_info)
+        parts = []
+        deltas = stream_ai_response(prompt, system_prompt, max_tokens=300, temperature=0.7)
+        async for chunk in aiter_blocking(batch_chunks(deltas)):
+            parts.append(chunk)
+            yield {"type": "token", "text": chunk}
+        
+        result = _ai_tone_result(text, target_tone, tone_info, "".join(parts))
+        if result:
+            yield {"type": "result", "data": result}
+            return
+    
+    result = await run_blocking(_fallback_tone_transfer, text, target_tone, tone_info)
+    yield {"type": "result", "data": result}
+
+@lru_cache(maxsize=1)
 def get_available_tones() -> List[Dict]:
     """Get list of available tone styles."""
     return [
@@ -2,12 +2,113 @@
 AI Feedback Scoring Module
 Provides overall Writing Quality Score (0-100) considering fluency, clarity, and coherence.
 """
-from typing import Dict, Optional
+import asyncio
+import bisect
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 from core.grammar_analysis import detect_grammar_errors, correct_grammar
 from core.readability import calculate_readability
 from core.lexical_semantic import calculate_lexical_diversity, analyze_semantic_coherence
 from core.tone_style import analyze_tone_and_style
 from core.contextual_grammar import analyze_paragraph_coherence
+from core.spacy_cache import prime_docs
+from core.executor import run_blocking
+
+# LRU cache of deterministic score results, keyed by a digest of the text.
+# AI feedback varies between calls, so it is never cached.
+_SCORE_CACHE_SIZE = 1024
+_score_cache: "OrderedDict[str, Dict]" = OrderedDict()
+_score_cache_lock = threading.Lock()
+
+def _text_key(text: str) -> str:
+    """Return a compact cache key for the given text."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+def _get_cached_score(key: str) -> Optional[Dict]:
+    """Look up a cached score and mark it as most recently used."""
+    with _score_cache_lock:
+        cached = _score_cache.get(key)
+        if cached is not None:
+            _score_cache.move_to_end(key)
+        return cached
+
+def _store_cached_score(key: str, result: Dict) -> None:
+    """Store a score result, evicting the least recently used entry when full."""
+    with _score_cache_lock:
+        _score_cache[key] = result
+        _score_cache.move_to_end(key)
+        if len(_score_cache) > _SCORE_CACHE_SIZE:
+            _score_cache.popitem(last=False)
+
+def _readability_score_for_flesch(flesch_score: float) -> float:
+    """Map a Flesch Reading Ease score to a 0-100 readability component score."""
+    # Flesch score: 0-30 (very difficult) to 90-100 (very easy)
+    # For writing quality, we want moderate difficulty (50-70 is good)
+    # Adjust: 50-70 range gets high score
+    if 50 <= flesch_score <= 70:
+        readability_score = 100
+    elif 30 <= flesch_score < 50:
+        readability_score = 70 + (flesch_score - 30) * 1.5  # 70-100
+    elif 70 < flesch_score <= 90:
+        readability_score = 100 - (flesch_score - 70) * 1.5  # 100-70
+    else:
+        readability_score = max(0, 100 - abs(flesch_score - 60) * 2)
+    return max(0, min(100, readability_score))
+
+# Precomputed readability scores for Flesch values 10.00-110.00 in steps of
+# 0.01 (calculate_readability rounds to 2 decimals, so lookups are exact).
+# Scores are 0 everywhere outside that range, so indexes are simply clamped.
+_FLESCH_LUT_MIN = 10
+_FLESCH_LUT_STEPS = 100
+_FLESCH_LUT = np.array([
+    _readability_score_for_flesch((_FLESCH_LUT_MIN * _FLESCH_LUT_STEPS + i) / _FLESCH_LUT_STEPS)
+    for i in range(100 * _FLESCH_LUT_STEPS + 1)
+], dtype=np.float64)
+
+def lookup_readability_score(flesch_score):
+    """
+    Look up readability component scores for one Flesch score or an array of them.
+    
+    Returns a float for scalar input and a numpy array for array input.
+    """
+    index = np.rint((np.asarray(flesch_score, dtype=np.float64) - _FLESCH_LUT_MIN) * _FLESCH_LUT_STEPS)
+    index = np.clip(index, 0, len(_FLESCH_LUT) - 1).astype(np.intp)
+    scores = _FLESCH_LUT[index]
+    return float(scores) if scores.ndim == 0 else scores
+
+# Texts shorter than this are not run through the NLP scorers.
+MIN_SCORABLE_WORDS = 5
+
+def _trivial_response(feedback: str, word_count: int = 0, sentence_count: int = 0) -> Dict:
+    """Response for text that is empty or too short to score."""
+    return {
+        "overall_score": 0,
+        "grade": "F",
+        "components": {},
+        "feedback": feedback,
+        "ai_feedback": None,
+        "word_count": word_count,
+        "sentence_count": sentence_count
+    }
+
+def _split_scorable(text: str) -> Tuple[List[str], Optional[Dict]]:
+    """Split text into words; also return the response to send instead if it is empty or too short."""
+    if not text or not text.strip():
+        return [], _trivial_response("Text is empty")
+    
+    words = text.split()
+    word_count = len(words)
+    if word_count < MIN_SCORABLE_WORDS:
+        return words, _trivial_response(
+            f"Text is too short to score. Write at least {MIN_SCORABLE_WORDS} words.",
+            word_count=word_count,
+            sentence_count=len([s for s in text.split('.') if s.strip()])
+        )
+    return words, None
 
 def calculate_writing_quality_score(text: str, use_ai: bool = True) -> Dict:
     """
@@ -27,64 +128,139 @@ def calculate_writing_quality_score(text: str, use_ai: bool = True) -> Dict:
     Returns:
         Dictionary with overall score, component scores, and feedback
     """
-    if not text or not text.strip():
-        return {
-            "overall_score": 0,
-            "components": {},
-            "feedback": "Text is empty",
-            "grade": "F"
-        }
-    
-    # 1. Grammar & Correctness (30%)
+    words, trivial = _split_scorable(text)
+    if trivial is not None:
+        return trivial
+    
+    key = _text_key(text)
+    result = _get_cached_score(key)
+    if result is None:
+        result = _score_components(text, words)
+        _store_cached_score(key, result)
+    result = copy.deepcopy(result)
+    
+    result["ai_feedback"] = _ai_feedback(text, result["overall_score"]) if use_ai else None
+    return result
+
+async def acalculate_writing_quality_score(text: str, use_ai: bool = True) -> Dict:
+    """
+    Async variant of calculate_writing_quality_score for request handlers.
+    
+    On a cache miss the five component scorers run concurrently in the
+    shared executor instead of one after another.
+    """
+    words, trivial = _split_scorable(text)
+    if trivial is not None:
+        return trivial
+    
+    key = _text_key(text)
+    result = _get_cached_score(key)
+    if result is None:
+        result = await _ascore_components(text, words)
+        _store_cached_score(key, result)
+    result = copy.deepcopy(result)
+    
+    result["ai_feedback"] = await run_blocking(_ai_feedback, text, result["overall_score"]) if use_ai else None
+    return result
+
+def _ai_feedback(text: str, overall_score: float) -> Optional[str]:
+    """AI-enhanced feedback if available; varies between calls, so never cached."""
+    try:
+        from core.ai_service import generate_ai_response, is_ai_available
+        if is_ai_available():
+            prompt = f"""Provide constructive feedback on this writing sample (Score: {overall_score}/100):
+
+Text: {text}
+
+Give 2-3 specific, actionable suggestions for improvement. Focus on the weakest areas."""
+            
+            return generate_ai_response(
+                prompt,
+                "You are a writing tutor providing constructive feedback. Be specific and encouraging.",
+                max_tokens=200,
+                temperature=0.6
+            )
+    except Exception as e:
+        print(f"⚠️ AI feedback generation failed: {e}")
+    return None
+
+def calculate_writing_quality_score_batch(
+    texts: List[str],
+    use_ai: bool = False,
+    batch_size: int = 50
+) -> List[Dict]:
+    """
+    Calculate Writing Quality Scores for several texts (e.g. a class's essays).
+    
+    Texts are parsed with spaCy in batches via nlp.pipe before scoring, so the
+    per-text scorers reuse the parsed documents instead of parsing one by one.
+    
+    Args:
+        texts: Input texts to score
+        use_ai: Whether to use AI for enhanced feedback on each text
+        batch_size: Number of texts parsed per spaCy batch
+    
+    Returns:
+        List of score dictionaries, in the same order as texts
+    """
+    results = []
+    for start in range(0, len(texts), batch_size):
+        chunk = texts[start:start + batch_size]
+        prime_docs([text for text in chunk if text and text.strip()], batch_size=batch_size)
+        results.extend(calculate_writing_quality_score(text, use_ai=use_ai) for text in chunk)
+    return results
+
+def _grammar_component(text: str, words: List[str]) -> Tuple[float, int]:
+    """Grammar & Correctness (30%): score and number of errors found."""
     grammar_errors = detect_grammar_errors(text)
     error_count = len(grammar_errors)
-    word_count = len(text.split())
-    error_rate = min(error_count / max(word_count, 1), 1.0)  # Normalize to 0-1
+    error_rate = min(error_count / max(len(words), 1), 1.0)  # Normalize to 0-1
     grammar_score = max(0, (1 - error_rate) * 100)  # Higher error rate = lower score
-    
-    # 2. Clarity & Readability (25%)
+    return grammar_score, error_count
+
+def _readability_component(text: str) -> Tuple[float, Dict]:
+    """Clarity & Readability (25%): score and the readability metrics."""
+    readability = {}
     try:
         readability = calculate_readability(text)
         flesch_score = readability.get("flesch_reading_ease", 50)
-        # Flesch score: 0-30 (very difficult) to 90-100 (very easy)
-        # For writing quality, we want moderate difficulty (50-70 is good)
-        # Adjust: 50-70 range gets high score
-        if 50 <= flesch_score <= 70:
-            readability_score = 100
-        elif 30 <= flesch_score < 50:
-            readability_score = 70 + (flesch_score - 30) * 1.5  # 70-100
-        elif 70 < flesch_score <= 90:
-            readability_score = 100 - (flesch_score - 70) * 1.5  # 100-70
-        else:
-            readability_score = max(0, 100 - abs(flesch_score - 60) * 2)
-        readability_score = max(0, min(100, readability_score))
-    except:
+        readability_score = lookup_readability_score(flesch_score)
+    except Exception as e:
+        print(f"⚠️ Readability scoring failed: {e}")
         readability_score = 50  # Default if calculation fails
-    
-    # 3. Coherence & Flow (20%)
+    return readability_score, readability
+
+def _coherence_component(text: str, sentence_parts: List[str]) -> float:
+    """Coherence & Flow (20%)."""
     try:
         coherence = analyze_semantic_coherence(text)
         coherence_score = coherence.get("coherence_score", 0.5) * 100
         
         # Also check paragraph coherence if multiple sentences
-        if len(text.split('.')) > 1:
+        if len(sentence_parts) > 1:
             para_coherence = analyze_paragraph_coherence(text)
             para_score = para_coherence.get("coherence_score", 0.5) * 100
             coherence_score = (coherence_score + para_score) / 2
-    except:
+    except Exception as e:
+        print(f"⚠️ Coherence scoring failed: {e}")
         coherence_score = 50
-    
-    # 4. Vocabulary & Style (15%)
+    return coherence_score
+
+def _vocabulary_component(words: List[str]) -> Tuple[float, Dict]:
+    """Vocabulary & Style (15%): score and the lexical diversity metrics."""
+    lexical = {}
     try:
-        tokens = text.split()
-        lexical = calculate_lexical_diversity(tokens)
+        lexical = calculate_lexical_diversity(words)
         ttr = lexical.get("ttr", 0.5)  # Type-Token Ratio (0-1)
         # Higher TTR = more diverse vocabulary = better
         vocabulary_score = ttr * 100
-    except:
+    except Exception as e:
+        print(f"⚠️ Vocabulary scoring failed: {e}")
         vocabulary_score = 50
-    
-    # 5. Tone & Appropriateness (10%)
+    return vocabulary_score, lexical
+
+def _tone_component(text: str) -> float:
+    """Tone & Appropriateness (10%)."""
     try:
         tone_style = analyze_tone_and_style(text)
         # Check if tone is appropriate and consistent
@@ -92,8 +268,59 @@ def calculate_writing_quality_score(text: str, use_ai: bool = True) -> Dict:
         sentiment = tone_style.get("sentiment", {}).get("polarity", 0)
         tone_score = 50 + (sentiment * 50)  # -1 to 1 maps to 0-100
         tone_score = max(0, min(100, tone_score))
-    except:
+    except Exception as e:
+        print(f"⚠️ Tone scoring failed: {e}")
         tone_score = 50
+    return tone_score
+
+def _score_components(text: str, words: List[str]) -> Dict:
+    """
+    Compute the deterministic (non-AI) part of the writing quality score.
+    words is text.split(), computed once by the caller.
+    """
+    sentence_parts = text.split('.')
+    return _combine_components(
+        words,
+        sentence_parts,
+        _grammar_component(text, words),
+        _readability_component(text),
+        _coherence_component(text, sentence_parts),
+        _vocabulary_component(words),
+        _tone_component(text)
+    )
+
+async def _ascore_components(text: str, words: List[str]) -> Dict:
+    """
+    Async variant of _score_components that runs the five independent
+    sub-scorers concurrently in the shared executor.
+    """
+    sentence_parts = text.split('.')
+    # Parse once up front so the scorers share the cached Doc instead of racing to parse it
+    await run_blocking(prime_docs, [text])
+    components = await asyncio.gather(
+        run_blocking(_grammar_component, text, words),
+        run_blocking(_readability_component, text),
+        run_blocking(_coherence_component, text, sentence_parts),
+        run_blocking(_vocabulary_component, words),
+        run_blocking(_tone_component, text)
+    )
+    return _combine_components(words, sentence_parts, *components)
+
+def _combine_components(
+    words: List[str],
+    sentence_parts: List[str],
+    grammar: Tuple[float, int],
+    clarity: Tuple[float, Dict],
+    coherence_score: float,
+    vocabulary: Tuple[float, Dict],
+    tone_score: float
+) -> Dict:
+    """Weight the component scores into the overall score, grade and feedback."""
+    grammar_score, error_count = grammar
+    readability_score, readability = clarity
+    vocabulary_score, lexical = vocabulary
+    word_count = len(words)
+    sentence_count = len([s for s in sentence_parts if s.strip()])
     
     # Calculate weighted overall score
     overall_score = (
@@ -107,19 +334,7 @@ def calculate_writing_quality_score(text: str, use_ai: bool = True) -> Dict:
     # Round to 1 decimal
     overall_score = round(overall_score, 1)
     
-    # Get grade
-    if overall_score >= 90:
-        grade = "A+"
-    elif overall_score >= 80:
-        grade = "A"
-    elif overall_score >= 70:
-        grade = "B"
-    elif overall_score >= 60:
-        grade = "C"
-    elif overall_score >= 50:
-        grade = "D"
-    else:
-        grade = "F"
+    grade = assign_grade(overall_score)
     
     # Generate feedback
     feedback = generate_quality_feedback(
@@ -132,27 +347,6 @@ def calculate_writing_quality_score(text: str, use_ai: bool = True) -> Dict:
         error_count
     )
     
-    # AI-enhanced feedback if available
-    ai_feedback = None
-    if use_ai:
-        try:
-            from core.ai_service import generate_ai_response, is_ai_available
-            if is_ai_available():
-                prompt = f"""Provide constructive feedback on this writing sample (Score: {overall_score}/100):
-
-Text: {text}
-
-Give 2-3 specific, actionable suggestions for improvement. Focus on the weakest areas."""
-                
-                ai_feedback = generate_ai_response(
-                    prompt,
-                    "You are a writing tutor providing constructive feedback. Be specific and encouraging.",
-                    max_tokens=200,
-                    temperature=0.6
-                )
-        except Exception as e:
-            print(f"⚠️ AI feedback generation failed: {e}")
-    
     return {
         "overall_score": overall_score,
         "grade": grade,
@@ -165,7 +359,7 @@ Give 2-3 specific, actionable suggestions for improvement. Focus on the weakest
             "clarity_readability": {
                 "score": round(readability_score, 1),
                 "weight": 0.25,
-                "flesch_reading_ease": readability.get("flesch_reading_ease", 0) if 'readability' in locals() else 0
+                "flesch_reading_ease": readability.get("flesch_reading_ease", 0)
             },
             "coherence_flow": {
                 "score": round(coherence_score, 1),
@@ -174,7 +368,7 @@ Give 2-3 specific, actionable suggestions for improvement. Focus on the weakest
             "vocabulary_style": {
                 "score": round(vocabulary_score, 1),
                 "weight": 0.15,
-                "lexical_diversity": lexical.get("ttr", 0) if 'lexical' in locals() else 0
+                "lexical_diversity": lexical.get("ttr", 0)
             },
             "tone_appropriateness": {
                 "score": round(tone_score, 1),
@@ -182,11 +376,47 @@ Give 2-3 specific, actionable suggestions for improvement. Focus on the weakest
             }
         },
         "feedback": feedback,
-        "ai_feedback": ai_feedback,
+        "ai_feedback": None,
         "word_count": word_count,
-        "sentence_count": len([s for s in text.split('.') if s.strip()])
+        "sentence_count": sentence_count
     }
 
+# Grade boundaries: a score at or above _GRADE_BINS[i] earns _GRADES[i + 1]
+_GRADE_BINS = (50, 60, 70, 80, 90)
+_GRADES = ("F", "D", "C", "B", "A", "A+")
+
+# Overall assessment boundaries, same convention as the grades
+_ASSESSMENT_BINS = (70, 80, 90)
+_ASSESSMENTS = (
+    "Your writing needs improvement. Focus on the areas below.",
+    "Decent writing, but there's room for improvement in several areas.",
+    "Good writing with minor areas for improvement.",
+    "Excellent writing! Your text demonstrates strong grammar, clarity, and coherence."
+)
+
+# Components below this score get an improvement tip
+_IMPROVEMENT_THRESHOLD = 70
+_IMPROVEMENT_TIPS = (
+    ("grammar", "Grammar: Fix {error_count} error(s) to improve correctness."),
+    ("readability", "Clarity: Simplify sentence structure and improve readability."),
+    ("coherence", "Coherence: Improve logical flow and connections between ideas."),
+    ("vocabulary", "Vocabulary: Use more diverse and precise word choices."),
+    ("tone", "Tone: Ensure consistent and appropriate tone throughout.")
+)
+
+# Components at or above this score are called out as strengths
+_STRENGTH_THRESHOLD = 80
+_STRENGTHS = (
+    ("grammar", "strong grammar"),
+    ("readability", "clear writing"),
+    ("coherence", "good flow"),
+    ("vocabulary", "rich vocabulary")
+)
+
+def assign_grade(overall_score: float) -> str:
+    """Map an overall score (0-100) to a letter grade."""
+    return _GRADES[bisect.bisect_right(_GRADE_BINS, overall_score)]
+
 def generate_quality_feedback(
     overall_score: float,
     grammar_score: float,
@@ -197,47 +427,31 @@ def generate_quality_feedback(
     error_count: int
 ) -> str:
     """Generate human-readable feedback based on scores."""
-    feedback_parts = []
+    component_scores = {
+        "grammar": grammar_score,
+        "readability": readability_score,
+        "coherence": coherence_score,
+        "vocabulary": vocabulary_score,
+        "tone": tone_score
+    }
     
     # Overall assessment
-    if overall_score >= 90:
-        feedback_parts.append("Excellent writing! Your text demonstrates strong grammar, clarity, and coherence.")
-    elif overall_score >= 80:
-        feedback_parts.append("Good writing with minor areas for improvement.")
-    elif overall_score >= 70:
-        feedback_parts.append("Decent writing, but there's room for improvement in several areas.")
-    else:
-        feedback_parts.append("Your writing needs improvement. Focus on the areas below.")
+    feedback_parts = [_ASSESSMENTS[bisect.bisect_right(_ASSESSMENT_BINS, overall_score)]]
     
     # Specific feedback
-    if grammar_score < 70:
-        feedback_parts.append(f"Grammar: Fix {error_count} error(s) to improve correctness.")
-    
-    if readability_score < 70:
-        feedback_parts.append("Clarity: Simplify sentence structure and improve readability.")
-    
-    if coherence_score < 70:
-        feedback_parts.append("Coherence: Improve logical flow and connections between ideas.")
-    
-    if vocabulary_score < 70:
-        feedback_parts.append("Vocabulary: Use more diverse and precise word choices.")
-    
-    if tone_score < 70:
-        feedback_parts.append("Tone: Ensure consistent and appropriate tone throughout.")
+    feedback_parts.extend(
+        tip.format(error_count=error_count)
+        for component, tip in _IMPROVEMENT_TIPS
+        if component_scores[component] < _IMPROVEMENT_THRESHOLD
+    )
     
     # Positive reinforcement
-    strengths = []
-    if grammar_score >= 80:
-        strengths.append("strong grammar")
-    if readability_score >= 80:
-        strengths.append("clear writing")
-    if coherence_score >= 80:
-        strengths.append("good flow")
-    if vocabulary_score >= 80:
-        strengths.append("rich vocabulary")
+    strengths = [
+        label for component, label in _STRENGTHS
+        if component_scores[component] >= _STRENGTH_THRESHOLD
+    ]
     
     if strengths:
         feedback_parts.append(f"Your strengths: {', '.join(strengths)}.")
     
     return " ".join(feedback_parts)
-
@@ -5,6 +5,34 @@ Scores clarity, conciseness, coherence, formality, and structure.
 from typing import Dict, List
 import re
 
+# Passive voice indicators ("was written", "got fixed") as a single alternation,
+# so each sentence needs exactly one regex search.
+_PASSIVE_VOICE_PATTERN = re.compile(r'\b(?:is|are|was|were|been|get|got|gets)\s+\w+ed\b', re.IGNORECASE)
+
+# Informal indicators, matched against lowercased text
+_INFORMAL_PATTERNS = tuple(re.compile(p) for p in (
+    r'\b(yeah|yep|nope|gonna|wanna|gotta)\b',
+    r'\b(like|um|uh|well)\b',  # Filler words
+    r'!{2,}',  # Multiple exclamation marks
+    r'\b(awesome|cool|nice|great)\b'  # Casual adjectives
+))
+
+# Formal indicators
+_FORMAL_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b(furthermore|moreover|consequently|therefore)\b',
+    r'\b(utilize|facilitate|implement|demonstrate)\b',
+    r'\b(according to|in accordance with|with regard to)\b',
+    r'[A-Z][a-z]+ [A-Z][a-z]+'  # Proper nouns (often formal)
+))
+
+_WORDY_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b(due to the fact that|because of the fact that)\b',
+    r'\b(in order to|so as to)\b',
+    r'\b(at this point in time|now)\b',
+    r'\b(for the purpose of|to)\b',
+    r'\b(in the event that|if)\b'
+))
+
 def analyze_writing_style(text: str) -> Dict:
     """
     Comprehensive writing style analysis.
@@ -114,24 +142,9 @@ def score_formality(text: str) -> float:
     Score text formality (0-1).
     0 = very informal, 1 = very formal.
     """
-    # Informal indicators
-    informal_patterns = [
-        r'\b(yeah|yep|nope|gonna|wanna|gotta)\b',
-        r'\b(like|um|uh|well)\b',  # Filler words
-        r'!{2,}',  # Multiple exclamation marks
-        r'\b(awesome|cool|nice|great)\b'  # Casual adjectives
-    ]
-    
-    # Formal indicators
-    formal_patterns = [
-        r'\b(furthermore|moreover|consequently|therefore)\b',
-        r'\b(utilize|facilitate|implement|demonstrate)\b',
-        r'\b(according to|in accordance with|with regard to)\b',
-        r'[A-Z][a-z]+ [A-Z][a-z]+'  # Proper nouns (often formal)
-    ]
-    
-    informal_count = sum(len(re.findall(pattern, text.lower())) for pattern in informal_patterns)
-    formal_count = sum(len(re.findall(pattern, text, re.IGNORECASE)) for pattern in formal_patterns)
+    lowered = text.lower()
+    informal_count = sum(len(pattern.findall(lowered)) for pattern in _INFORMAL_PATTERNS)
+    formal_count = sum(len(pattern.findall(text)) for pattern in _FORMAL_PATTERNS)
     
     total_indicators = informal_count + formal_count
     if total_indicators == 0:
@@ -186,17 +199,7 @@ def count_passive_voice(text: str) -> float:
     if not sentences:
         return 0.0
     
-    passive_indicators = [
-        r'\b(is|are|was|were|been)\s+\w+ed\b',
-        r'\b(get|got|gets)\s+\w+ed\b'
-    ]
-    
-    passive_count = 0
-    for sentence in sentences:
-        for pattern in passive_indicators:
-            if re.search(pattern, sentence, re.IGNORECASE):
-                passive_count += 1
-                break
+    passive_count = sum(1 for sentence in sentences if _PASSIVE_VOICE_PATTERN.search(sentence))
     
     return passive_count / len(sentences) if sentences else 0.0
 
@@ -223,19 +226,7 @@ def calculate_redundancy(text: str) -> float:
 
 def count_wordy_phrases(text: str) -> int:
     """Count wordy phrases."""
-    wordy_patterns = [
-        r'\b(due to the fact that|because of the fact that)\b',
-        r'\b(in order to|so as to)\b',
-        r'\b(at this point in time|now)\b',
-        r'\b(for the purpose of|to)\b',
-        r'\b(in the event that|if)\b'
-    ]
-    
-    count = 0
-    for pattern in wordy_patterns:
-        count += len(re.findall(pattern, text, re.IGNORECASE))
-    
-    return count
+    return sum(len(pattern.findall(text)) for pattern in _WORDY_PATTERNS)
 
 def count_transition_words(text: str) -> int:
     """Count transition words."""
@@ -9,7 +9,14 @@ async def init_db():
     """Initialize MongoDB connection and Beanie ODM"""
     global client
     
-    client = AsyncIOMotorClient(settings.DATABASE_URL)
+    client = AsyncIOMotorClient(
+        settings.DATABASE_URL,
+        maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+        minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+        compressors=settings.MONGO_COMPRESSORS,
+        retryWrites=True,
+        serverSelectionTimeoutMS=settings.MONGO_SERVER_SELECTION_TIMEOUT_MS
+    )
     
     # Import all document models
     from models.user_model import User
@@ -19,9 +26,12 @@ async def init_db():
     from models.recommendation_model import Recommendation
     from models.grammar_log_model import GrammarLog
     
+    database = client[settings.DATABASE_NAME]
+    await _migrate_grammar_log_ttl_index(database)
+    
     # Initialize Beanie with the document models
     await init_beanie(
-        database=client[settings.DATABASE_NAME],
+        database=database,
         document_models=[
             User,
             Progress,
@@ -34,6 +44,21 @@ async def init_db():
     
     return client
 
+async def _migrate_grammar_log_ttl_index(database) -> None:
+    """
+    Drop the grammar_logs timestamp index if it predates the TTL option.
+    
+    Older deployments have a plain index on the same key, which would make
+    Beanie's create_index fail with an options conflict. Only that index is
+    touched; init_beanie then recreates it with the current TTL.
+    """
+    from models.grammar_log_model import GRAMMAR_LOG_TTL_SECONDS
+    
+    collection = database["grammar_logs"]
+    async for index in collection.list_indexes():
+        if dict(index["key"]) == {"timestamp": 1} and index.get("expireAfterSeconds") != GRAMMAR_LOG_TTL_SECONDS:
+            await collection.drop_index(index["name"])
+
 async def close_db():
     """Close MongoDB connection"""
     global client
@@ -2,7 +2,8 @@ from beanie import Document
 from beanie import PydanticObjectId
 from datetime import datetime
 from typing import List, Dict, Optional, Any
-from pydantic import Field
+from pydantic import BaseModel, Field
+from pymongo import IndexModel, ASCENDING, DESCENDING
 
 class FeedbackLog(Document):
     user_id: PydanticObjectId
@@ -16,4 +17,9 @@ class FeedbackLog(Document):
         indexes = [
             "user_id",
             "created_at",
-        ]
\ No newline at end of file
+            IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)]),
+        ]
+
+class FeedbackCorrections(BaseModel):
+    """Projection of FeedbackLog for readers that only need the corrections."""
+    corrections: List[Dict[str, Any]] = Field(default_factory=list)
@@ -1,28 +1,103 @@
 """
 Grammar Log Model for storing correction history.
 """
+import zlib
 from beanie import Document
 from datetime import datetime
-from typing import List, Dict, Optional
-from pydantic import Field
+from typing import Any, List, Dict, Optional
+from pydantic import Field, model_validator
 from beanie import PydanticObjectId
+from pymongo import IndexModel, ASCENDING, DESCENDING
+
+# Grammar logs are expired by MongoDB after this many seconds. Matches the
+# longest analysis window exposed by the evaluation endpoints (365 days).
+GRAMMAR_LOG_TTL_SECONDS = 60 * 60 * 24 * 365
+
+MAX_TEXT_LENGTH = 1000
+
+# Stored text blobs start with a one-byte marker describing the encoding.
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+
+def pack_text(text: str, reference: str = "") -> bytes:
+    """
+    Encode text for storage, zlib-compressing it when that is smaller.
+    
+    When a reference text is given it is used as the compression dictionary,
+    so a corrected sentence that mostly repeats the original packs down to
+    little more than the edits.
+    """
+    raw = text.encode("utf-8")
+    if reference:
+        compressor = zlib.compressobj(9, zdict=reference.encode("utf-8"))
+    else:
+        compressor = zlib.compressobj(9)
+    compressed = compressor.compress(raw) + compressor.flush()
+    if len(compressed) < len(raw):
+        return _ZLIB + compressed
+    return _RAW + raw
+
+def unpack_text(data: bytes, reference: str = "") -> str:
+    """Decode a blob produced by pack_text."""
+    if not data:
+        return ""
+    marker, payload = data[:1], data[1:]
+    if marker == _ZLIB:
+        if reference:
+            decompressor = zlib.decompressobj(zdict=reference.encode("utf-8"))
+        else:
+            decompressor = zlib.decompressobj()
+        payload = decompressor.decompress(payload) + decompressor.flush()
+    return payload.decode("utf-8")
 
 class GrammarLog(Document):
-    """Model for storing grammar correction logs."""
+    """
+    Model for storing grammar correction logs.
+    
+    The original and corrected texts are stored as compact blobs; the
+    corrected text is compressed against the original. Construct logs with
+    original_text / corrected_text and read them back through the
+    properties of the same name.
+    """
     user_id: Optional[PydanticObjectId] = None
-    original_text: str = Field(..., max_length=1000)
-    corrected_text: str = Field(..., max_length=1000)
+    original_blob: bytes = b""
+    corrected_blob: bytes = b""
     error_types: List[str] = Field(default_factory=list)
     error_count: int = 0
     correction_method: str = "rule_based"  # t5_model, rule_based, language_tool
     explanations: List[Dict] = Field(default_factory=list)
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     
+    @model_validator(mode="before")
+    @classmethod
+    def pack_texts(cls, data: Any) -> Any:
+        """Pack plain original_text/corrected_text values (new logs and legacy documents)."""
+        if not isinstance(data, dict) or "original_text" not in data:
+            return data
+        data = dict(data)
+        original = data.pop("original_text") or ""
+        corrected = data.pop("corrected_text", "") or ""
+        for name, value in (("original_text", original), ("corrected_text", corrected)):
+            if len(value) > MAX_TEXT_LENGTH:
+                raise ValueError(f"{name} must be at most {MAX_TEXT_LENGTH} characters")
+        data["original_blob"] = pack_text(original)
+        data["corrected_blob"] = pack_text(corrected, reference=original)
+        return data
+    
+    @property
+    def original_text(self) -> str:
+        return unpack_text(self.original_blob)
+    
+    @property
+    def corrected_text(self) -> str:
+        return unpack_text(self.corrected_blob, reference=self.original_text)
+    
     class Settings:
         name = "grammar_logs"
         indexes = [
             "user_id",
-            "timestamp",
+            IndexModel([("timestamp", ASCENDING)], expireAfterSeconds=GRAMMAR_LOG_TTL_SECONDS),
+            IndexModel([("user_id", ASCENDING), ("timestamp", DESCENDING)]),
         ]
     
     class Config:
@@ -42,4 +117,3 @@ class GrammarLog(Document):
                 ]
             }
         }
-
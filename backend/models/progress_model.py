@@ -3,6 +3,7 @@ from beanie import PydanticObjectId
 from datetime import datetime
 from typing import Optional
 from pydantic import Field
+from pymongo import IndexModel, ASCENDING, DESCENDING
 
 class Progress(Document):
     user_id: PydanticObjectId
@@ -18,4 +19,5 @@ class Progress(Document):
         indexes = [
             "user_id",
             "date",
+            IndexModel([("user_id", ASCENDING), ("date", DESCENDING)]),
         ]
\ No newline at end of file
@@ -3,6 +3,7 @@ from beanie import PydanticObjectId
 from datetime import datetime
 from typing import Optional
 from pydantic import Field
+from pymongo import IndexModel, ASCENDING
 
 class Recommendation(Document):
     user_id: PydanticObjectId
@@ -17,4 +18,5 @@ class Recommendation(Document):
         indexes = [
             "user_id",
             "difficulty",
+            IndexModel([("user_id", ASCENDING), ("content_title", ASCENDING)]),
         ]
\ No newline at end of file
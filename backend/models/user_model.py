@@ -2,6 +2,7 @@ from beanie import Document
 from datetime import datetime
 from typing import Optional
 from pydantic import Field, EmailStr
+from pymongo import IndexModel, DESCENDING
 
 class User(Document):
     username: str = Field(..., min_length=3, max_length=50)
@@ -16,6 +17,7 @@ class User(Document):
         indexes = [
             "username",
             "email",
+            IndexModel([("xp_points", DESCENDING)]),
         ]
     
     class Config:
@@ -2,6 +2,7 @@ from beanie import Document
 from beanie import PydanticObjectId
 from datetime import datetime
 from pydantic import Field
+from pymongo import IndexModel, ASCENDING
 
 class XPBadge(Document):
     user_id: PydanticObjectId
@@ -13,4 +14,5 @@ class XPBadge(Document):
         indexes = [
             "user_id",
             "badge_name",
+            IndexModel([("user_id", ASCENDING), ("badge_name", ASCENDING)]),
         ]
\ No newline at end of file
@@ -2,44 +2,127 @@
 Advanced AI Features Router
 Endpoints for context-aware grammar, tone transfer, quality scoring, etc.
 """
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-from typing import Optional, List, Dict
+import hashlib
+import json
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import BaseModel, Field, field_validator
+from typing import ClassVar, Optional, List, Dict
 from beanie import PydanticObjectId
 from models.user_model import User
-from core.auth import get_current_user_optional
-from core.contextual_grammar import correct_paragraph_with_context, analyze_paragraph_coherence
-from core.tone_style_transfer import transfer_tone, get_available_tones, detect_current_tone
-from core.writing_quality_score import calculate_writing_quality_score
-from core.emotion_intent_analysis import analyze_emotion_and_intent, analyze_emotion, analyze_intent
-from core.text_summarizer_reviewer import summarize_and_review
+from core.auth import get_current_admin, get_current_user_optional
+from config import settings
+from core.tone_style_transfer import get_available_tones, detect_current_tone, astream_tone_transfer
 from core.grammar_topic_linking import get_mini_lesson_for_errors, get_all_grammar_topics, get_grammar_topic_for_error
 from core.grammar_drills import generate_drill_from_mistakes, generate_grammar_drill
 from core.daily_challenges import generate_daily_challenge, get_challenge_categories
-from core.grammar_analysis import detect_grammar_errors
+from core.lazy import lazy_async_generator_function, lazy_coroutine_function, lazy_function
+from core.request_batcher import grammar_batcher
+from core.executor import run_blocking
+from core.inference_worker import inference
+from core.response_cache import cached_endpoint, response_cache
+from core.disk_cache import disk_cache, seconds_until_local_midnight
+from core.streaming import ndjson_response
+from core.error_handling import PlainDetailRoute, handle_errors
 
-router = APIRouter(prefix="/advanced-ai", tags=["Advanced AI Features"])
+# Invalid request bodies get a 400 with a string detail, which the frontend displays as-is
+router = APIRouter(prefix="/advanced-ai", tags=["Advanced AI Features"], route_class=PlainDetailRoute)
+
+# Analyzers that load models at import are only imported when first used
+correct_paragraph_with_context = lazy_function("core.contextual_grammar", "correct_paragraph_with_context")
+analyze_paragraph_coherence = lazy_function("core.contextual_grammar", "analyze_paragraph_coherence")
+astream_paragraph_correction = lazy_async_generator_function("core.contextual_grammar", "astream_paragraph_correction")
+acalculate_writing_quality_score = lazy_coroutine_function("core.writing_quality_score", "acalculate_writing_quality_score")
+calculate_writing_quality_score_batch = lazy_function("core.writing_quality_score", "calculate_writing_quality_score_batch")
+analyze_emotion = lazy_function("core.emotion_intent_analysis", "analyze_emotion")
+analyze_intent = lazy_function("core.emotion_intent_analysis", "analyze_intent")
+summarize_and_review = lazy_function("core.text_summarizer_reviewer", "summarize_and_review")
+astream_summary_and_review = lazy_async_generator_function("core.text_summarizer_reviewer", "astream_summary_and_review")
 
 # Request Models
-class ContextualCorrectionRequest(BaseModel):
-    text: str
+class TextRequest(BaseModel):
+    """Base for requests carrying user text; rejects too-short or oversized text before any model runs."""
+    min_text_length: ClassVar[int] = 10
+    
+    text: str = Field(..., max_length=settings.MAX_TEXT_LENGTH)
     use_ai: bool = True
+    
+    @field_validator("text")
+    @classmethod
+    def validate_text_length(cls, v: str) -> str:
+        if len(v.strip()) < cls.min_text_length:
+            raise ValueError(f"Text must be at least {cls.min_text_length} characters")
+        return v
+
+class ContextualCorrectionRequest(TextRequest):
+    pass
+
+class SummarizeReviewRequest(TextRequest):
+    min_text_length: ClassVar[int] = 50
 
-class ToneTransferRequest(BaseModel):
-    text: str
+class DetectToneRequest(TextRequest):
+    min_text_length: ClassVar[int] = 5
+
+class ToneTransferRequest(TextRequest):
+    min_text_length: ClassVar[int] = 5
+    
     target_tone: str  # formal, friendly, academic, creative, concise, casual
-    use_ai: bool = True
 
-class QualityScoreRequest(BaseModel):
-    text: str
-    use_ai: bool = True
+class QualityScoreRequest(TextRequest):
+    pass
 
-class EmotionIntentRequest(BaseModel):
-    text: str
+class QualityScoreBatchRequest(BaseModel):
+    texts: List[str] = Field(..., min_length=1, max_length=100)
+    use_ai: bool = False
+    
+    @field_validator("texts")
+    @classmethod
+    def validate_text_lengths(cls, v: List[str]) -> List[str]:
+        if any(len(text) > settings.MAX_TEXT_LENGTH for text in v):
+            raise ValueError(f"Each text must be at most {settings.MAX_TEXT_LENGTH} characters")
+        return v
+
+class EmotionIntentRequest(TextRequest):
+    min_text_length: ClassVar[int] = 5
+
+class DrillByTypeRequest(BaseModel):
+    text: str = Field("", max_length=settings.MAX_TEXT_LENGTH)
     use_ai: bool = True
 
+STATIC_CACHE_CONTROL = "public, max-age=3600"
+
+def _static_payload(payload: Dict) -> Dict:
+    """Serialize a constant payload once and derive its ETag from the body."""
+    body = json.dumps(payload).encode("utf-8")
+    return {"body": body, "etag": f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'}
+
+def _static_response(request: Request, static: Dict) -> Response:
+    """Serve a precomputed payload, answering 304 when the client's ETag matches."""
+    headers = {"ETag": static["etag"], "Cache-Control": STATIC_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == static["etag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=static["body"], media_type="application/json", headers=headers)
+
+# Reference data is constant for the process lifetime, so build it once at import
+_TONES = _static_payload({"tones": get_available_tones()})
+_TOPICS = _static_payload({"topics": get_all_grammar_topics()})
+_CATEGORIES = _static_payload({"categories": get_challenge_categories()})
+
 # Endpoints
 @router.post("/contextual-correction")
+async def contextual_grammar_correction_stream(
+    request: ContextualCorrectionRequest,
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """
+    Stream a context-aware paragraph correction as NDJSON.
+    Emits `token`/`sentence` events, then a final `result` event.
+    """
+    return ndjson_response(astream_paragraph_correction(request.text, use_ai=request.use_ai))
+
+@router.post("/contextual-correction/sync")
+@cached_endpoint("contextual-correction")
+@handle_errors("Contextual correction")
 async def contextual_grammar_correction(
     request: ContextualCorrectionRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
@@ -48,19 +131,12 @@ async def contextual_grammar_correction(
     Correct grammar errors in paragraphs while preserving context.
     Handles multi-sentence corrections with cross-sentence coherence.
     """
-    try:
-        if not request.text or len(request.text.strip()) < 10:
-            raise HTTPException(status_code=400, detail="Text must be at least 10 characters")
-        
-        result = correct_paragraph_with_context(request.text, use_ai=request.use_ai)
-        return result
-    except Exception as e:
-        print(f"Error in contextual correction: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Contextual correction failed: {str(e)}")
+    result = await run_blocking(correct_paragraph_with_context, request.text, use_ai=request.use_ai)
+    return result
 
 @router.post("/coherence-analysis")
+@cached_endpoint("coherence-analysis", key_fields=("text",))
+@handle_errors("Coherence analysis")
 async def coherence_analysis(
     request: ContextualCorrectionRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
@@ -68,19 +144,23 @@ async def coherence_analysis(
     """
     Analyze coherence and flow of a paragraph.
     """
-    try:
-        if not request.text or len(request.text.strip()) < 10:
-            raise HTTPException(status_code=400, detail="Text must be at least 10 characters")
-        
-        result = analyze_paragraph_coherence(request.text)
-        return result
-    except Exception as e:
-        print(f"Error in coherence analysis: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Coherence analysis failed: {str(e)}")
+    result = await run_blocking(analyze_paragraph_coherence, request.text)
+    return result
 
 @router.post("/tone-transfer")
+async def tone_transfer_stream(
+    request: ToneTransferRequest,
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """
+    Stream a tone transfer as NDJSON.
+    Emits `token` events, then a final `result` event.
+    """
+    return ndjson_response(astream_tone_transfer(request.text, request.target_tone, use_ai=request.use_ai))
+
+@router.post("/tone-transfer/sync")
+@cached_endpoint("tone-transfer", key_fields=("text", "target_tone", "use_ai"))
+@handle_errors("Tone transfer")
 async def tone_transfer(
     request: ToneTransferRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
@@ -89,44 +169,31 @@ async def tone_transfer(
     Rephrase text into a different tone/style.
     Available tones: formal, friendly, academic, creative, concise, casual
     """
-    try:
-        if not request.text or len(request.text.strip()) < 5:
-            raise HTTPException(status_code=400, detail="Text must be at least 5 characters")
-        
-        result = transfer_tone(request.text, request.target_tone, use_ai=request.use_ai)
-        return result
-    except Exception as e:
-        print(f"Error in tone transfer: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Tone transfer failed: {str(e)}")
+    result = await inference.call("tone_transfer", request.text, request.target_tone, use_ai=request.use_ai)
+    return result
 
 @router.get("/available-tones")
-async def get_tones():
+async def get_tones(request: Request):
     """Get list of available tone styles."""
-    return {"tones": get_available_tones()}
+    return _static_response(request, _TONES)
 
 @router.post("/detect-tone")
+@cached_endpoint("detect-tone", key_fields=("text",))
+@handle_errors("Tone detection")
 async def detect_tone(
-    request: ContextualCorrectionRequest,
+    request: DetectToneRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """
     Detect the current tone/style of the text.
     """
-    try:
-        if not request.text or len(request.text.strip()) < 5:
-            raise HTTPException(status_code=400, detail="Text must be at least 5 characters")
-        
-        result = detect_current_tone(request.text)
-        return result
-    except Exception as e:
-        print(f"Error in tone detection: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Tone detection failed: {str(e)}")
+    result = await run_blocking(detect_current_tone, request.text)
+    return result
 
+# Not response-cached: the AI feedback must vary between calls, and the
+# deterministic scores are already cached by the scoring module
 @router.post("/quality-score")
+@handle_errors("Quality scoring")
 async def writing_quality_score(
     request: QualityScoreRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
@@ -135,19 +202,28 @@ async def writing_quality_score(
     Calculate overall Writing Quality Score (0-100) with detailed breakdown.
     Components: Grammar (30%), Clarity (25%), Coherence (20%), Vocabulary (15%), Tone (10%)
     """
-    try:
-        if not request.text or len(request.text.strip()) < 10:
-            raise HTTPException(status_code=400, detail="Text must be at least 10 characters")
-        
-        result = calculate_writing_quality_score(request.text, use_ai=request.use_ai)
-        return result
-    except Exception as e:
-        print(f"Error in quality scoring: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Quality scoring failed: {str(e)}")
+    if inference.enabled:
+        result = await inference.call("quality_score", request.text, use_ai=request.use_ai)
+    else:
+        result = await acalculate_writing_quality_score(request.text, use_ai=request.use_ai)
+    return result
+
+@router.post("/quality-score/batch")
+@handle_errors("Batch quality scoring")
+async def writing_quality_score_batch(
+    request: QualityScoreBatchRequest,
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """
+    Calculate Writing Quality Scores for multiple texts (e.g. a class's submissions).
+    Results are returned in the same order as the submitted texts.
+    """
+    results = await run_blocking(calculate_writing_quality_score_batch, request.texts, use_ai=request.use_ai)
+    return {"results": results, "count": len(results)}
 
 @router.post("/emotion-intent")
+@cached_endpoint("emotion-intent", sim_threshold=0.97, normalize_whitespace=True)
+@handle_errors("Emotion/intent analysis")
 async def emotion_intent_analysis(
     request: EmotionIntentRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
@@ -155,19 +231,12 @@ async def emotion_intent_analysis(
     """
     Analyze emotional tone and user intent in the text.
     """
-    try:
-        if not request.text or len(request.text.strip()) < 5:
-            raise HTTPException(status_code=400, detail="Text must be at least 5 characters")
-        
-        result = analyze_emotion_and_intent(request.text, use_ai=request.use_ai)
-        return result
-    except Exception as e:
-        print(f"Error in emotion/intent analysis: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Emotion/intent analysis failed: {str(e)}")
+    result = await inference.call("emotion_intent", request.text, use_ai=request.use_ai)
+    return result
 
 @router.post("/emotion")
+@cached_endpoint("emotion", sim_threshold=0.97, normalize_whitespace=True)
+@handle_errors("Emotion analysis")
 async def emotion_analysis(
     request: EmotionIntentRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
@@ -175,19 +244,12 @@ async def emotion_analysis(
     """
     Detect emotional tone in the text.
     """
-    try:
-        if not request.text or len(request.text.strip()) < 5:
-            raise HTTPException(status_code=400, detail="Text must be at least 5 characters")
-        
-        result = analyze_emotion(request.text, use_ai=request.use_ai)
-        return result
-    except Exception as e:
-        print(f"Error in emotion analysis: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Emotion analysis failed: {str(e)}")
+    result = await run_blocking(analyze_emotion, request.text, use_ai=request.use_ai)
+    return result
 
 @router.post("/intent")
+@cached_endpoint("intent", sim_threshold=0.97, normalize_whitespace=True)
+@handle_errors("Intent analysis")
 async def intent_analysis(
     request: EmotionIntentRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
@@ -195,39 +257,36 @@ async def intent_analysis(
     """
     Detect user intent in the text.
     """
-    try:
-        if not request.text or len(request.text.strip()) < 5:
-            raise HTTPException(status_code=400, detail="Text must be at least 5 characters")
-        
-        result = analyze_intent(request.text, use_ai=request.use_ai)
-        return result
-    except Exception as e:
-        print(f"Error in intent analysis: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Intent analysis failed: {str(e)}")
+    result = await run_blocking(analyze_intent, request.text, use_ai=request.use_ai)
+    return result
 
 @router.post("/summarize-review")
+async def summarize_and_review_text_stream(
+    request: SummarizeReviewRequest,
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """
+    Stream a summary and review as NDJSON.
+    Emits `token` events for the summary, then a final `result` event.
+    """
+    return ndjson_response(astream_summary_and_review(request.text, use_ai=request.use_ai))
+
+@router.post("/summarize-review/sync")
+@cached_endpoint("summarize-review")
+@handle_errors("Summarize/review")
 async def summarize_and_review_text(
-    request: ContextualCorrectionRequest,
+    request: SummarizeReviewRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """
     Summarize long text and provide improvement points.
     """
-    try:
-        if not request.text or len(request.text.strip()) < 50:
-            raise HTTPException(status_code=400, detail="Text must be at least 50 characters")
-        
-        result = summarize_and_review(request.text, use_ai=request.use_ai)
-        return result
-    except Exception as e:
-        print(f"Error in summarize/review: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Summarize/review failed: {str(e)}")
+    result = await run_blocking(summarize_and_review, request.text, use_ai=request.use_ai)
+    return result
 
 @router.post("/grammar-lessons")
+@cached_endpoint("grammar-lessons")
+@handle_errors("Grammar lessons")
 async def get_grammar_lessons(
     request: ContextualCorrectionRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
@@ -235,25 +294,18 @@ async def get_grammar_lessons(
     """
     Get mini-lessons for grammar errors in the text.
     """
-    try:
-        if not request.text or len(request.text.strip()) < 10:
-            raise HTTPException(status_code=400, detail="Text must be at least 10 characters")
-        
-        errors = detect_grammar_errors(request.text)
-        result = get_mini_lesson_for_errors(errors, use_ai=request.use_ai)
-        return result
-    except Exception as e:
-        print(f"Error in grammar lessons: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Grammar lessons failed: {str(e)}")
+    errors = await grammar_batcher.submit(request.text)
+    result = await run_blocking(get_mini_lesson_for_errors, errors, use_ai=request.use_ai)
+    return result
 
 @router.get("/grammar-topics")
-async def get_topics():
+async def get_topics(request: Request):
     """Get all available grammar topics."""
-    return {"topics": get_all_grammar_topics()}
+    return _static_response(request, _TOPICS)
 
 @router.post("/grammar-drill")
+@cached_endpoint("grammar-drill")
+@handle_errors("Grammar drill")
 async def generate_drill(
     request: ContextualCorrectionRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
@@ -261,38 +313,38 @@ async def generate_drill(
     """
     Generate personalized grammar drill from user's mistakes.
     """
-    try:
-        if not request.text or len(request.text.strip()) < 10:
-            raise HTTPException(status_code=400, detail="Text must be at least 10 characters")
-        
-        errors = detect_grammar_errors(request.text)
-        result = generate_drill_from_mistakes(errors, use_ai=request.use_ai)
-        return result
-    except Exception as e:
-        print(f"Error in grammar drill: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Grammar drill failed: {str(e)}")
+    errors = await grammar_batcher.submit(request.text)
+    result = await run_blocking(generate_drill_from_mistakes, errors, use_ai=request.use_ai)
+    return result
 
 @router.post("/grammar-drill/{error_type}")
+@handle_errors("Grammar drill")
 async def generate_drill_by_type(
     error_type: str,
-    request: ContextualCorrectionRequest,
+    request: DrillByTypeRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """
     Generate grammar drill for a specific error type.
     """
-    try:
-        result = generate_grammar_drill(error_type, difficulty="medium", use_ai=request.use_ai)
-        return result
-    except Exception as e:
-        print(f"Error in grammar drill by type: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Grammar drill failed: {str(e)}")
+    error_type = error_type.lower()
+    # Only known types are generated and persisted, so arbitrary paths cannot grow the cache
+    if get_grammar_topic_for_error(error_type) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No exercise available for error type: {error_type}"
+        )
+    # Shared by all users for the day; a fresh drill is generated after local midnight
+    result = await run_blocking(
+        disk_cache.get_or_compute,
+        ("grammar-drill", error_type, "medium", request.use_ai),
+        lambda: generate_grammar_drill(error_type, difficulty="medium", use_ai=request.use_ai),
+        ttl=seconds_until_local_midnight(),
+    )
+    return result
 
 @router.get("/daily-challenge")
+@handle_errors("Daily challenge")
 async def get_daily_challenge(
     category: Optional[str] = None,
     current_user: Optional[User] = Depends(get_current_user_optional)
@@ -300,18 +352,37 @@ async def get_daily_challenge(
     """
     Get today's daily writing challenge.
     """
-    try:
-        user_id = str(current_user.id) if current_user else None
-        result = generate_daily_challenge(user_id=user_id, category=category, use_ai=True)
-        return result
-    except Exception as e:
-        print(f"Error in daily challenge: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Daily challenge failed: {str(e)}")
+    user_id = str(current_user.id) if current_user else None
+    # Stable per (local date, user, category); expires at local midnight
+    result = await run_blocking(
+        disk_cache.get_or_compute,
+        ("daily-challenge", date.today().isoformat(), user_id, category),
+        lambda: generate_daily_challenge(user_id=user_id, category=category, use_ai=True),
+        ttl=seconds_until_local_midnight(),
+    )
+    return result
+
+@router.get("/cache/stats", dependencies=[Depends(get_current_admin)])
+async def get_cache_stats():
+    """Get hit/miss statistics for the advanced AI response cache (admin only)."""
+    return response_cache.stats()
+
+def _is_user_scoped(key: List) -> bool:
+    # Daily-challenge keys are (name, date, user_id, category)
+    return key[0] == "daily-challenge" and key[2] is not None
+
+@router.get("/cache/export", dependencies=[Depends(get_current_admin)])
+async def export_disk_cache():
+    """
+    Dump persisted challenges and drills so another deployment can be pre-populated (admin only).
+    Per-user daily challenges are left out.
+    """
+    entries = await run_blocking(disk_cache.export)
+    entries = [entry for entry in entries if not _is_user_scoped(entry["key"])]
+    return {"entries": entries, "count": len(entries)}
 
 @router.get("/challenge-categories")
-async def get_categories():
+async def get_categories(request: Request):
     """Get all available challenge categories."""
-    return {"categories": get_challenge_categories()}
+    return _static_response(request, _CATEGORIES)
 
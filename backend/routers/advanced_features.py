@@ -1,6 +1,7 @@
 """
 Advanced Features Router - New endpoints for all advanced features.
 """
+import bisect
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
@@ -8,12 +9,12 @@ from beanie import PydanticObjectId
 
 from models.user_model import User
 from core.auth import get_current_user, get_current_user_optional
+from config import settings
 from core.dialog_generation import generate_dialog, generate_response, evaluate_dialog_response
 from core.error_pattern_mining import mine_error_patterns
 from core.adaptive_difficulty import get_user_performance_level, calculate_difficulty_score, adjust_text_difficulty
 from core.writing_style_feedback import analyze_writing_style
-from core.semantic_similarity import compare_with_target
-from core.essay_scoring import score_essay
+from core.inference_worker import inference
 from core.dialogue_act_classification import classify_dialogue_act, get_appropriate_response
 from core.learning_path import generate_learning_path
 from core.plagiarism_detection import detect_plagiarism
@@ -48,6 +49,27 @@ class PlagiarismRequest(BaseModel):
     text: str
     reference_texts: Optional[List[str]] = None
 
+class EvaluateDialogRequest(BaseModel):
+    user_response: str
+    expected_response: str = ""
+    context: List[Dict] = Field(default_factory=list)
+
+class DifficultyRequest(BaseModel):
+    text: str = Field(..., max_length=settings.MAX_TEXT_LENGTH)
+
+class AdjustDifficultyRequest(BaseModel):
+    text: str = Field(..., max_length=settings.MAX_TEXT_LENGTH)
+    target_level: str = Field("B1", description="CEFR level")
+    current_difficulty: float = Field(0.5, ge=0, le=1)
+    auto_rephrase: bool = True
+
+class StyleRequest(BaseModel):
+    text: str = Field(..., max_length=settings.MAX_TEXT_LENGTH)
+
+class KeywordsRequest(BaseModel):
+    text: str = Field(..., max_length=settings.MAX_TEXT_LENGTH)
+    top_n: int = Field(10, ge=1, le=50, description="Number of keywords")
+
 # Endpoints
 @router.post("/dialog/generate")
 async def generate_dialog_endpoint(
@@ -75,15 +97,15 @@ async def generate_dialog_response(
 
 @router.post("/dialog/evaluate")
 async def evaluate_dialog(
-    request: Dict,
+    request: EvaluateDialogRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """Evaluate user's dialog response."""
     try:
         result = evaluate_dialog_response(
-            request.get("user_response", ""),
-            request.get("expected_response", ""),
-            request.get("context", [])
+            request.user_response,
+            request.expected_response,
+            request.context
         )
         return result
     except Exception as e:
@@ -115,29 +137,28 @@ async def get_performance_level(
 
 @router.post("/difficulty/calculate")
 async def calculate_difficulty(
-    request: Dict,
+    request: DifficultyRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """Calculate text difficulty score."""
     try:
-        score = calculate_difficulty_score(request.get("text", ""))
+        score = calculate_difficulty_score(request.text)
         return {"difficulty_score": score, "difficulty_level": get_difficulty_level(score)}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error calculating difficulty: {str(e)}")
 
 @router.post("/difficulty/adjust")
 async def adjust_difficulty(
-    request: Dict,
+    request: AdjustDifficultyRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """Adjust text difficulty to target level. Automatically rephrases if requested."""
     try:
-        auto_rephrase = request.get("auto_rephrase", True)  # Default to True
         result = adjust_text_difficulty(
-            request.get("text", ""),
-            request.get("target_level", "B1"),
-            request.get("current_difficulty", 0.5),
-            auto_rephrase=auto_rephrase
+            request.text,
+            request.target_level,
+            request.current_difficulty,
+            auto_rephrase=request.auto_rephrase
         )
         return result
     except Exception as e:
@@ -145,12 +166,12 @@ async def adjust_difficulty(
 
 @router.post("/style/analyze")
 async def analyze_style_endpoint(
-    request: Dict,
+    request: StyleRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """Analyze writing style (clarity, conciseness, coherence, formality, structure)."""
     try:
-        analysis = analyze_writing_style(request.get("text", ""))
+        analysis = analyze_writing_style(request.text)
         return analysis
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error analyzing style: {str(e)}")
@@ -162,7 +183,7 @@ async def compare_similarity(
 ):
     """Compare learner's answer with target answer using semantic similarity."""
     try:
-        result = compare_with_target(request.learner_answer, request.target_answer)
+        result = await inference.call("semantic_similarity", request.learner_answer, request.target_answer)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error comparing similarity: {str(e)}")
@@ -174,7 +195,7 @@ async def score_essay_endpoint(
 ):
     """Automatically score an essay."""
     try:
-        result = score_essay(request.text, request.topic)
+        result = await inference.call("essay_scoring", request.text, request.topic)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error scoring essay: {str(e)}")
@@ -221,12 +242,12 @@ async def check_plagiarism(
 
 @router.post("/keywords/extract")
 async def extract_keywords_endpoint(
-    request: Dict,
+    request: KeywordsRequest,
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """Extract keywords from text for revision notes."""
     try:
-        keywords = extract_keywords(request.get("text", ""), top_n=request.get("top_n", 10))
+        keywords = extract_keywords(request.text, top_n=request.top_n)
         return {
             "keywords": keywords,
             "count": len(keywords)
@@ -234,16 +255,11 @@ async def extract_keywords_endpoint(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error extracting keywords: {str(e)}")
 
+# Difficulty level boundaries: a score at or above _DIFFICULTY_BINS[i]
+# is _DIFFICULTY_LEVELS[i + 1]
+_DIFFICULTY_BINS = (0.2, 0.4, 0.6, 0.8)
+_DIFFICULTY_LEVELS = ("Very Easy", "Easy", "Moderate", "Difficult", "Very Difficult")
+
 def get_difficulty_level(score: float) -> str:
     """Get difficulty level from score."""
-    if score >= 0.8:
-        return "Very Difficult"
-    elif score >= 0.6:
-        return "Difficult"
-    elif score >= 0.4:
-        return "Moderate"
-    elif score >= 0.2:
-        return "Easy"
-    else:
-        return "Very Easy"
-
+    return _DIFFICULTY_LEVELS[bisect.bisect_right(_DIFFICULTY_BINS, score)]
\ No newline at end of file
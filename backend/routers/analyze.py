@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException
-from pydantic import BaseModel
-from typing import Optional
+import asyncio
+import logging
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from pydantic import BaseModel, Field
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime
 from models.user_model import User
 from models.progress_model import Progress
@@ -8,264 +10,400 @@ from models.feedback_model import FeedbackLog
 from core.auth import get_current_user_optional
 from beanie import PydanticObjectId
 from core.preprocessing import preprocess_text
-from core.grammar_analysis import detect_grammar_errors, correct_grammar, rephrase_sentence
-from core.lexical_semantic import calculate_lexical_diversity, suggest_synonyms, extract_keywords, analyze_semantic_coherence
+from core.grammar_analysis import correct_grammar, rephrase_sentence
+from core.lexical_semantic import calculate_lexical_diversity, suggest_synonyms_batch, extract_keywords, analyze_semantic_coherence
 from core.readability import calculate_readability
 from core.tone_style import analyze_tone_and_style
 from core.proficiency_model import predict_proficiency
 from core.summarizer_qg import summarize_text, generate_questions
 from core.explainable_ai import explain_correction, explain_proficiency_prediction
+from core.executor import run_blocking
+from core.response_cache import cached_endpoint
+from core.request_batcher import grammar_batcher
+from core.streaming import ndjson_response
+from config import settings
 
 router = APIRouter(prefix="/analyze", tags=["analyze"])
+logger = logging.getLogger(__name__)
 
 class AnalyzeRequest(BaseModel):
-    text: str
+    text: str = Field(..., max_length=settings.MAX_ANALYZE_LENGTH)
     user_id: Optional[int] = None
 
-@router.post("/")
-async def analyze_text(request: AnalyzeRequest, current_user: Optional[User] = Depends(get_current_user_optional)):
-    """
-    Comprehensive text analysis endpoint.
-    Performs grammar, vocabulary, readability, tone, and proficiency analysis.
-    """
-    try:
-        if not request.text or len(request.text.strip()) < 10:
-            raise HTTPException(status_code=400, detail="Text must be at least 10 characters long")
-    except HTTPException:
-        raise
-    except Exception as e:
-        print(f"Error in analyze_text (initial check): {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Analysis error: {str(e)}")
-    
+class TextRequest(BaseModel):
+    """Body for /summarize and /questions, which are meant for longer input than /analyze."""
+    text: str = Field(..., max_length=settings.MAX_TEXT_LENGTH)
+    user_id: Optional[int] = None
+
+# Below these word counts the stage's answer is known without running it
+MIN_REPHRASE_WORDS = 5
+MIN_COHERENCE_WORDS = 20
+
+_SHORT_TEXT_COHERENCE = {
+    "coherence_score": 0.5,
+    "topic_consistency": "low",
+    "analysis": "Not enough text for coherence analysis"
+}
+
+def _unchanged_rephrasing(text: str) -> Dict:
+    return {
+        "original": text,
+        "rephrased": text,
+        "suggestions": []
+    }
+
+def _keywords_with_synonyms(text: str) -> Tuple[List[Dict], List[List[Dict]]]:
+    """Extract keywords and synonym suggestions for the top three, in one executor call."""
+    keywords = extract_keywords(text, top_n=10)
+    return keywords, suggest_synonyms_batch([word["word"] for word in keywords[:3]], text)
+
+async def _resolved(value):
+    """Stand-in for a skipped stage in the analysis gather."""
+    return value
+
+def _first_exception(*results):
+    """Return the first exception among gathered stage results, or None."""
+    return next((r for r in results if isinstance(r, Exception)), None)
+
+async def _save_analysis(user_id: str, text: str, result: Dict):
+    """Log the feedback and update today's progress for an authenticated user."""
     try:
+        oid = PydanticObjectId(user_id)
+        now = datetime.utcnow()
+        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
         
-        text = request.text.strip()
-        user_id = str(current_user.id) if current_user else None
+        # Save feedback log
+        feedback_log = FeedbackLog(
+            user_id=oid,
+            text=text,
+            corrections=result["grammar"]["errors"],
+            suggestions=result["vocabulary"]["keywords"]
+        )
+        await feedback_log.insert()
         
-        # Preprocessing
-        try:
-            preprocessed = preprocess_text(text)
-        except Exception as e:
-            print(f"Error in preprocessing: {e}")
-            import traceback
-            traceback.print_exc()
-            raise HTTPException(status_code=500, detail=f"Preprocessing error: {str(e)}")
-        
-        # Grammar Analysis (with AI enhancement)
-        try:
-            grammar_errors = detect_grammar_errors(text)
-            grammar_correction = correct_grammar(text, use_ai=True)  # Enable AI for grammar correction
-        except Exception as e:
-            print(f"Error in grammar analysis: {e}")
-            import traceback
-            traceback.print_exc()
-            # Use fallback values
-            grammar_errors = []
-            grammar_correction = {"original": text, "corrected": text, "changes": [], "errors_found": 0}
-        
-        # Rephrasing suggestions (with AI enhancement)
-        try:
-            rephrasing = rephrase_sentence(text, style="clear", use_ai=True)  # Enable AI for rephrasing
-        except Exception as e:
-            print(f"Error in rephrasing: {e}")
-            rephrasing = {
-                "original": text,
-                "rephrased": text,
-                "suggestions": []
-            }
-        
-        # Lexical & Semantic Analysis
-        try:
-            lexical_metrics = calculate_lexical_diversity(preprocessed.get("tokens", []))
-            keywords = extract_keywords(text, top_n=10)
-            coherence = analyze_semantic_coherence(text)
-        except Exception as e:
-            print(f"Error in lexical analysis: {e}")
-            lexical_metrics = {"ttr": 0.5, "unique_words": 0, "total_words": 0}
-            keywords = []
-            coherence = {"coherence_score": 0.5, "topic_consistency": "medium"}
-        
-        # Readability Analysis
-        try:
-            readability = calculate_readability(text)
-        except Exception as e:
-            print(f"Error in readability analysis: {e}")
-            readability = {
-                "flesch_reading_ease": 50.0,
-                "flesch_kincaid_grade": 8.0,
-                "avg_sentence_length": 10.0
-            }
-        
-        # Tone & Style Analysis
-        try:
-            tone_style = analyze_tone_and_style(text)
-        except Exception as e:
-            print(f"Error in tone analysis: {e}")
-            tone_style = {
-                "tone": "neutral",
-                "sentiment": {"polarity": 0.0, "subjectivity": 0.5}
-            }
-        
-        # Proficiency Prediction
-        try:
-            proficiency_features = {
-                "grammar_errors": len(grammar_errors),
-                "flesch_reading_ease": readability.get("flesch_reading_ease", 50.0),
-                "ttr": lexical_metrics.get("ttr", 0.5),
-                "avg_sentence_length": readability.get("avg_sentence_length", 10.0),
-                "word_count": preprocessed.get("word_count", len(text.split()))
-            }
-            proficiency = predict_proficiency(proficiency_features)
-            proficiency_explanation = explain_proficiency_prediction(proficiency, proficiency_features)
-        except Exception as e:
-            print(f"Error in proficiency prediction: {e}")
-            proficiency = {"cefr_level": "B1", "confidence": 0.5}
-            proficiency_explanation = "Unable to predict proficiency level."
+        # Update today's progress, or create it, in one round-trip
+        await Progress.get_motor_collection().update_one(
+            {"user_id": oid, "date": {"$gte": today_start}},
+            {
+                "$set": {
+                    "grammar_errors": result["grammar"]["error_count"],
+                    "readability": result["readability"]["flesch_reading_ease"],
+                    "sentiment": result["tone_style"]["sentiment"]["polarity"],
+                    "cefr_level": result["proficiency"]["cefr_level"],
+                    "lexical_diversity": result["vocabulary"]["lexical_diversity"]["ttr"]
+                },
+                "$setOnInsert": {"date": now}
+            },
+            upsert=True
+        )
+    except Exception:
+        logger.exception("Error saving to database")
+
+# Response sections in the order /analyze returns them
+_RESPONSE_SECTIONS = (
+    "grammar", "rephrasing", "vocabulary", "readability",
+    "tone_style", "proficiency", "coherence", "preprocessing"
+)
+
+async def _grammar_section(text: str, grammar_errors: List[Dict], grammar_correction: Dict) -> Dict:
+    """Build the grammar section, explaining the top errors concurrently."""
+    # Generate corrections with explanations
+    top_errors = grammar_errors[:10]  # Limit to top 10 errors
+    error_cases = []
+    for error in top_errors:
+        # Safely get error text
+        error_text = ""
+        if "start" in error and "end" in error:
+            start = error.get("start", 0)
+            end = error.get("end", len(text))
+            if start < len(text) and end <= len(text):
+                error_text = text[start:end]
+        elif "text" in error:
+            error_text = error["text"]
+        elif "sentence" in error:
+            error_text = error["sentence"]
         
-        # Generate corrections with explanations
-        corrections_with_explanations = []
-        for error in grammar_errors[:10]:  # Limit to top 10 errors
-            # Safely get error text
-            error_text = ""
-            if "start" in error and "end" in error:
-                start = error.get("start", 0)
-                end = error.get("end", len(text))
-                if start < len(text) and end <= len(text):
-                    error_text = text[start:end]
-            elif "text" in error:
-                error_text = error["text"]
-            elif "sentence" in error:
-                error_text = error["sentence"]
+        # Use correction from error if available, otherwise use error_text
+        correction_text = error.get("correction", error_text)
+        error_type = error.get("type", "general")
+        error_cases.append((error_text, correction_text, error_type))
+    
+    # Explanations are independent of each other, so fetch them all at once
+    explanations = await asyncio.gather(
+        *(run_blocking(explain_correction, *case) for case in error_cases),
+        return_exceptions=True,
+    )
+    
+    corrections_with_explanations = [None] * len(top_errors)
+    for i, (error, (_, correction_text, error_type), explanation) in enumerate(
+        zip(top_errors, error_cases, explanations)
+    ):
+        corrected = error.copy()
+        if isinstance(explanation, Exception):
+            # Fallback if explanation fails
+            corrected["explanation"] = f"Error type: {error_type}"
+            corrected["rule"] = "Grammar rule"
+        else:
+            corrected["explanation"] = explanation.get("explanation", "")
+            corrected["rule"] = explanation.get("rule", "")
+        corrected["suggested_correction"] = correction_text if "correction" in error else None
+        corrections_with_explanations[i] = corrected
+    
+    return {
+        "errors": corrections_with_explanations,
+        "error_count": len(grammar_errors),
+        "corrected_text": grammar_correction["corrected"],
+        "changes": grammar_correction["changes"],
+        "errors_found": grammar_correction.get("errors_found", 0)
+    }
+
+async def _analysis_events(text: str) -> AsyncIterator[Dict]:
+    """
+    Run the analysis pipeline for text, yielding each response section as
+    soon as the stages it depends on have finished.
+    
+    Yields `section` events ({"type": "section", "name": ..., "data": ...})
+    in completion order, then a `result` event with the full response.
+    """
+    word_count = len(text.split())
+    
+    # Every stage below depends only on the raw text, so they all start at
+    # once and the pipeline takes about as long as the slowest one
+    stages = {
+        "preprocessed": run_blocking(preprocess_text, text),
+        "grammar_errors": grammar_batcher.submit(text),
+        "grammar_correction": run_blocking(correct_grammar, text, use_ai=True),  # Enable AI for grammar correction
+        # Enable AI for rephrasing; a few words leave nothing to rephrase
+        "rephrasing": run_blocking(rephrase_sentence, text, style="clear", use_ai=True)
+        if word_count >= MIN_REPHRASE_WORDS else _resolved(_unchanged_rephrasing(text)),
+        "keywords": run_blocking(_keywords_with_synonyms, text),
+        "coherence": run_blocking(analyze_semantic_coherence, text)
+        if word_count >= MIN_COHERENCE_WORDS else _resolved(dict(_SHORT_TEXT_COHERENCE)),
+        "readability": run_blocking(calculate_readability, text),
+        "tone_style": run_blocking(analyze_tone_and_style, text),
+    }
+    tasks = {asyncio.ensure_future(coro): name for name, coro in stages.items()}
+    results: Dict[str, Any] = {}
+    response: Dict[str, Any] = {}
+    
+    def ready(section: str, *stage_names: str) -> bool:
+        return section not in response and all(name in results for name in stage_names)
+    
+    def section_event(section: str) -> Dict:
+        return {"type": "section", "name": section, "data": response[section]}
+    
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                results[tasks[task]] = task.exception() or task.result()
             
-            # Use correction from error if available, otherwise use error_text
-            correction_text = error.get("correction", error_text)
-            error_type = error.get("type", "general")
+            # Preprocessing
+            if ready("preprocessing", "preprocessed"):
+                preprocessed = results["preprocessed"]
+                if isinstance(preprocessed, Exception):
+                    logger.error("Error in preprocessing", exc_info=preprocessed)
+                    raise HTTPException(status_code=500, detail=f"Preprocessing error: {str(preprocessed)}")
+                response["preprocessing"] = {
+                    "word_count": preprocessed.get("word_count", 0),
+                    "sentence_count": preprocessed.get("sentence_count", 0),
+                    "entities": preprocessed.get("entities", [])[:5]
+                }
+                yield section_event("preprocessing")
             
-            try:
-                explanation = explain_correction(
-                    error_text,
-                    correction_text,
-                    error_type
-                )
-                corrections_with_explanations.append({
-                    **error,
-                    "explanation": explanation.get("explanation", ""),
-                    "rule": explanation.get("rule", ""),
-                    "suggested_correction": correction_text if "correction" in error else None
-                })
-            except Exception as e:
-                # Fallback if explanation fails
-                corrections_with_explanations.append({
-                    **error,
-                    "explanation": f"Error type: {error_type}",
-                    "rule": "Grammar rule",
-                    "suggested_correction": correction_text if "correction" in error else None
-                })
-        
-        # Save to database if user is authenticated
-        if user_id and current_user:
-            try:
-                # Save feedback log
-                feedback_log = FeedbackLog(
-                    user_id=PydanticObjectId(user_id),
-                    text=text,
-                    corrections=corrections_with_explanations,
-                    suggestions=keywords
+            # Grammar Analysis (with AI enhancement)
+            if ready("grammar", "grammar_errors", "grammar_correction"):
+                grammar_failure = _first_exception(results["grammar_errors"], results["grammar_correction"])
+                if grammar_failure is not None:
+                    logger.error("Error in grammar analysis", exc_info=grammar_failure)
+                    # Use fallback values
+                    results["grammar_errors"] = []
+                    results["grammar_correction"] = {"original": text, "corrected": text, "changes": [], "errors_found": 0}
+                response["grammar"] = await _grammar_section(
+                    text, results["grammar_errors"], results["grammar_correction"]
                 )
-                await feedback_log.insert()
-                
-                # Update or create progress
-                today = datetime.utcnow().date()
-                today_start = datetime.combine(today, datetime.min.time())
-                
-                progress = await Progress.find_one(
-                    Progress.user_id == PydanticObjectId(user_id),
-                    Progress.date >= today_start
-                )
-                
-                if not progress:
-                    progress = Progress(
-                        user_id=PydanticObjectId(user_id),
-                        grammar_errors=len(grammar_errors),
-                        readability=readability["flesch_reading_ease"],
-                        sentiment=tone_style["sentiment"]["polarity"],
-                        cefr_level=proficiency["cefr_level"],
-                        lexical_diversity=lexical_metrics["ttr"]
-                    )
-                    await progress.insert()
-                else:
-                    progress.grammar_errors = len(grammar_errors)
-                    progress.readability = readability["flesch_reading_ease"]
-                    progress.sentiment = tone_style["sentiment"]["polarity"]
-                    progress.cefr_level = proficiency["cefr_level"]
-                    progress.lexical_diversity = lexical_metrics["ttr"]
-                    await progress.save()
-            except Exception as e:
-                print(f"Error saving to database: {e}")
-                import traceback
-                traceback.print_exc()
-        
-        try:
-            return {
-            "grammar": {
-                "errors": corrections_with_explanations,
-                "error_count": len(grammar_errors),
-                "corrected_text": grammar_correction["corrected"],
-                "changes": grammar_correction["changes"],
-                "errors_found": grammar_correction.get("errors_found", 0)
-            },
-            "rephrasing": {
-                "original": rephrasing["original"],
-                "rephrased": rephrasing["rephrased"],
-                "suggestions": rephrasing["suggestions"]
-            },
-            "vocabulary": {
-                "lexical_diversity": lexical_metrics,
-                "keywords": keywords,
-                "suggestions": [suggest_synonyms(word["word"], text) for word in keywords[:3]]
-            },
-            "readability": readability,
-            "tone_style": tone_style,
-            "proficiency": {
-                **proficiency,
-                "explanation": proficiency_explanation
-            },
-            "coherence": coherence,
-            "preprocessing": {
-                "word_count": preprocessed.get("word_count", 0),
-                "sentence_count": preprocessed.get("sentence_count", 0),
-                "entities": preprocessed.get("entities", [])[:5]
-            }
-        }
-        except Exception as e:
-            print(f"Error building response: {e}")
-            import traceback
-            traceback.print_exc()
-            raise HTTPException(status_code=500, detail=f"Error building response: {str(e)}")
+                yield section_event("grammar")
+            
+            # Rephrasing suggestions (with AI enhancement)
+            if ready("rephrasing", "rephrasing"):
+                rephrasing = results["rephrasing"]
+                if isinstance(rephrasing, Exception):
+                    logger.warning("Error in rephrasing: %s", rephrasing)
+                    rephrasing = _unchanged_rephrasing(text)
+                response["rephrasing"] = {
+                    "original": rephrasing["original"],
+                    "rephrased": rephrasing["rephrased"],
+                    "suggestions": rephrasing["suggestions"]
+                }
+                yield section_event("rephrasing")
+            
+            # Lexical & Semantic Analysis
+            if "preprocessing" in response and ready("vocabulary", "keywords", "coherence"):
+                keywords_result, coherence = results["keywords"], results["coherence"]
+                lexical_failure = _first_exception(keywords_result, coherence)
+                if lexical_failure is None:
+                    keywords, synonyms = keywords_result
+                    try:
+                        lexical_metrics = calculate_lexical_diversity(results["preprocessed"].get("tokens", []))
+                    except Exception as e:
+                        lexical_failure = e
+                if lexical_failure is not None:
+                    logger.warning("Error in lexical analysis: %s", lexical_failure)
+                    lexical_metrics = {"ttr": 0.5, "unique_words": 0, "total_words": 0}
+                    keywords = []
+                    synonyms = []
+                    coherence = {"coherence_score": 0.5, "topic_consistency": "medium"}
+                response["vocabulary"] = {
+                    "lexical_diversity": lexical_metrics,
+                    "keywords": keywords,
+                    "suggestions": synonyms
+                }
+                response["coherence"] = coherence
+                yield section_event("vocabulary")
+                yield section_event("coherence")
+            
+            # Readability Analysis
+            if ready("readability", "readability"):
+                readability = results["readability"]
+                if isinstance(readability, Exception):
+                    logger.warning("Error in readability analysis: %s", readability)
+                    readability = {
+                        "flesch_reading_ease": 50.0,
+                        "flesch_kincaid_grade": 8.0,
+                        "avg_sentence_length": 10.0
+                    }
+                response["readability"] = readability
+                yield section_event("readability")
+            
+            # Tone & Style Analysis
+            if ready("tone_style", "tone_style"):
+                tone_style = results["tone_style"]
+                if isinstance(tone_style, Exception):
+                    logger.warning("Error in tone analysis: %s", tone_style)
+                    tone_style = {
+                        "tone": "neutral",
+                        "sentiment": {"polarity": 0.0, "subjectivity": 0.5}
+                    }
+                response["tone_style"] = tone_style
+                yield section_event("tone_style")
+            
+            # Proficiency Prediction, once its inputs are in
+            if "proficiency" not in response and all(
+                section in response for section in ("grammar", "readability", "vocabulary", "preprocessing")
+            ):
+                readability = response["readability"]
+                try:
+                    proficiency_features = {
+                        "grammar_errors": response["grammar"]["error_count"],
+                        "flesch_reading_ease": readability.get("flesch_reading_ease", 50.0),
+                        "ttr": response["vocabulary"]["lexical_diversity"].get("ttr", 0.5),
+                        "avg_sentence_length": readability.get("avg_sentence_length", 10.0),
+                        "word_count": results["preprocessed"].get("word_count", word_count)
+                    }
+                    # Rule-based scoring takes microseconds; a worker-thread hop would cost more
+                    proficiency = predict_proficiency(proficiency_features)
+                    proficiency_explanation = explain_proficiency_prediction(proficiency, proficiency_features)
+                except Exception as e:
+                    logger.warning("Error in proficiency prediction: %s", e)
+                    proficiency = {"cefr_level": "B1", "confidence": 0.5}
+                    proficiency_explanation = "Unable to predict proficiency level."
+                response["proficiency"] = {
+                    **proficiency,
+                    "explanation": proficiency_explanation
+                }
+                yield section_event("proficiency")
+    finally:
+        # Stop stages still running if the client went away or a stage failed hard
+        for task in tasks:
+            task.cancel()
+    
+    yield {"type": "result", "data": {section: response[section] for section in _RESPONSE_SECTIONS}}
+
+@cached_endpoint("analyze", key_fields=("text",))
+async def _analyze(text: str) -> Dict:
+    """
+    Run the full analysis pipeline for the (already stripped) text.
+    The result depends only on the text, so it is cached and shared
+    between users, keyed on the exact text the pipeline sees; per-user
+    persistence happens in the endpoint.
+    """
+    try:
+        result = None
+        async for event in _analysis_events(text):
+            if event["type"] == "result":
+                result = event["data"]
+        return result
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Unexpected error in analyze_text: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Unexpected error in analyze_text")
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
+def _check_text_length(request: AnalyzeRequest):
+    if not request.text or len(request.text.strip()) < 10:
+        raise HTTPException(status_code=400, detail="Text must be at least 10 characters long")
+
+@router.post("/")
+async def analyze_text(
+    request: AnalyzeRequest,
+    background_tasks: BackgroundTasks,
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """
+    Comprehensive text analysis endpoint.
+    Performs grammar, vocabulary, readability, tone, and proficiency analysis.
+    """
+    _check_text_length(request)
+    
+    text = request.text.strip()
+    result = await _analyze(text=text)
+    
+    # Save to database if user is authenticated, after the response is sent
+    if current_user:
+        background_tasks.add_task(_save_analysis, str(current_user.id), text, result)
+    
+    return result
+
+@router.post("/stream")
+async def analyze_text_stream(
+    request: AnalyzeRequest,
+    background_tasks: BackgroundTasks,
+    current_user: Optional[User] = Depends(get_current_user_optional)
+):
+    """
+    Stream the comprehensive analysis as NDJSON.
+    Emits a `section` event for each part of the /analyze response as soon as
+    it is ready, then a `result` event with the complete response.
+    """
+    _check_text_length(request)
+    text = request.text.strip()
+    
+    async def events():
+        async for event in _analysis_events(text):
+            if event["type"] == "result" and current_user:
+                # Runs once the stream has been fully sent
+                background_tasks.add_task(_save_analysis, str(current_user.id), text, event["data"])
+            yield event
+    
+    return ndjson_response(events())
+
 @router.post("/summarize")
-async def summarize(request: AnalyzeRequest):
+@cached_endpoint("summarize", key_fields=("text",))
+async def summarize(request: TextRequest):
     """Summarize text endpoint."""
     if not request.text:
         raise HTTPException(status_code=400, detail="Text is required")
     
-    summary = summarize_text(request.text)
+    summary = await run_blocking(summarize_text, request.text)
     return summary
 
 @router.post("/questions")
-async def generate_quiz(request: AnalyzeRequest):
+@cached_endpoint("questions", key_fields=("text",))
+async def generate_quiz(request: TextRequest):
     """Generate comprehension questions from text."""
     if not request.text:
         raise HTTPException(status_code=400, detail="Text is required")
     
-    questions = generate_questions(request.text, num_questions=5)
+    questions = await run_blocking(generate_questions, request.text, num_questions=5)
     return {"questions": questions}
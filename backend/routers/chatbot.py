@@ -1,3 +1,4 @@
+import logging
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from typing import Optional, List, Dict
@@ -5,8 +6,11 @@ from beanie import PydanticObjectId
 from models.user_model import User
 from core.auth import get_current_user_optional
 from core.intelligent_chatbot import generate_intelligent_response, analyze_query_intent
+from core.executor import run_blocking
+from core.response_cache import cached_endpoint
 
 router = APIRouter(prefix="/chatbot", tags=["chatbot"])
+logger = logging.getLogger(__name__)
 
 class ChatRequest(BaseModel):
     query: str
@@ -17,6 +21,14 @@ class ChatResponse(BaseModel):
     suggestions: Optional[List[str]] = None
     type: Optional[str] = None
 
+@cached_endpoint("chatbot-ask", key_fields=("query",))
+async def _context_free_response(query: str) -> Dict:
+    """
+    Answer a query that has no conversation context. The answer depends
+    only on the query, so repeated questions are served from the cache.
+    """
+    return await run_blocking(generate_intelligent_response, query=query, context=None)
+
 @router.post("/ask", response_model=ChatResponse)
 async def chat_with_bot(
     request: ChatRequest,
@@ -31,10 +43,15 @@ async def chat_with_bot(
             raise HTTPException(status_code=400, detail="Query cannot be empty")
         
         # Generate intelligent response
-        result = generate_intelligent_response(
-            query=request.query.strip(),
-            context=request.context
-        )
+        query = request.query.strip()
+        if request.context:
+            result = await run_blocking(
+                generate_intelligent_response,
+                query=query,
+                context=request.context
+            )
+        else:
+            result = await _context_free_response(query=query)
         
         return ChatResponse(
             response=result.get("response", "I'm here to help!"),
@@ -42,7 +59,5 @@ async def chat_with_bot(
             type=result.get("type", "general")
         )
     except Exception as e:
-        print(f"Chatbot error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Chatbot error")
         raise HTTPException(status_code=500, detail=f"Error processing chat request: {str(e)}")
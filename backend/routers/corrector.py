@@ -2,39 +2,72 @@
 Grammar Correction and Rephrasing Router.
 Provides Grammarly++ style grammar correction with explanations and variants.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+import logging
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from core.grammar_corrector import correct_text
 from core.rephraser import rephrase_text
 from core.explanation_engine import explain_correction
 from core.adaptive_feedback import generate_feedback, get_personalized_lesson
+from core.executor import run_blocking
 from models.grammar_log_model import GrammarLog
 from models.user_model import User
 from core.auth import get_current_user_optional
 from beanie import PydanticObjectId
 
 router = APIRouter(prefix="/grammar", tags=["Grammar Correction"])
+logger = logging.getLogger(__name__)
 
 class TextInput(BaseModel):
     text: str = Field(..., min_length=1, max_length=1000, description="Text to correct")
     style: Optional[str] = Field(None, description="Rephrasing style: formal, concise, fluent, casual")
     num_variants: int = Field(3, ge=1, le=5, description="Number of rephrased variants")
 
+class RephrasedVariant(BaseModel):
+    text: str
+    style: Optional[str] = None
+    rank: Optional[int] = None
+
 class GrammarCorrectionResponse(BaseModel):
     original: str
     corrected: str
-    rephrased_variants: List[Dict]
-    explanations: Dict
-    adaptive_feedback: Dict
+    rephrased_variants: List[RephrasedVariant]
+    explanations: Dict[str, Any]
+    adaptive_feedback: Dict[str, Any]
     correction_method: str
     error_count: int
 
+async def _log_correction(
+    user_id: str,
+    original_text: str,
+    corrected_text: str,
+    error_types: List[str],
+    error_count: int,
+    correction_method: str,
+    explanations: List[Dict]
+):
+    """Store a GrammarLog entry; failures are logged, never raised."""
+    try:
+        grammar_log = GrammarLog(
+            user_id=PydanticObjectId(user_id),
+            original_text=original_text,
+            corrected_text=corrected_text,
+            error_types=error_types,
+            error_count=error_count,
+            correction_method=correction_method,
+            explanations=explanations
+        )
+        await grammar_log.insert()
+    except Exception as e:
+        logger.warning("Error logging grammar correction: %s", e)
+
 @router.post("/correct", response_model=GrammarCorrectionResponse)
 async def grammar_correction(
     data: TextInput,
+    background_tasks: BackgroundTasks,
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """
@@ -65,19 +98,21 @@ async def grammar_correction(
         original_text = data.text.strip()
         
         # Step 1: Correct grammar
-        correction_result = correct_text(original_text, use_model=True)
+        correction_result = await run_blocking(correct_text, original_text, use_model=True)
         corrected_text = correction_result.get("corrected", original_text)
         correction_method = correction_result.get("method", "none")
         
         # Step 2: Generate rephrased variants
-        rephrased_variants = rephrase_text(
+        rephrased_variants = await run_blocking(
+            rephrase_text,
             corrected_text,
             num_variants=data.num_variants,
             style=data.style
         )
         
         # Step 3: Generate explanations
-        explanations = explain_correction(
+        explanations = await run_blocking(
+            explain_correction,
             original_text,
             corrected_text,
             detailed=True
@@ -87,7 +122,8 @@ async def grammar_correction(
         user_id = str(current_user.id) if current_user else None
         error_history = None  # Could fetch from database if needed
         
-        adaptive_feedback = generate_feedback(
+        adaptive_feedback = await run_blocking(
+            generate_feedback,
             user_id=user_id,
             explanations=explanations.get("explanations", []),
             error_history=error_history
@@ -102,21 +138,18 @@ async def grammar_correction(
         
         error_count = len(explanations.get("errors", []))
         
-        # Step 6: Log correction (if user is authenticated)
+        # Step 6: Log correction (if user is authenticated), after the response is sent
         if current_user:
-            try:
-                grammar_log = GrammarLog(
-                    user_id=PydanticObjectId(user_id),
-                    original_text=original_text,
-                    corrected_text=corrected_text,
-                    error_types=error_types,
-                    error_count=error_count,
-                    correction_method=correction_method,
-                    explanations=explanations.get("explanations", [])
-                )
-                await grammar_log.insert()
-            except Exception as e:
-                print(f"Error logging grammar correction: {e}")
+            background_tasks.add_task(
+                _log_correction,
+                user_id,
+                original_text,
+                corrected_text,
+                error_types,
+                error_count,
+                correction_method,
+                explanations.get("explanations", [])
+            )
         
         return {
             "original": original_text,
@@ -131,16 +164,14 @@ async def grammar_correction(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Grammar correction error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Grammar correction error")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Grammar correction failed: {str(e)}"
         )
 
 @router.get("/lesson/{error_type}")
-async def get_lesson(
+def get_lesson(
     error_type: str,
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
@@ -188,7 +219,7 @@ async def get_correction_history(
             "total": len(logs)
         }
     except Exception as e:
-        print(f"Error fetching history: {e}")
+        logger.warning("Error fetching history: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch correction history"
@@ -2,12 +2,14 @@
 Evaluation Metrics Router
 Endpoints for comprehensive evaluation and analytics.
 """
+import logging
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from typing import Optional, List, Dict
 from beanie import PydanticObjectId
 from models.user_model import User
 from core.auth import get_current_user_optional, get_current_user
+from core.response_cache import cached_endpoint, metrics_cache
 from core.evaluation_metrics import (
     calculate_grammar_correction_accuracy,
     calculate_rephrasing_quality,
@@ -17,10 +19,16 @@ from core.evaluation_metrics import (
     calculate_system_performance_metrics,
     calculate_feature_usage_metrics,
     calculate_quality_metrics,
-    generate_comprehensive_evaluation_report
+    generate_comprehensive_evaluation_report,
+    gather_evaluation_metrics
 )
 
 router = APIRouter(prefix="/evaluation", tags=["Evaluation Metrics"])
+logger = logging.getLogger(__name__)
+
+# Dashboards poll these aggregate metrics; serve repeats from the metrics cache
+def _cached_metrics(name: str, key_fields=("user_id", "days")):
+    return cached_endpoint(name, key_fields=key_fields, cache=metrics_cache, refresh_field="refresh")
 
 # Request Models
 class GrammarAccuracyRequest(BaseModel):
@@ -55,9 +63,7 @@ async def grammar_accuracy_metrics(
         )
         return result
     except Exception as e:
-        print(f"Error calculating grammar accuracy: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error calculating grammar accuracy")
         raise HTTPException(status_code=500, detail=f"Calculation failed: {str(e)}")
 
 @router.post("/rephrasing-quality")
@@ -76,9 +82,7 @@ async def rephrasing_quality_metrics(
         )
         return result
     except Exception as e:
-        print(f"Error calculating rephrasing quality: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error calculating rephrasing quality")
         raise HTTPException(status_code=500, detail=f"Calculation failed: {str(e)}")
 
 @router.post("/ai-quality")
@@ -97,9 +101,7 @@ async def ai_quality_metrics(
         )
         return result
     except Exception as e:
-        print(f"Error calculating AI quality: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error calculating AI quality")
         raise HTTPException(status_code=500, detail=f"Calculation failed: {str(e)}")
 
 @router.get("/learning-effectiveness")
@@ -115,9 +117,7 @@ async def learning_effectiveness_metrics(
         result = await calculate_learning_effectiveness(user_id)
         return result
     except Exception as e:
-        print(f"Error calculating learning effectiveness: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error calculating learning effectiveness")
         raise HTTPException(status_code=500, detail=f"Calculation failed: {str(e)}")
 
 @router.get("/progress-trends")
@@ -134,42 +134,46 @@ async def progress_trends(
         result = await calculate_user_progress_trends(user_id, days)
         return result
     except Exception as e:
-        print(f"Error calculating progress trends: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error calculating progress trends")
         raise HTTPException(status_code=500, detail=f"Calculation failed: {str(e)}")
 
+@_cached_metrics("evaluation-system-performance", key_fields=())
+async def _system_performance(refresh: bool = False) -> Dict:
+    return await calculate_system_performance_metrics()
+
 @router.get("/system-performance")
 async def system_performance_metrics(
+    refresh: bool = Query(False, description="Bypass the metrics cache"),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """
     Calculate overall system performance metrics.
     """
     try:
-        result = await calculate_system_performance_metrics()
+        result = await _system_performance(refresh=refresh)
         return result
     except Exception as e:
-        print(f"Error calculating system performance: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error calculating system performance")
         raise HTTPException(status_code=500, detail=f"Calculation failed: {str(e)}")
 
+@_cached_metrics("evaluation-feature-usage", key_fields=("days",))
+async def _feature_usage(days: int, refresh: bool = False) -> Dict:
+    return await calculate_feature_usage_metrics(days)
+
 @router.get("/feature-usage")
 async def feature_usage_metrics(
     days: int = Query(30, ge=1, le=365),
+    refresh: bool = Query(False, description="Bypass the metrics cache"),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """
     Calculate feature usage metrics.
     """
     try:
-        result = await calculate_feature_usage_metrics(days)
+        result = await _feature_usage(days=days, refresh=refresh)
         return result
     except Exception as e:
-        print(f"Error calculating feature usage: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error calculating feature usage")
         raise HTTPException(status_code=500, detail=f"Calculation failed: {str(e)}")
 
 @router.get("/quality")
@@ -185,14 +189,17 @@ async def quality_metrics(
         result = await calculate_quality_metrics(user_id)
         return result
     except Exception as e:
-        print(f"Error calculating quality metrics: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error calculating quality metrics")
         raise HTTPException(status_code=500, detail=f"Calculation failed: {str(e)}")
 
+@_cached_metrics("evaluation-report")
+async def _comprehensive_report(user_id: Optional[PydanticObjectId], days: int, refresh: bool = False) -> Dict:
+    return await generate_comprehensive_evaluation_report(user_id, days)
+
 @router.get("/comprehensive-report")
 async def comprehensive_evaluation_report(
     days: int = Query(30, ge=1, le=365),
+    refresh: bool = Query(False, description="Bypass the metrics cache"),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """
@@ -201,52 +208,48 @@ async def comprehensive_evaluation_report(
     """
     try:
         user_id = PydanticObjectId(current_user.id) if current_user else None
-        result = await generate_comprehensive_evaluation_report(user_id, days)
+        result = await _comprehensive_report(user_id=user_id, days=days, refresh=refresh)
         return result
     except Exception as e:
-        print(f"Error generating comprehensive report: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error generating comprehensive report")
         raise HTTPException(status_code=500, detail=f"Report generation failed: {str(e)}")
 
+@_cached_metrics("evaluation-dashboard")
+async def _dashboard(user_id: Optional[PydanticObjectId], days: int, refresh: bool = False) -> Dict:
+    """Collect every dashboard metric and the overall summary."""
+    learning, quality, system, features, trends = await gather_evaluation_metrics(user_id, days)
+    
+    return {
+        "learning_effectiveness": learning,
+        "quality_metrics": quality,
+        "system_performance": system,
+        "feature_usage": features,
+        "progress_trends": trends,
+        "summary": {
+            "overall_score": round(
+                (learning.get("error_reduction_rate", 0) * 0.3 +
+                 quality.get("quality_score", 0) * 0.3 +
+                 system.get("engagement_rate", 0) * 0.2 +
+                 (trends.get("improvement_rate", 0) if trends else 50) * 0.2),
+                2
+            ),
+            "status": "excellent" if learning.get("error_reduction_rate", 0) > 20 else "good"
+        }
+    }
+
 @router.get("/dashboard")
 async def evaluation_dashboard(
     days: int = Query(30, ge=1, le=365),
+    refresh: bool = Query(False, description="Bypass the metrics cache"),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """
     Get all evaluation metrics for dashboard visualization.
+    Results are cached for METRICS_CACHE_TTL seconds; pass refresh=true to recompute.
     """
     try:
         user_id = PydanticObjectId(current_user.id) if current_user else None
-        
-        # Get all metrics
-        learning = await calculate_learning_effectiveness(user_id)
-        quality = await calculate_quality_metrics(user_id)
-        system = await calculate_system_performance_metrics()
-        features = await calculate_feature_usage_metrics(days)
-        trends = await calculate_user_progress_trends(user_id, days) if user_id else {}
-        
-        return {
-            "learning_effectiveness": learning,
-            "quality_metrics": quality,
-            "system_performance": system,
-            "feature_usage": features,
-            "progress_trends": trends,
-            "summary": {
-                "overall_score": round(
-                    (learning.get("error_reduction_rate", 0) * 0.3 +
-                     quality.get("quality_score", 0) * 0.3 +
-                     system.get("engagement_rate", 0) * 0.2 +
-                     (trends.get("improvement_rate", 0) if trends else 50) * 0.2),
-                    2
-                ),
-                "status": "excellent" if learning.get("error_reduction_rate", 0) > 20 else "good"
-            }
-        }
+        return await _dashboard(user_id=user_id, days=days, refresh=refresh)
     except Exception as e:
-        print(f"Error generating dashboard metrics: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error generating dashboard metrics")
         raise HTTPException(status_code=500, detail=f"Dashboard generation failed: {str(e)}")
-
@@ -1,15 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException
+import bisect
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 from models.user_model import User
 from models.xp_model import XPBadge
 from core.auth import get_current_user
+from core.response_cache import ResponseCache, cached_endpoint
+from config import settings
 
 router = APIRouter(prefix="/gamify", tags=["gamify"])
 
+# The leaderboard is polled often and may be a few seconds stale
+leaderboard_cache = ResponseCache(maxsize=32, ttl=settings.LEADERBOARD_CACHE_TTL)
+
 class XPUpdate(BaseModel):
     points: int
     reason: str
 
+class LeaderboardEntry(BaseModel):
+    username: str
+    xp_points: int = 0
+    cefr_level: str = "A1"
+
 BADGE_CRITERIA = {
     "Grammar Guru": {"xp_threshold": 100, "description": "Earned 100 XP from grammar improvements"},
     "Lexical Legend": {"xp_threshold": 200, "description": "Earned 200 XP from vocabulary expansion"},
@@ -19,6 +30,13 @@ BADGE_CRITERIA = {
     "CEFR Climber": {"xp_threshold": 300, "description": "Improved your CEFR level"}
 }
 
+# Badges as parallel tuples in ascending threshold order, so the badges
+# reachable with a given XP total are a prefix found by bisection
+_BADGE_NAMES, _BADGE_THRESHOLDS, _BADGE_DESCRIPTIONS = zip(*sorted(
+    ((name, criteria["xp_threshold"], criteria["description"]) for name, criteria in BADGE_CRITERIA.items()),
+    key=lambda badge: badge[1]
+))
+
 @router.post("/xp")
 async def update_xp(
     xp_data: XPUpdate,
@@ -32,23 +50,27 @@ async def update_xp(
     current_user.xp_points += xp_data.points
     await current_user.save()
     
-    # Check for new badges
-    new_badges = []
-    user_badges_list = await XPBadge.find(XPBadge.user_id == current_user.id).to_list()
-    user_badges = {badge.badge_name for badge in user_badges_list}
+    # Check for new badges among those the XP total reaches
+    reachable = bisect.bisect_right(_BADGE_THRESHOLDS, current_user.xp_points)
+    earned = []
+    if reachable:
+        # Only the names are needed; the (user_id, badge_name) index covers this
+        user_badges = set(await XPBadge.get_motor_collection().distinct(
+            "badge_name", {"user_id": current_user.id}, maxTimeMS=settings.MONGO_QUERY_TIMEOUT_MS
+        ))
+        earned = [i for i in range(reachable) if _BADGE_NAMES[i] not in user_badges]
+    
+    # Award all new badges in a single write
+    if earned:
+        await XPBadge.insert_many([
+            XPBadge(user_id=current_user.id, badge_name=_BADGE_NAMES[i])
+            for i in earned
+        ])
     
-    for badge_name, criteria in BADGE_CRITERIA.items():
-        if badge_name not in user_badges and current_user.xp_points >= criteria["xp_threshold"]:
-            # Award badge
-            new_badge = XPBadge(
-                user_id=current_user.id,
-                badge_name=badge_name
-            )
-            await new_badge.insert()
-            new_badges.append({
-                "name": badge_name,
-                "description": criteria["description"]
-            })
+    new_badges = [
+        {"name": _BADGE_NAMES[i], "description": _BADGE_DESCRIPTIONS[i]}
+        for i in earned
+    ]
     
     return {
         "xp_points": current_user.xp_points,
@@ -83,11 +105,15 @@ async def get_badges(
     }
 
 @router.get("/leaderboard")
+@cached_endpoint("leaderboard", key_fields=("limit",), cache=leaderboard_cache)
 async def get_leaderboard(
-    limit: int = 10
+    limit: int = Query(10, ge=1, le=100)
 ):
     """Get leaderboard of top users by XP."""
-    top_users = await User.find_all().sort(-User.xp_points).limit(limit).to_list()
+    # Walks the xp_points index and returns only the displayed fields
+    top_users = await User.find_all(
+        max_time_ms=settings.MONGO_QUERY_TIMEOUT_MS
+    ).sort(-User.xp_points).limit(limit).project(LeaderboardEntry).to_list()
     
     return {
         "leaderboard": [
@@ -2,10 +2,14 @@
 Model and Text Analytics Tools Evaluation Router
 Endpoints for evaluating NLP models and text analytics tools performance.
 """
+import asyncio
+import logging
 from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import Optional
+from typing import Dict, Optional
 from models.user_model import User
 from core.auth import get_current_user_optional
+from core.response_cache import cached_endpoint, metrics_cache
+from core.responses import FastJSONResponse
 from core.model_evaluation import (
     get_model_usage_stats,
     get_text_analytics_tools_stats,
@@ -14,6 +18,7 @@ from core.model_evaluation import (
 )
 
 router = APIRouter(prefix="/evaluation/models", tags=["Model Evaluation"])
+logger = logging.getLogger(__name__)
 
 @router.get("/usage")
 async def model_usage_statistics(
@@ -27,9 +32,7 @@ async def model_usage_statistics(
         result = await get_model_usage_stats(days)
         return result
     except Exception as e:
-        print(f"Error getting model usage stats: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error getting model usage stats")
         raise HTTPException(status_code=500, detail=f"Failed to get model usage stats: {str(e)}")
 
 @router.get("/tools")
@@ -44,9 +47,7 @@ async def text_analytics_tools_statistics(
         result = await get_text_analytics_tools_stats(days)
         return result
     except Exception as e:
-        print(f"Error getting tools stats: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error getting tools stats")
         raise HTTPException(status_code=500, detail=f"Failed to get tools stats: {str(e)}")
 
 @router.get("/comparison")
@@ -61,9 +62,7 @@ async def model_performance_comparison(
         result = await get_model_performance_comparison(days)
         return result
     except Exception as e:
-        print(f"Error comparing models: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error comparing models")
         raise HTTPException(status_code=500, detail=f"Failed to compare models: {str(e)}")
 
 @router.get("/efficiency")
@@ -78,41 +77,57 @@ async def tool_efficiency_metrics(
         result = await get_tool_efficiency_metrics(days)
         return result
     except Exception as e:
-        print(f"Error getting efficiency metrics: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error getting efficiency metrics")
         raise HTTPException(status_code=500, detail=f"Failed to get efficiency metrics: {str(e)}")
 
+@cached_endpoint("model-evaluation-dashboard", key_fields=("days",), cache=metrics_cache, refresh_field="refresh")
+async def _dashboard(days: int, refresh: bool = False) -> Dict:
+    """Collect every dashboard section and the overall summary."""
+    # The sections are independent: query them concurrently, and let a
+    # failing one show up empty instead of failing the whole dashboard
+    sections = await asyncio.gather(
+        get_model_usage_stats(days),
+        get_text_analytics_tools_stats(days),
+        get_model_performance_comparison(days),
+        get_tool_efficiency_metrics(days),
+        return_exceptions=True
+    )
+    names = ("model usage", "tools stats", "model comparison", "efficiency metrics")
+    for name, section in zip(names, sections):
+        if isinstance(section, Exception):
+            logger.error("Error getting %s for dashboard", name, exc_info=section)
+    model_usage, tools_stats, model_comparison, efficiency = (
+        {} if isinstance(section, Exception) else section for section in sections
+    )
+    
+    return {
+        "period_days": days,
+        "model_usage": model_usage,
+        "tools_statistics": tools_stats,
+        "model_comparison": model_comparison,
+        "efficiency_metrics": efficiency,
+        "summary": {
+            "total_models": model_usage.get("summary", {}).get("total_models", 0),
+            "total_tool_categories": tools_stats.get("summary", {}).get("total_tool_categories", 0),
+            "overall_success_rate": model_comparison.get("overall_performance", {}).get("average_success_rate", 0),
+            "average_efficiency": efficiency.get("summary", {}).get("average_efficiency", 0)
+        }
+    }
+
 @router.get("/dashboard")
 async def model_evaluation_dashboard(
     days: int = Query(30, ge=1, le=365),
+    refresh: bool = Query(False, description="Bypass the metrics cache"),
     current_user: Optional[User] = Depends(get_current_user_optional)
 ):
     """
     Get comprehensive model and tools evaluation dashboard.
+    Results are cached for METRICS_CACHE_TTL seconds; pass refresh=true to recompute.
     """
     try:
-        model_usage = await get_model_usage_stats(days)
-        tools_stats = await get_text_analytics_tools_stats(days)
-        model_comparison = await get_model_performance_comparison(days)
-        efficiency = await get_tool_efficiency_metrics(days)
-        
-        return {
-            "period_days": days,
-            "model_usage": model_usage,
-            "tools_statistics": tools_stats,
-            "model_comparison": model_comparison,
-            "efficiency_metrics": efficiency,
-            "summary": {
-                "total_models": model_usage.get("summary", {}).get("total_models", 0),
-                "total_tool_categories": tools_stats.get("summary", {}).get("total_tool_categories", 0),
-                "overall_success_rate": model_comparison.get("overall_performance", {}).get("average_success_rate", 0),
-                "average_efficiency": efficiency.get("summary", {}).get("average_efficiency", 0)
-            }
-        }
+        # JSON-native result: encode directly, without jsonable_encoder
+        return FastJSONResponse(await _dashboard(days=days, refresh=refresh))
     except Exception as e:
-        print(f"Error generating model dashboard: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error generating model dashboard")
         raise HTTPException(status_code=500, detail=f"Failed to generate dashboard: {str(e)}")
 
@@ -1,14 +1,35 @@
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException
 from typing import Optional
 from datetime import datetime, timedelta
 from models.user_model import User
 from models.progress_model import Progress
-from models.feedback_model import FeedbackLog
+from models.feedback_model import FeedbackLog, FeedbackCorrections
 from core.auth import get_current_user
+from core.responses import FastJSONResponse
 from core.error_mining import mine_common_errors
+from config import settings
 
 router = APIRouter(prefix="/progress", tags=["progress"])
 
+def _progress_pipeline(user_id, start_date: datetime) -> list:
+    """
+    Aggregation returning, in one document, the user's progress records since
+    start_date (only the charted fields, oldest first) and their error average.
+    """
+    return [
+        {"$match": {"user_id": user_id, "date": {"$gte": start_date}}},
+        {"$sort": {"date": 1}},
+        {"$facet": {
+            "records": [
+                {"$project": {"_id": 0, "date": 1, "grammar_errors": 1, "readability": 1, "sentiment": 1, "cefr_level": 1}}
+            ],
+            "stats": [
+                {"$group": {"_id": None, "avg_errors": {"$avg": "$grammar_errors"}}}
+            ]
+        }}
+    ]
+
 @router.get("/")
 async def get_user_progress(
     days: int = 30,
@@ -20,45 +41,43 @@ async def get_user_progress(
     if not current_user:
         raise HTTPException(status_code=401, detail="Authentication required")
     
-    # Get progress data for the last N days
+    # Get progress data for the last N days and the feedback logs for error
+    # mining; the queries are independent, so run them concurrently
     start_date = datetime.utcnow() - timedelta(days=days)
-    progress_records = await Progress.find(
-        Progress.user_id == current_user.id,
-        Progress.date >= start_date
-    ).sort(+Progress.date).to_list()
-    
-    # Get feedback logs for error mining
-    feedback_logs = await FeedbackLog.find(
-        FeedbackLog.user_id == current_user.id,
-        FeedbackLog.created_at >= start_date
-    ).to_list()
+    progress_facets, feedback_logs = await asyncio.gather(
+        Progress.aggregate(
+            _progress_pipeline(current_user.id, start_date),
+            maxTimeMS=settings.MONGO_QUERY_TIMEOUT_MS
+        ).to_list(),
+        FeedbackLog.find(
+            FeedbackLog.user_id == current_user.id,
+            FeedbackLog.created_at >= start_date,
+            max_time_ms=settings.MONGO_QUERY_TIMEOUT_MS
+        ).project(FeedbackCorrections).to_list()
+    )
     
-    # Format progress data for charts
-    grammar_trend = [
-        {
-            "date": record.date.isoformat() if record.date else None,
-            "errors": record.grammar_errors,
-            "cefr_level": record.cefr_level
-        }
-        for record in progress_records
-    ]
-    
-    readability_trend = [
-        {
-            "date": record.date.isoformat() if record.date else None,
-            "readability": record.readability,
-            "cefr_level": record.cefr_level
-        }
-        for record in progress_records
-    ]
+    progress_records = progress_facets[0]["records"] if progress_facets else []
+    stats = progress_facets[0]["stats"] if progress_facets else []
     
-    sentiment_trend = [
-        {
-            "date": record.date.isoformat() if record.date else None,
-            "sentiment": record.sentiment
-        }
-        for record in progress_records
-    ]
+    # Build the chart series and the half sums in a single pass over the records
+    grammar_trend = []
+    readability_trend = []
+    sentiment_trend = []
+    total_practices = len(progress_records)
+    mid = total_practices // 2
+    first_half_errors = 0
+    second_half_errors = 0
+    for i, record in enumerate(progress_records):
+        date = record["date"].isoformat() if record.get("date") else None
+        cefr_level = record.get("cefr_level", "A1")
+        errors = record.get("grammar_errors", 0)
+        grammar_trend.append({"date": date, "errors": errors, "cefr_level": cefr_level})
+        readability_trend.append({"date": date, "readability": record.get("readability", 0.0), "cefr_level": cefr_level})
+        sentiment_trend.append({"date": date, "sentiment": record.get("sentiment", 0.0)})
+        if i < mid:
+            first_half_errors += errors
+        else:
+            second_half_errors += errors
     
     # Error mining
     error_analysis = mine_common_errors([
@@ -69,11 +88,18 @@ async def get_user_progress(
     ])
     
     # Calculate statistics
-    total_practices = len(progress_records)
-    avg_errors = sum(r.grammar_errors for r in progress_records) / total_practices if total_practices > 0 else 0
-    current_level = progress_records[-1].cefr_level if progress_records else current_user.cefr_level
+    avg_errors = (stats[0]["avg_errors"] or 0) if stats else 0
+    current_level = progress_records[-1].get("cefr_level", "A1") if progress_records else current_user.cefr_level
+    improvement_rate = 0.0
+    if total_practices >= 2:
+        improvement_rate = _improvement_rate(
+            first_half_errors / mid,
+            second_half_errors / (total_practices - mid)
+        )
     
-    return {
+    # The body is already JSON-native, so skip FastAPI's jsonable_encoder walk
+    # over the trend arrays and encode it directly
+    return FastJSONResponse({
         "user": {
             "username": current_user.username,
             "current_cefr_level": current_level,
@@ -88,22 +114,13 @@ async def get_user_progress(
         "statistics": {
             "average_errors": round(avg_errors, 2),
             "total_practices": total_practices,
-            "improvement_rate": calculate_improvement_rate(progress_records)
+            "improvement_rate": improvement_rate
         },
         "error_analysis": error_analysis
-    }
+    })
 
-def calculate_improvement_rate(progress_records):
-    """Calculate improvement rate based on error reduction."""
-    if len(progress_records) < 2:
-        return 0.0
-    
-    first_half = progress_records[:len(progress_records)//2]
-    second_half = progress_records[len(progress_records)//2:]
-    
-    avg_first = sum(r.grammar_errors for r in first_half) / len(first_half) if first_half else 0
-    avg_second = sum(r.grammar_errors for r in second_half) / len(second_half) if second_half else 0
-    
+def _improvement_rate(avg_first: float, avg_second: float) -> float:
+    """Percentage drop in average errors from the first half to the second."""
     if avg_first == 0:
         return 100.0 if avg_second == 0 else 0.0
     
@@ -1,13 +1,19 @@
 from fastapi import APIRouter, Depends
+from pydantic import BaseModel
 from typing import Optional, List
+from beanie.operators import In
 from models.user_model import User
 from models.recommendation_model import Recommendation
-from models.feedback_model import FeedbackLog
+from models.feedback_model import FeedbackLog, FeedbackCorrections
 from core.auth import get_current_user_optional
 from core.recommender import get_recommendations
+from config import settings
 
 router = APIRouter(prefix="/recommend", tags=["recommend"])
 
+class _RecommendationTitle(BaseModel):
+    content_title: str
+
 @router.get("/")
 async def get_user_recommendations(
     current_user: Optional[User] = Depends(get_current_user_optional)
@@ -31,8 +37,9 @@ async def get_user_recommendations(
     
     # Get user's recent errors from feedback logs
     recent_logs = await FeedbackLog.find(
-        FeedbackLog.user_id == current_user.id
-    ).sort(-FeedbackLog.created_at).limit(10).to_list()
+        FeedbackLog.user_id == current_user.id,
+        max_time_ms=settings.MONGO_QUERY_TIMEOUT_MS
+    ).sort(-FeedbackLog.created_at).limit(10).project(FeedbackCorrections).to_list()
     
     error_types = []
     for log in recent_logs:
@@ -48,22 +55,30 @@ async def get_user_recommendations(
         error_types=error_types
     )
     
-    # Save recommendations to database
+    # Save recommendations the user does not have yet: one query for the
+    # existing titles, one write for the new ones
+    titles = [rec["content_title"] for rec in recommendations]
+    existing = await Recommendation.find(
+        Recommendation.user_id == current_user.id,
+        In(Recommendation.content_title, titles),
+        max_time_ms=settings.MONGO_QUERY_TIMEOUT_MS
+    ).project(_RecommendationTitle).to_list()
+    saved_titles = {rec.content_title for rec in existing}
+    
+    new_recs = []
     for rec in recommendations:
-        existing = await Recommendation.find_one(
-            Recommendation.user_id == current_user.id,
-            Recommendation.content_title == rec["content_title"]
-        )
-        
-        if not existing:
-            db_rec = Recommendation(
-                user_id=current_user.id,
-                content_title=rec["content_title"],
-                link=rec.get("link", ""),
-                difficulty=rec.get("difficulty", current_user.cefr_level),
-                content_type=rec.get("content_type", "article")
-            )
-            await db_rec.insert()
+        if rec["content_title"] in saved_titles:
+            continue
+        saved_titles.add(rec["content_title"])
+        new_recs.append(Recommendation(
+            user_id=current_user.id,
+            content_title=rec["content_title"],
+            link=rec.get("link", ""),
+            difficulty=rec.get("difficulty", current_user.cefr_level),
+            content_type=rec.get("content_type", "article")
+        ))
+    if new_recs:
+        await Recommendation.insert_many(new_recs)
     
     return {
         "recommendations": recommendations,
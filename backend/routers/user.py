@@ -1,11 +1,16 @@
+import logging
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, EmailStr
+from beanie.operators import Or
 from datetime import timedelta
 from models.user_model import User
-from core.auth import verify_password, get_password_hash, create_access_token, get_current_user
+from core.auth import averify_password, aget_password_hash, create_access_token, get_current_user
 from config import settings
 
 router = APIRouter(prefix="/user", tags=["user"])
+logger = logging.getLogger(__name__)
+
+ACCESS_TOKEN_EXPIRES = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
 class UserSignup(BaseModel):
     username: str
@@ -28,23 +33,18 @@ class Token(BaseModel):
 async def signup(user_data: UserSignup):
     """User registration endpoint."""
     try:
-        # Check if user already exists
-        existing_email = await User.find_one(User.email == user_data.email)
-        if existing_email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-        
-        existing_username = await User.find_one(User.username == user_data.username)
-        if existing_username:
+        # Check if user already exists (email or username, in one query)
+        existing = await User.find_one(
+            Or(User.email == user_data.email, User.username == user_data.username)
+        )
+        if existing:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already taken"
+                detail="Email already registered" if existing.email == user_data.email else "Username already taken"
             )
         
         # Create new user
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await aget_password_hash(user_data.password)
         new_user = User(
             username=user_data.username,
             email=user_data.email,
@@ -66,16 +66,15 @@ async def signup(user_data: UserSignup):
         if isinstance(e, HTTPException):
             raise
         # For other errors, log and return generic error
-        print(f"Signup error: {e}")
+        logger.exception("Signup error")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred during registration. Please try again."
         )
     
     # Create access token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": str(new_user.id)}, expires_delta=access_token_expires
+        data={"sub": str(new_user.id)}, expires_delta=ACCESS_TOKEN_EXPIRES
     )
     
     return {
@@ -93,7 +92,9 @@ async def login(user_data: UserLogin):
     try:
         user = await User.find_one(User.email == user_data.email)
         
-        if not user or not verify_password(user_data.password, user.password):
+        # Verify even when the user is missing so both cases take equally long
+        password_ok = await averify_password(user_data.password, user.password if user else None)
+        if not user or not password_ok:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password"
@@ -107,16 +108,15 @@ async def login(user_data: UserLogin):
             )
         if isinstance(e, HTTPException):
             raise
-        print(f"Login error: {e}")
+        logger.exception("Login error")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred during login. Please try again."
         )
     
     # Create access token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": str(user.id)}, expires_delta=access_token_expires
+        data={"sub": str(user.id)}, expires_delta=ACCESS_TOKEN_EXPIRES
     )
     
     return {
@@ -129,7 +129,7 @@ async def login(user_data: UserLogin):
     }
 
 @router.get("/me")
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+def get_current_user_info(current_user: User = Depends(get_current_user)):
     """Get current user information."""
     return {
         "id": str(current_user.id),
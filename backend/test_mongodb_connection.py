@@ -16,19 +16,22 @@ async def test_connection():
     print()
     
     try:
-        client = AsyncIOMotorClient(settings.DATABASE_URL, serverSelectionTimeoutMS=5000)
+        # timeoutMS bounds every operation, so a hung server cannot stall the check
+        client = AsyncIOMotorClient(settings.DATABASE_URL, serverSelectionTimeoutMS=5000, timeoutMS=5000)
         
         # Test connection
-        await client.admin.command('ping')
+        await client.admin.command('ping', maxTimeMS=3000)
         print("✅ MongoDB connection successful!")
         
-        # List databases
-        db_list = await client.list_database_names()
+        # List databases and our database's collections concurrently
+        db = client[settings.DATABASE_NAME]
+        db_list, collections = await asyncio.gather(
+            client.list_database_names(),
+            db.list_collection_names()
+        )
         print(f"✅ Available databases: {', '.join(db_list)}")
         
         # Check if our database exists
-        db = client[settings.DATABASE_NAME]
-        collections = await db.list_collection_names()
         print(f"✅ Database '{settings.DATABASE_NAME}' exists")
         if collections:
             print(f"   Collections: {', '.join(collections)}")
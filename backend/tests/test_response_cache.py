@@ -0,0 +1,57 @@
+"""
+Tests for the endpoint response cache.
+"""
+import asyncio
+import re
+
+from core.response_cache import ResponseCache, cached_endpoint
+
+_DOUBLE_SPACE = re.compile(r" {2,}")
+
+def _double_space_errors(text: str):
+    """Formatting errors with offsets, as /analyze reports them."""
+    return [
+        {"type": "double_space", "start": m.start(), "end": m.end()}
+        for m in _DOUBLE_SPACE.finditer(text)
+    ]
+
+def test_inner_spacing_variants_get_their_own_grammar_results():
+    cache = ResponseCache()
+    calls = []
+    
+    @cached_endpoint("analyze", key_fields=("text",), cache=cache)
+    async def analyze(text: str):
+        calls.append(text)
+        return {"grammar": {"errors": _double_space_errors(text)}}
+    
+    async def run():
+        return (
+            await analyze(text="Hello  world."),
+            await analyze(text="Hello world."),
+            await analyze(text="Hello  world."),
+        )
+    
+    spaced, single, spaced_again = asyncio.run(run())
+    
+    assert spaced["grammar"]["errors"] == [{"type": "double_space", "start": 5, "end": 7}]
+    assert single["grammar"]["errors"] == []
+    assert spaced_again == spaced
+    # Each variant was computed once; the repeat was a cache hit
+    assert calls == ["Hello  world.", "Hello world."]
+
+def test_normalize_whitespace_shares_entries_between_spacing_variants():
+    cache = ResponseCache()
+    calls = []
+    
+    @cached_endpoint("emotion", key_fields=("text",), cache=cache, normalize_whitespace=True)
+    async def emotion(text: str):
+        calls.append(text)
+        return {"emotion": "joy"}
+    
+    async def run():
+        await emotion(text="So  happy today!")
+        await emotion(text="So happy today!")
+    
+    asyncio.run(run())
+    
+    assert calls == ["So  happy today!"]
@@ -0,0 +1,32 @@
+"""
+Tests for coalescing concurrent calls.
+"""
+import asyncio
+
+from core.singleflight import SingleFlight
+
+def test_followers_recompute_when_leader_is_cancelled():
+    flight = SingleFlight()
+    runs = []
+    
+    async def work():
+        runs.append(len(runs))
+        await asyncio.sleep(0.01)
+        return "done"
+    
+    async def run():
+        leader = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(flight.do("key", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        return leader, results
+    
+    leader, results = asyncio.run(run())
+    
+    assert leader.cancelled()
+    assert results == ["done", "done", "done"]
+    # One run for the cancelled leader, one shared by the followers
+    assert runs == [0, 1]
+    assert flight.inflight() == 0
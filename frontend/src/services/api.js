@@ -50,16 +50,16 @@ export const getBadges = () => API.get("/gamify/badges");
 export const getLeaderboard = (limit = 10) => API.get(`/gamify/leaderboard?limit=${limit}`);
 
 // Advanced AI Features endpoints
-export const contextualCorrection = (data) => API.post("/advanced-ai/contextual-correction", data);
+export const contextualCorrection = (data) => API.post("/advanced-ai/contextual-correction/sync", data);
 export const coherenceAnalysis = (data) => API.post("/advanced-ai/coherence-analysis", data);
-export const toneTransfer = (data) => API.post("/advanced-ai/tone-transfer", data);
+export const toneTransfer = (data) => API.post("/advanced-ai/tone-transfer/sync", data);
 export const getAvailableTones = () => API.get("/advanced-ai/available-tones");
 export const detectTone = (data) => API.post("/advanced-ai/detect-tone", data);
 export const writingQualityScore = (data) => API.post("/advanced-ai/quality-score", data);
 export const emotionIntentAnalysis = (data) => API.post("/advanced-ai/emotion-intent", data);
 export const emotionAnalysis = (data) => API.post("/advanced-ai/emotion", data);
 export const intentAnalysis = (data) => API.post("/advanced-ai/intent", data);
-export const summarizeAndReview = (data) => API.post("/advanced-ai/summarize-review", data);
+export const summarizeAndReview = (data) => API.post("/advanced-ai/summarize-review/sync", data);
 export const getGrammarLessons = (data) => API.post("/advanced-ai/grammar-lessons", data);
 export const getGrammarTopics = () => API.get("/advanced-ai/grammar-topics");
 export const generateGrammarDrill = (data) => API.post("/advanced-ai/grammar-drill", data);